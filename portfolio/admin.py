@@ -1,8 +1,31 @@
 from django.contrib import admin
-from django.utils.html import format_html, mark_safe
+from django.contrib.auth.admin import GroupAdmin, UserAdmin
+from django.contrib.auth.models import Group, User
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponseNotAllowed, StreamingHttpResponse
+from django.shortcuts import redirect
+from django.urls import path, reverse
+from django.utils import timezone
+from django.utils.html import format_html, format_html_join, mark_safe
+from django.utils.timesince import timesince
 from django.db import models
+from django.db.models import (
+    BooleanField, Count, DateField, DurationField, Exists, ExpressionWrapper, F, OuterRef, Q, Subquery, Sum,
+    Value,
+)
+from django.db.models.functions import Coalesce, Concat, StrIndex, Substr, Trim
 from datetime import date
-from .models import About, Skill, Project, ProjectImage, Certificate, Experience, Education, ContactMessage
+from . import search
+from .changelist import EstimatedCountPaginator, KeysetChangeList
+from .duplication import duplicate_projects, duplicate_certificates
+from .export import ExportStream, export_queryset
+from .replica import refresh_snapshot
+from .publishing import draft_digest, publish
+from .resume import build_resume
+from .models import (
+    About, Skill, Project, ProjectImage, Certificate, Experience, Education, ContactMessage,
+    ExportWatermark, ReplicaSnapshot, PageViewCounter, GeneratedResume, PublishedSnapshot, Tenant,
+)
 
 
 class CustomModelForm(admin.ModelAdmin):
@@ -17,6 +40,101 @@ class CustomModelForm(admin.ModelAdmin):
     }
 
 
+class SuperuserOnlyMixin:
+    """For admins of data shared by every tenant, which tenant staff must not see"""
+    
+    def has_module_permission(self, request):
+        return request.user.is_superuser
+    
+    def has_view_permission(self, request, obj=None):
+        return request.user.is_superuser
+    
+    def has_add_permission(self, request):
+        return request.user.is_superuser
+    
+    def has_change_permission(self, request, obj=None):
+        return request.user.is_superuser
+    
+    def has_delete_permission(self, request, obj=None):
+        return request.user.is_superuser
+
+
+def is_changelist(request):
+    """True when the admin is rendering (or saving) a changelist page"""
+    match = request.resolver_match
+    return match is not None and (match.url_name or '').endswith('_changelist')
+
+
+def leading_items(field, count):
+    """
+    Expressions for the first ``count`` items of a comma-separated text
+    column, trimmed, so a changelist gets them from SQL instead of splitting
+    every row in Python. Past the last item they are ''.
+    """
+    rest = Concat(field, Value(','))
+    items = []
+    for _ in range(count):
+        comma = StrIndex(rest, Value(','))
+        items.append(Trim(Substr(rest, 1, comma - 1)))
+        rest = Substr(rest, comma + 1)
+    return items
+
+
+class FullTextSearchMixin:
+    """Answer the changelist search box from the FTS5 index instead of LIKE scans"""
+    search_kind = None
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip() or not search.search_available():
+            return super().get_search_results(request, queryset, search_term)
+        matches = search.matching_pks(self.search_kind, search_term)
+        if matches is None:
+            return queryset.none(), False
+        return queryset.filter(pk__in=matches), False
+
+
+# ==================== TENANT ADMIN ====================
+@admin.register(Tenant)
+class TenantAdmin(SuperuserOnlyMixin, admin.ModelAdmin):
+    """The portfolios this deployment serves; only superusers manage them"""
+    
+    list_display = ('slug', 'name', 'domain_link', 'is_active', 'member_count', 'created_at')
+    list_filter = ('is_active',)
+    search_fields = ('slug', 'name', 'domain')
+    filter_horizontal = ('members',)
+    readonly_fields = ('created_at',)
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(member_total=Count('members'))
+    
+    def domain_link(self, obj):
+        return format_html('<a href="//{}/" target="_blank">{}</a>', obj.domain, obj.domain)
+    domain_link.short_description = 'Domain'
+    domain_link.admin_order_field = 'domain'
+    
+    def member_count(self, obj):
+        return obj.member_total
+    member_count.short_description = 'Members'
+    member_count.admin_order_field = 'member_total'
+
+
+# ==================== USER ADMIN ====================
+# Accounts and groups span every portfolio, so tenant staff can't edit them;
+# a superuser adds staff to a portfolio through the tenant's members.
+admin.site.unregister(User)
+admin.site.unregister(Group)
+
+
+@admin.register(User)
+class PortfolioUserAdmin(SuperuserOnlyMixin, UserAdmin):
+    pass
+
+
+@admin.register(Group)
+class PortfolioGroupAdmin(SuperuserOnlyMixin, GroupAdmin):
+    pass
+
+
 # ==================== ABOUT ADMIN ====================
 @admin.register(About)
 class AboutAdmin(admin.ModelAdmin):
@@ -73,7 +191,7 @@ class AboutAdmin(admin.ModelAdmin):
     readonly_fields = ('created_at', 'updated_at')
     
     def has_add_permission(self, request):
-        """Prevent adding new About entries"""
+        """One About entry per portfolio"""
         return not About.objects.exists()
     
     def has_delete_permission(self, request, obj=None):
@@ -94,13 +212,14 @@ class AboutAdmin(admin.ModelAdmin):
 
 # ==================== SKILL ADMIN ====================
 @admin.register(Skill)
-class SkillAdmin(admin.ModelAdmin):
+class SkillAdmin(FullTextSearchMixin, admin.ModelAdmin):
     """Enhanced admin for Skills with proficiency visualization"""
     
     list_display = ('name', 'category_colored', 'proficiency_bar', 'proficiency', 'icon_preview', 'order')
     list_editable = ('order',)
     list_filter = ('category', 'proficiency')
     search_fields = ('name', 'icon')
+    search_kind = 'skill'
     ordering = ('order', 'name')
     
     fieldsets = (
@@ -210,14 +329,15 @@ class ProjectImageInline(admin.TabularInline):
 
 # ==================== PROJECT ADMIN ====================
 @admin.register(Project)
-class ProjectAdmin(CustomModelForm):
+class ProjectAdmin(FullTextSearchMixin, CustomModelForm):
     """Enhanced admin for Projects with featured status and tech tags"""
     
-    list_display = ('title', 'featured_badge', 'tech_preview', 'date_completed', 'order', 'has_links', 'image_count')
+    list_display = ('title', 'featured_badge', 'tech_preview', 'date_completed', 'order', 'has_links', 'image_count', 'view_count')
     inlines = [ProjectImageInline]
     list_editable = ('order',)
     list_filter = ('featured', 'status', 'category', 'date_completed')
     search_fields = ('title', 'description', 'technologies')
+    search_kind = 'project'
     date_hierarchy = 'date_completed'
     
     fieldsets = (
@@ -225,8 +345,8 @@ class ProjectAdmin(CustomModelForm):
             'fields': ('title', 'description', 'category', 'status', 'date_completed'),
         }),
         ('Project Image', {
-            'fields': ('image',),
-            'description': 'Upload an image for your project'
+            'fields': ('image', 'social_card_preview'),
+            'description': 'Upload an image for your project. The link preview card is generated from it on save.'
         }),
         ('Detailed Information', {
             'fields': ('detailed_description',),
@@ -247,6 +367,26 @@ class ProjectAdmin(CustomModelForm):
     )
     
     actions = ['mark_featured', 'unmark_featured', 'duplicate_project', 'delete_selected']
+    readonly_fields = ('social_card_preview',)
+    
+    def get_queryset(self, request):
+        """
+        Count gallery images and page views and pick out the first technologies
+        in the changelist query, and skip long text columns
+        """
+        queryset = super().get_queryset(request)
+        if is_changelist(request):
+            views = PageViewCounter.objects.filter(page='project_detail', object_id=OuterRef('pk'))
+            views = views.order_by().values('object_id').annotate(total=Sum('views')).values('total')
+            techs = leading_items('technologies', 3)
+            queryset = queryset.annotate(
+                image_total=Count('images'),
+                view_total=Coalesce(Subquery(views), 0),
+                tech_1=techs[0], tech_2=techs[1], tech_3=techs[2],
+            ).defer(
+                'description', 'detailed_description', 'technologies', 'key_achievements'
+            )
+        return queryset
     
     def has_delete_permission(self, request, obj=None):
         """Allow deleting projects"""
@@ -261,14 +401,14 @@ class ProjectAdmin(CustomModelForm):
     
     def tech_preview(self, obj):
         """Show first 3 technologies"""
-        techs = obj.get_technologies_list()[:3]
-        badges = ' '.join([
-            format_html('<span style="background: #0A84FF; color: white; '
-                       'padding: 2px 6px; border-radius: 3px; margin-right: 4px; '
-                       'font-size: 11px;">{}</span>', tech)
-            for tech in techs
-        ])
-        return format_html(badges)
+        techs = [tech for tech in (obj.tech_1, obj.tech_2, obj.tech_3) if tech]
+        return format_html_join(
+            ' ',
+            '<span style="background: #0A84FF; color: white; '
+            'padding: 2px 6px; border-radius: 3px; margin-right: 4px; '
+            'font-size: 11px;">{}</span>',
+            ((tech,) for tech in techs)
+        )
     tech_preview.short_description = 'Technologies'
     
     def has_links(self, obj):
@@ -281,9 +421,21 @@ class ProjectAdmin(CustomModelForm):
         return format_html(icons if icons else '—')
     has_links.short_description = 'Links'
     
+    def social_card_preview(self, obj):
+        """The Open Graph image shown in link previews (see social_cards.py)"""
+        if obj.social_card:
+            return format_html(
+                '<img src="{}" style="max-width: 300px; border-radius: 4px; border: 1px solid #ddd;"/>',
+                obj.social_card.url
+            )
+        return '-'
+    social_card_preview.short_description = 'Link preview'
+    
     def image_count(self, obj):
         """Show count of gallery images"""
-        count = obj.images.count()
+        count = getattr(obj, 'image_total', None)
+        if count is None:
+            count = obj.images.count()
         if count > 0:
             return format_html(
                 '<span style="background: #10B981; color: white; '
@@ -292,6 +444,18 @@ class ProjectAdmin(CustomModelForm):
             )
         return '—'
     image_count.short_description = 'Gallery'
+    image_count.admin_order_field = 'image_total'
+    
+    def view_count(self, obj):
+        """Detail page views flushed so far (see pageviews.py)"""
+        count = getattr(obj, 'view_total', None)
+        if count is None:
+            count = PageViewCounter.objects.filter(
+                page='project_detail', object_id=obj.pk
+            ).aggregate(total=Sum('views'))['total'] or 0
+        return f'{count:,}'
+    view_count.short_description = 'Views'
+    view_count.admin_order_field = 'view_total'
     
     def mark_featured(self, request, queryset):
         count = queryset.update(featured=True)
@@ -304,23 +468,21 @@ class ProjectAdmin(CustomModelForm):
     unmark_featured.short_description = 'Unmark selected as featured'
     
     def duplicate_project(self, request, queryset):
-        for project in queryset:
-            project.pk = None
-            project.title = f"{project.title} (Copy)"
-            project.save()
-        self.message_user(request, f'{queryset.count()} project(s) duplicated.')
+        copies = duplicate_projects(queryset)
+        self.message_user(request, f'{len(copies)} project(s) duplicated with their galleries.')
     duplicate_project.short_description = 'Duplicate selected projects'
 
 
 # ==================== CERTIFICATE ADMIN ====================
 @admin.register(Certificate)
-class CertificateAdmin(admin.ModelAdmin):
+class CertificateAdmin(FullTextSearchMixin, admin.ModelAdmin):
     """Enhanced admin for Certificates with expiry status"""
     
     list_display = ('certificate_name', 'issuing_organization', 'issue_date', 'expiry_status', 'order', 'credential_link')
     list_editable = ('order',)
     list_filter = ('issuing_organization', 'issue_date', 'expiry_date')
     search_fields = ('certificate_name', 'issuing_organization', 'credential_id')
+    search_kind = 'certificate'
     
     fieldsets = (
         ('Certificate Details', {
@@ -345,6 +507,18 @@ class CertificateAdmin(admin.ModelAdmin):
     
     actions = ['duplicate_certificate', 'delete_selected']
     
+    def get_queryset(self, request):
+        """Compute days until expiry in SQL, once per changelist query"""
+        queryset = super().get_queryset(request)
+        if is_changelist(request):
+            queryset = queryset.annotate(
+                time_left=ExpressionWrapper(
+                    F('expiry_date') - Value(date.today(), output_field=DateField()),
+                    output_field=DurationField()
+                )
+            ).defer('description')
+        return queryset
+    
     def has_delete_permission(self, request, obj=None):
         """Allow deleting certificates"""
         return True
@@ -353,14 +527,16 @@ class CertificateAdmin(admin.ModelAdmin):
         """Show if certificate is expired"""
         if obj.expiry_date is None:
             return format_html('∞ No expiry')
-        elif obj.expiry_date < date.today():
+        time_left = getattr(obj, 'time_left', None)
+        days_left = time_left.days if time_left is not None else (obj.expiry_date - date.today()).days
+        if days_left < 0:
             return format_html('<span style="color: #FF6B35; font-weight: bold;">🚫 Expired</span>')
         else:
-            days_left = (obj.expiry_date - date.today()).days
             if days_left < 90:
                 return format_html('<span style="color: #FFB84D;">⏰ {} days left</span>', days_left)
             return format_html('✓ Valid')
     expiry_status.short_description = 'Status'
+    expiry_status.admin_order_field = 'expiry_date'
     
     def credential_link(self, obj):
         """Show if credential URL exists"""
@@ -370,23 +546,21 @@ class CertificateAdmin(admin.ModelAdmin):
     credential_link.short_description = 'Verification'
     
     def duplicate_certificate(self, request, queryset):
-        for cert in queryset:
-            cert.pk = None
-            cert.certificate_name = f"{cert.certificate_name} (Copy)"
-            cert.save()
-        self.message_user(request, f'{queryset.count()} certificate(s) duplicated.')
+        copies = duplicate_certificates(queryset)
+        self.message_user(request, f'{len(copies)} certificate(s) duplicated.')
     duplicate_certificate.short_description = 'Duplicate selected certificates'
 
 
 # ==================== EXPERIENCE ADMIN ====================
 @admin.register(Experience)
-class ExperienceAdmin(admin.ModelAdmin):
+class ExperienceAdmin(FullTextSearchMixin, admin.ModelAdmin):
     """Enhanced admin for Work Experience with timeline"""
     
     list_display = ('position', 'company', 'location', 'date_range', 'current_badge', 'order')
     list_editable = ('order',)
     list_filter = ('current', 'company', 'start_date')
     search_fields = ('position', 'company', 'description', 'achievements')
+    search_kind = 'experience'
     
     fieldsets = (
         ('Position Details', {
@@ -407,6 +581,13 @@ class ExperienceAdmin(admin.ModelAdmin):
     
     actions = ['mark_current', 'mark_past', 'delete_selected']
     
+    def get_queryset(self, request):
+        """Skip long text columns the changelist never shows"""
+        queryset = super().get_queryset(request)
+        if is_changelist(request):
+            queryset = queryset.defer('description', 'achievements')
+        return queryset
+    
     def has_delete_permission(self, request, obj=None):
         """Allow deleting experiences"""
         return True
@@ -473,6 +654,13 @@ class EducationAdmin(admin.ModelAdmin):
     
     actions = ['mark_current', 'mark_completed', 'delete_selected']
     
+    def get_queryset(self, request):
+        """Skip long text columns the changelist never shows"""
+        queryset = super().get_queryset(request)
+        if is_changelist(request):
+            queryset = queryset.defer('description')
+        return queryset
+    
     def has_delete_permission(self, request, obj=None):
         """Allow deleting education entries"""
         return True
@@ -521,9 +709,16 @@ class ContactMessageAdmin(admin.ModelAdmin):
     list_display = ('name', 'email', 'subject', 'read_badge', 'created_at')
     list_editable = ()
     list_filter = ('read', 'created_at')
-    search_fields = ('name', 'email', 'subject', 'message', 'phone')
+    # Message bodies are left out: a LIKE over them dominates search time on large inboxes
+    search_fields = ('name', 'email', 'subject')
     readonly_fields = ('name', 'email', 'phone', 'subject', 'message', 'created_at')
     date_hierarchy = 'created_at'
+    ordering = ('-created_at', '-id')
+    
+    # Built for very large inboxes: bounded counts, no unfiltered total,
+    # and keyset paging past the first pages (see changelist.py)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
     fieldsets = (
         ('Sender Details', {
@@ -537,7 +732,17 @@ class ContactMessageAdmin(admin.ModelAdmin):
         }),
     )
     
-    actions = ['mark_as_read', 'mark_as_unread', 'delete_selected']
+    actions = ['mark_as_read', 'mark_as_unread', 'export_csv', 'export_jsonl', 'export_parquet', 'delete_selected']
+    
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
+    
+    def get_queryset(self, request):
+        """Skip the message body, which the changelist never shows"""
+        queryset = super().get_queryset(request)
+        if is_changelist(request):
+            queryset = queryset.defer('message')
+        return queryset
     
     def has_add_permission(self, request):
         """Prevent manually adding messages - only form submissions"""
@@ -565,3 +770,221 @@ class ContactMessageAdmin(admin.ModelAdmin):
         count = queryset.update(read=False)
         self.message_user(request, f'{count} message(s) marked as unread.')
     mark_as_unread.short_description = 'Mark selected as unread'
+    
+    def export_messages(self, request, queryset, format):
+        """Stream the selected messages as a download, oldest first"""
+        try:
+            stream = ExportStream(export_queryset(queryset), format)
+        except ValueError as e:
+            self.message_user(request, str(e), level='error')
+            return None
+        response = StreamingHttpResponse(stream, content_type=stream.content_type)
+        filename = f'contact-messages-{timezone.now():%Y%m%d-%H%M%S}.{stream.extension}'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+    
+    def export_csv(self, request, queryset):
+        return self.export_messages(request, queryset, 'csv')
+    export_csv.short_description = 'Export selected as CSV'
+    
+    def export_jsonl(self, request, queryset):
+        return self.export_messages(request, queryset, 'jsonl')
+    export_jsonl.short_description = 'Export selected as JSON Lines'
+    
+    def export_parquet(self, request, queryset):
+        return self.export_messages(request, queryset, 'parquet')
+    export_parquet.short_description = 'Export selected as Parquet'
+
+
+# ==================== EXPORT WATERMARK ADMIN ====================
+@admin.register(ExportWatermark)
+class ExportWatermarkAdmin(admin.ModelAdmin):
+    """Incremental export positions; delete one to re-export from the start"""
+    
+    list_display = ('name', 'dataset', 'last_created_at', 'last_id', 'updated_at')
+    readonly_fields = ('name', 'dataset', 'last_created_at', 'last_id', 'updated_at')
+    
+    def has_add_permission(self, request):
+        """Watermarks are written by `manage.py export_data --incremental`"""
+        return False
+
+
+# ==================== REPLICA SNAPSHOT ADMIN ====================
+@admin.register(ReplicaSnapshot)
+class ReplicaSnapshotAdmin(SuperuserOnlyMixin, admin.ModelAdmin):
+    """How far the read-only snapshot serving public search trails the primary; shared by every tenant"""
+    
+    list_display = ('alias', 'refreshed_at', 'lag_display', 'sync_status', 'duration_display', 'size_display')
+    readonly_fields = ('alias', 'refreshed_at', 'duration', 'size')
+    actions = ['refresh_now']
+    
+    def has_add_permission(self, request):
+        """Snapshots are recorded by `manage.py refresh_replica`"""
+        return False
+    
+    def lag_display(self, obj):
+        return timesince(obj.refreshed_at)
+    lag_display.short_description = 'Lag'
+    lag_display.admin_order_field = 'refreshed_at'
+    
+    def get_queryset(self, request):
+        """Check for newer published versions in the changelist query, not once per row"""
+        queryset = super().get_queryset(request)
+        if is_changelist(request):
+            queryset = queryset.annotate(behind=Exists(
+                PublishedSnapshot.objects.filter(published_at__gt=OuterRef('refreshed_at'))
+            ))
+        return queryset
+    
+    def sync_status(self, obj):
+        """This portfolio's content published since the snapshot isn't searchable on the public site yet"""
+        if not obj.behind:
+            return format_html('✓ Up to date')
+        return format_html('<span style="color: #FFB84D;">⏳ Behind primary</span>')
+    sync_status.short_description = 'Status'
+    
+    def duration_display(self, obj):
+        return f'{obj.duration:.2f}s'
+    duration_display.short_description = 'Backup time'
+    
+    def size_display(self, obj):
+        return f'{obj.size / 1024 / 1024:.1f} MB'
+    size_display.short_description = 'Size'
+    
+    def refresh_now(self, request, queryset):
+        snapshot = refresh_snapshot()
+        self.message_user(request, f'Snapshot refreshed in {snapshot.duration:.2f}s.')
+    refresh_now.short_description = 'Refresh the snapshot now'
+
+
+# ==================== PAGE VIEW ADMIN ====================
+@admin.register(PageViewCounter)
+class PageViewCounterAdmin(admin.ModelAdmin):
+    """Daily traffic per public page, written by the page-view flusher"""
+    
+    list_display = ('day', 'page', 'object_id', 'views')
+    list_filter = ('page',)
+    date_hierarchy = 'day'
+    ordering = ('-day', '-views')
+    readonly_fields = ('page', 'object_id', 'day', 'views')
+    
+    def has_add_permission(self, request):
+        """Counts come from pageviews.flush(), never from the admin"""
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+# ==================== GENERATED RESUME ADMIN ====================
+@admin.register(GeneratedResume)
+class GeneratedResumeAdmin(admin.ModelAdmin):
+    """The résumé rebuilt from portfolio content whenever it changes"""
+    
+    list_display = ('built_at', 'version', 'files', 'duration_display')
+    readonly_fields = ('fingerprint', 'filename', 'pdf', 'html', 'built_at', 'duration')
+    actions = ['rebuild_now']
+    
+    def has_add_permission(self, request):
+        """Built by resume.build_resume(), after edits or with `manage.py build_resume`"""
+        return False
+    
+    def version(self, obj):
+        return obj.fingerprint[:12]
+    version.short_description = 'Content hash'
+    
+    def files(self, obj):
+        return format_html(
+            '<a href="{}" target="_blank">PDF</a> ({} KB) · <a href="{}" target="_blank">Print view</a>',
+            reverse('resume_pdf'), f'{obj.pdf.size / 1024:.1f}', reverse('resume_html'),
+        )
+    files.short_description = 'Files'
+    
+    def duration_display(self, obj):
+        return f'{obj.duration * 1000:.0f} ms'
+    duration_display.short_description = 'Build time'
+    
+    def rebuild_now(self, request, queryset):
+        resume = build_resume(force=True)
+        if resume is None:
+            self.message_user(request, 'Add the About section first.', level='warning')
+        else:
+            self.message_user(request, f'Résumé rebuilt in {resume.duration * 1000:.0f} ms.')
+    rebuild_now.short_description = 'Rebuild the résumé now'
+
+
+# ==================== PUBLISHED SNAPSHOT ADMIN ====================
+@admin.register(PublishedSnapshot)
+class PublishedSnapshotAdmin(admin.ModelAdmin):
+    """Published versions of the content; the newest one is what the public site shows"""
+    
+    list_display = ('version', 'published_at', 'published_by', 'note', 'contents', 'size_display', 'draft_status')
+    readonly_fields = ('version', 'digest', 'size', 'counts', 'published_at', 'published_by', 'note')
+    exclude = ('payload',)
+    # Versions can't be edited or deleted; publishing is the button above the list
+    actions = None
+    
+    def has_add_permission(self, request):
+        """Created by publishing, from here or with `manage.py publish`"""
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+    
+    def has_delete_permission(self, request, obj=None):
+        """Versions are immutable history"""
+        return False
+    
+    def get_queryset(self, request):
+        """Mark the newest version and whether it matches the draft, digested once per changelist"""
+        queryset = super().get_queryset(request).defer('payload')
+        if is_changelist(request):
+            latest = PublishedSnapshot._base_manager.filter(tenant_id=OuterRef('tenant_id')).order_by('-version')
+            queryset = queryset.annotate(
+                latest_version=Subquery(latest.values('version')[:1]),
+                matches_draft=ExpressionWrapper(Q(digest=draft_digest()), output_field=BooleanField()),
+            )
+        return queryset
+    
+    def contents(self, obj):
+        counts = {label.split('.')[-1].lower(): count for label, count in obj.counts.items()}
+        return ', '.join(
+            f'{counts[name]} {label}' for name, label in (
+                ('project', 'projects'), ('certificate', 'certificates'), ('skill', 'skills'),
+                ('experience', 'jobs'), ('education', 'education'),
+            ) if counts.get(name)
+        ) or '—'
+    contents.short_description = 'Contents'
+    
+    def size_display(self, obj):
+        return f'{obj.size / 1024:.1f} KB'
+    size_display.short_description = 'Size'
+    
+    def draft_status(self, obj):
+        """Whether the tables hold edits the newest version doesn't"""
+        if obj.version != obj.latest_version:
+            return '—'
+        if obj.matches_draft:
+            return format_html('✓ Live, matches the draft')
+        return format_html('<span style="color: #FFB84D;">⏳ Live, draft has unpublished changes</span>')
+    draft_status.short_description = 'Status'
+    
+    def get_urls(self):
+        return [
+            path('publish/', self.admin_site.admin_view(self.publish_view), name='portfolio_publishedsnapshot_publish'),
+        ] + super().get_urls()
+    
+    def publish_view(self, request):
+        """Publish the current tenant's draft; posted by the button on the changelist"""
+        if request.method != 'POST':
+            return HttpResponseNotAllowed(['POST'])
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+        snapshot, created = publish(
+            published_by=request.user.get_username(), note=request.POST.get('note', '').strip()[:200],
+        )
+        if created:
+            self.message_user(request, f'Published version {snapshot.version}.')
+        else:
+            self.message_user(request, f'Nothing changed since version {snapshot.version}.', level='warning')
+        return redirect('admin:portfolio_publishedsnapshot_changelist')
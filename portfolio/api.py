@@ -0,0 +1,190 @@
+"""
+Read-only JSON API for headless and mobile frontends.
+
+Responses are built from the published content held in memory (see
+publishing.py), never from the draft tables. Every response carries an ETag
+derived from the published version, so clients revalidate without touching the
+database. ``/api/portfolio.json`` bundles all content in one payload that is
+serialized once per published version.
+"""
+import json
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models.fields.files import FieldFile
+from django.http import HttpResponse, JsonResponse, Http404
+from django.views.decorators.http import condition, require_GET
+
+from .cache import content_etag, versioned_key
+from .models import About, Skill, Project, Certificate, Experience, Education
+from .publishing import published
+
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+BUNDLE_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Serialized fields per resource. Values are either model attributes or
+# callables computing the value from an instance.
+RESOURCES = {
+    'about': (About, {
+        'name': 'name', 'title': 'title', 'bio': 'bio', 'email': 'email', 'phone': 'phone',
+        'location': 'location', 'profile_image': 'profile_image', 'resume': 'resume',
+        'linkedin_url': 'linkedin_url', 'github_url': 'github_url', 'twitter_url': 'twitter_url',
+        'hero_tagline': 'hero_tagline', 'hero_heading': 'hero_heading',
+        'hero_description': 'hero_description', 'availability_status': 'availability_status',
+        'availability_text': 'availability_text', 'updated_at': 'updated_at',
+    }),
+    'skills': (Skill, {
+        'id': 'pk', 'name': 'name', 'category': 'category', 'proficiency': 'proficiency',
+        'icon': 'icon', 'order': 'order',
+    }),
+    'projects': (Project, {
+        'id': 'pk', 'title': 'title', 'description': 'description',
+        'detailed_description': 'detailed_description', 'image': 'image',
+        'technologies': lambda project: project.get_technologies_list(),
+        'project_url': 'project_url', 'github_url': 'github_url', 'featured': 'featured',
+        'status': 'status', 'category': 'category',
+        'key_achievements': lambda project: project.get_achievements_list(),
+        'date_completed': 'date_completed', 'updated_at': 'updated_at',
+        'images': lambda project: [
+            {'id': image.pk, 'image': file_url(image.image), 'caption': image.caption, 'order': image.order}
+            for image in project.images.all()
+        ],
+    }),
+    'certificates': (Certificate, {
+        'id': 'pk', 'certificate_name': 'certificate_name',
+        'issuing_organization': 'issuing_organization', 'issue_date': 'issue_date',
+        'expiry_date': 'expiry_date', 'credential_id': 'credential_id',
+        'credential_url': 'credential_url', 'certificate_image': 'certificate_image',
+        'description': 'description',
+    }),
+    'experience': (Experience, {
+        'id': 'pk', 'company': 'company', 'position': 'position', 'location': 'location',
+        'start_date': 'start_date', 'end_date': 'end_date', 'current': 'current',
+        'description': 'description',
+        'achievements': lambda experience: experience.get_achievements_list(),
+        'company_logo': 'company_logo',
+    }),
+    'education': (Education, {
+        'id': 'pk', 'institution': 'institution', 'degree': 'degree',
+        'field_of_study': 'field_of_study', 'start_year': 'start_year',
+        'start_month': 'start_month', 'end_year': 'end_year', 'end_month': 'end_month',
+        'current': 'current', 'grade': 'grade', 'description': 'description',
+        'institution_logo': 'institution_logo', 'certificate_image': 'certificate_image',
+    }),
+}
+
+
+def file_url(value):
+    return value.url if value else None
+
+
+def serialize(instance, fields):
+    data = {}
+    for name, source in fields.items():
+        value = source(instance) if callable(source) else getattr(instance, source)
+        data[name] = file_url(value) if isinstance(value, FieldFile) else value
+    return data
+
+
+def select_fields(request, resource):
+    """Apply ?fields=a,b,c; unknown names raise ValueError"""
+    fields = RESOURCES[resource][1]
+    requested = request.GET.get('fields')
+    if not requested:
+        return fields
+    names = [name.strip() for name in requested.split(',') if name.strip()]
+    unknown = [name for name in names if name not in fields]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+    return {name: fields[name] for name in names}
+
+
+def resource_objects(resource, content=None):
+    """Published rows of ``resource`` in the model's default ordering"""
+    return (content or published()).objects(RESOURCES[resource][0])
+
+
+def dumps(data):
+    return json.dumps(data, cls=DjangoJSONEncoder, separators=(',', ':'))
+
+
+def build_bundle(content):
+    bundle = {'version': content.version}
+    bundle['about'] = serialize(content.about, RESOURCES['about'][1]) if content.about else None
+    for resource in ('skills', 'projects', 'certificates', 'experience', 'education'):
+        fields = RESOURCES[resource][1]
+        bundle[resource] = [serialize(obj, fields) for obj in resource_objects(resource, content)]
+    return dumps(bundle).encode()
+
+
+@require_GET
+@condition(etag_func=content_etag)
+def portfolio_bundle(request):
+    """Everything a frontend needs in one response, serialized once per published version"""
+    content = published()
+    key = versioned_key(content, 'api', 'bundle')
+    payload = cache.get(key)
+    if payload is None:
+        payload = build_bundle(content)
+        cache.set(key, payload, BUNDLE_CACHE_TIMEOUT)
+    return HttpResponse(payload, content_type='application/json')
+
+
+@require_GET
+@condition(etag_func=content_etag)
+def about_detail(request):
+    try:
+        fields = select_fields(request, 'about')
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    about = published().about
+    if about is None:
+        raise Http404('No About entry')
+    return JsonResponse(serialize(about, fields), json_dumps_params={'separators': (',', ':')})
+
+
+@require_GET
+@condition(etag_func=content_etag)
+def resource_list(request, resource):
+    """
+    Keyset-paginated collection. ``?limit=`` sets the page size and
+    ``?after=<id>`` continues from the last id of the previous page.
+    """
+    try:
+        fields = select_fields(request, resource)
+        limit = min(int(request.GET.get('limit', DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+        after = int(request.GET.get('after', 0))
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    if limit < 1:
+        return JsonResponse({'error': 'limit must be positive'}, status=400)
+
+    rows = published().after(RESOURCES[resource][0], after, limit + 1)
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_url = None
+    if has_more:
+        params = request.GET.copy()
+        params['after'] = rows[-1].pk
+        next_url = f'{request.path}?{params.urlencode()}'
+
+    return JsonResponse(
+        {'results': [serialize(obj, fields) for obj in rows], 'next': next_url},
+        json_dumps_params={'separators': (',', ':')},
+    )
+
+
+@require_GET
+@condition(etag_func=content_etag)
+def resource_detail(request, resource, pk):
+    try:
+        fields = select_fields(request, resource)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    obj = published().get(RESOURCES[resource][0], pk)
+    if obj is None:
+        raise Http404(f'No {resource} entry with id {pk}')
+    return JsonResponse(serialize(obj, fields), json_dumps_params={'separators': (',', ':')})
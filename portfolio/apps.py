@@ -1,6 +1,17 @@
 from django.apps import AppConfig
+from django.contrib.admin import apps as admin_apps
 
 
 class PortfolioConfig(AppConfig):
+    default = True
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'portfolio'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+
+
+class PortfolioAdminConfig(admin_apps.AdminConfig):
+    """django.contrib.admin, with PortfolioAdminSite as ``admin.site``"""
+    default = False
+    default_site = 'portfolio.sites.PortfolioAdminSite'
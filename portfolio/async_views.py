@@ -0,0 +1,213 @@
+"""
+Async versions of the public views, served instead of views.py when the site
+runs under ASGI (see ASYNC_VIEWS in settings).
+
+Page content comes from the published snapshot held in memory (see
+publishing.py), so a page only leaves the event loop when the worker is due
+to check for a newer version. Search runs its FTS query in a thread and the
+contact form saves with the async ORM. Templates must never trigger a query
+here: a lazy queryset evaluated on the event loop raises
+SynchronousOnlyOperation. Validation, stats and email helpers are shared
+with the synchronous views.
+"""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.http import Http404
+from django.shortcuts import render
+from django.utils import timezone
+from django.views.decorators.http import require_http_methods
+
+from . import search
+from .forms import ContactForm
+from .pageviews import counts_views
+from .publishing import apublished, order_by
+from .replica import reads_from_replica
+from .views import (
+    CONTACT_NOTICES, certificate_stats, contact_response, published_results, send_contact_email,
+)
+
+
+# Emails being sent in the background; holding a reference keeps the
+# futures alive until they finish
+_pending_emails = set()
+
+
+async def aget_base_context(request):
+    """Async counterpart of views.get_base_context"""
+    return {'about': (await apublished()).about}
+
+
+def stat(value, objects):
+    """A custom stat from About if it's set, otherwise the published count"""
+    return value if value else len(objects)
+
+
+@counts_views
+async def home(request):
+    """
+    Home page view - displays hero section, stats, featured projects, and skills preview
+    """
+    content = await apublished()
+    about = content.about
+
+    return render(request, 'portfolio/home.html', {
+        'about': about,
+        'skills': content.skills[:6],
+        'certificates': order_by(content.certificates, '-issue_date')[:4],
+        'projects': content.preview_projects(3),
+        'total_projects': stat(about and about.stat_projects, content.projects),
+        'total_skills': stat(about and about.stat_skills, content.skills),
+        'total_certificates': stat(about and about.stat_certifications, content.certificates),
+        'total_experience': stat(about and about.stat_experience, content.experiences),
+    })
+
+
+@counts_views
+async def about_page(request):
+    """
+    About page view - displays biographical information, experience timeline, and education
+    """
+    content = await apublished()
+
+    return render(request, 'portfolio/about.html', {
+        'about': content.about,
+        'experiences': order_by(content.experiences, '-start_date'),
+        'education': order_by(content.education, 'order', '-end_year', '-start_year'),
+        'skills': order_by(content.skills, 'category', '-proficiency'),
+        'certificates': order_by(content.certificates, '-issue_date')[:4],
+        'projects': content.preview_projects(6),
+        'now': timezone.now().date(),
+    })
+
+
+@counts_views
+async def skills_page(request):
+    """
+    Skills page view - displays all skills with category filtering
+    """
+    content = await apublished()
+    return render(request, 'portfolio/skills.html', {
+        'about': content.about,
+        'skills': order_by(content.skills, 'category', '-proficiency'),
+    })
+
+
+@counts_views
+async def projects_page(request):
+    """
+    Projects page view - displays all projects with filtering and sorting
+    """
+    filter_param = request.GET.get('filter', 'all')
+    sort_param = request.GET.get('sort', 'recent')
+
+    content = await apublished()
+    projects = content.projects
+    if filter_param == 'featured':
+        projects = [project for project in projects if project.featured]
+    projects = order_by(projects, 'title' if sort_param == 'alphabetical' else '-date_completed')
+
+    return render(request, 'portfolio/projects.html', {
+        'about': content.about,
+        'projects': projects,
+        'filter_param': filter_param,
+        'sort_param': sort_param,
+    })
+
+
+@counts_views
+async def project_detail(request, pk):
+    """
+    Project detail page view - displays detailed information about a specific project
+    """
+    content = await apublished()
+    project = content.get('portfolio.Project', pk)
+    if project is None:
+        raise Http404('No published project with this id')
+
+    return render(request, 'portfolio/project_detail.html', {
+        'about': content.about,
+        'project': project,
+        # Most similar projects, ranked ahead of time by similarity.py
+        'related_projects': content.related_projects(pk),
+    })
+
+
+@counts_views
+async def certificates_page(request):
+    """
+    Certificates page view - displays all certifications with sorting
+    """
+    content = await apublished()
+    certificates = order_by(content.certificates, '-issue_date')
+    active_certificates, expiring_soon = certificate_stats(certificates)
+
+    return render(request, 'portfolio/certificates.html', {
+        'about': content.about,
+        'certificates': certificates,
+        'total_certificates': len(certificates),
+        'active_certificates': active_certificates,
+        'expiring_soon': expiring_soon,
+    })
+
+
+@counts_views
+@reads_from_replica
+async def search_page(request):
+    """
+    Search page view - full-text search over projects, certificates, skills and experience
+    """
+    query = request.GET.get('q', '').strip()[:200]
+    if query:
+        # The FTS query is raw SQL, which Django can only run synchronously
+        content, results = await asyncio.gather(
+            apublished(),
+            sync_to_async(search.search)(query, limit=30),
+        )
+        results = published_results(results, content)
+    else:
+        content, results = await apublished(), []
+
+    return render(request, 'portfolio/search.html', {
+        'about': content.about,
+        'query': query,
+        'results': results,
+    })
+
+
+def send_contact_email_later(message):
+    """
+    Hand the notification email to a worker thread and return at once; the
+    response never waits on the SMTP server.
+    """
+    future = asyncio.get_running_loop().run_in_executor(None, send_contact_email, message)
+    _pending_emails.add(future)
+    future.add_done_callback(_pending_emails.discard)
+
+
+@require_http_methods(["GET", "POST"])
+@counts_views
+async def contact_page(request):
+    """
+    Contact page view - displays contact form and handles form submission
+    """
+    if request.method == 'POST':
+        form = ContactForm(request.POST)
+        # Validation runs no queries, so it's fine on the event loop
+        if not form.is_valid():
+            return contact_response(request, form.notice(), form=form)
+
+        message = form.save(commit=False)
+        try:
+            await message.asave()
+        except Exception:
+            return contact_response(request, 'failed')
+
+        send_contact_email_later(message)
+        return contact_response(request, 'sent', message=message)
+
+    context = await aget_base_context(request)
+    notice = CONTACT_NOTICES.get(request.GET.get('notice'))
+    if notice:
+        context['notice'] = {'tags': notice[0], 'text': notice[1]}
+    return render(request, 'portfolio/contact.html', context)
@@ -0,0 +1,25 @@
+import hashlib
+
+from .publishing import published
+from .tenancy import require_tenant
+
+
+def versioned_key(content, *parts):
+    """
+    Build a cache key in the current tenant's namespace for something derived
+    from ``content``, a PublishedContent.
+
+    The key carries the version of that very snapshot. A worker that hasn't
+    switched to a newer version yet keeps using the old keys, so it can never
+    store old content under a new version's key; snapshots never change, so
+    an entry stays correct for as long as the cache keeps it.
+    """
+    return ':'.join(['portfolio', str(require_tenant().pk), str(content.version)] + [str(part) for part in parts])
+
+
+def content_etag(request, *args, **kwargs):
+    """Weak ETag from the tenant, the published version this worker serves and the exact request URL"""
+    digest = hashlib.md5(
+        f'{require_tenant().pk}:{published().version}:{request.get_full_path()}'.encode(), usedforsecurity=False
+    ).hexdigest()
+    return f'W/"{digest}"'
@@ -0,0 +1,235 @@
+"""
+Two-tier cache: a bounded in-process LRU in front of a shared cache.
+
+Every worker of a deployment can read what any other worker cached in the
+shared tier, a FileBasedCache by default (Redis or Memcached work too), so a
+new worker doesn't start cold and the same page isn't compressed once per
+process. The hottest entries are also kept in this worker's memory, the
+local tier, so most hits don't leave the process.
+
+Writes go to both tiers. A local copy lives at most LOCAL_TIMEOUT seconds,
+and the local tier holds at most MAX_ENTRIES entries and MAX_BYTES of pickled
+values, dropping the least recently used first. Nothing needs to be pushed to
+other workers: content is cached under the version of the published snapshot
+it came from (cache.py), which each worker re-checks every
+PUBLISHED_CHECK_INTERVAL seconds. After a publish each worker moves on to new
+keys and its old local entries age out unused. Finding the version reads
+neither tier.
+
+``cache.stats()`` returns this worker's hits and misses per tier.
+"""
+import os
+import pickle
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.exceptions import ImproperlyConfigured
+
+
+MISSING = object()
+
+
+class LocalTier:
+    """Pickled values by key with their expiry, bounded by count and total size; thread-safe"""
+    _instances = weakref.WeakSet()
+
+    def __init__(self, max_entries, max_bytes):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.data = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+        self.reset_stats()
+        LocalTier._instances.add(self)
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = 0
+        self.shared_hits = self.shared_misses = 0
+
+    def get(self, key):
+        with self.lock:
+            entry = self.data.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                self.data.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                self._delete(key)
+            self.misses += 1
+            return None
+
+    def contains(self, key):
+        with self.lock:
+            entry = self.data.get(key)
+            return entry is not None and entry[1] > time.monotonic()
+
+    def count_shared(self, hit):
+        with self.lock:
+            if hit:
+                self.shared_hits += 1
+            else:
+                self.shared_misses += 1
+
+    def set(self, key, pickled, ttl):
+        with self.lock:
+            self._delete(key)
+            # A value this big would push out everything else; the shared tier has it
+            if len(pickled) > self.max_bytes // 4:
+                return
+            self.data[key] = (pickled, time.monotonic() + ttl)
+            self.size += len(pickled)
+            while len(self.data) > self.max_entries or self.size > self.max_bytes:
+                _, (evicted, _) = self.data.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self.lock:
+            self._delete(key)
+
+    def _delete(self, key):
+        entry = self.data.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[0])
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+            self.size = 0
+
+
+# LOCATION -> LocalTier. Django creates a backend instance per thread; the
+# local tier is shared by all of a worker's threads, like LocMemCache's store.
+_tiers = {}
+_tiers_lock = threading.Lock()
+
+
+class TwoTierCache(BaseCache):
+    """
+    OPTIONS: SHARED, the alias of the shared cache (required); MAX_ENTRIES
+    and MAX_BYTES, the local tier's bounds (default 300 and 32 MB);
+    LOCAL_TIMEOUT, the longest a local copy is trusted (default 60 seconds).
+    """
+    pickle_protocol = pickle.HIGHEST_PROTOCOL
+
+    def __init__(self, name, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        try:
+            self.shared_alias = options['SHARED']
+        except KeyError:
+            raise ImproperlyConfigured("TwoTierCache needs OPTIONS['SHARED'], the alias of the shared cache")
+        self.local_timeout = options.get('LOCAL_TIMEOUT', 60)
+        with _tiers_lock:
+            if name not in _tiers:
+                _tiers[name] = LocalTier(self._max_entries, options.get('MAX_BYTES', 32 * 1024 * 1024))
+            self.local = _tiers[name]
+
+    @property
+    def shared(self):
+        return caches[self.shared_alias]
+
+    def local_ttl(self, timeout):
+        """How long a local copy of a value stored with ``timeout`` may live; 0 for not at all"""
+        if timeout is None:
+            return self.local_timeout
+        return max(0, min(timeout, self.local_timeout))
+
+    def keep_local(self, key, value, timeout):
+        ttl = self.local_ttl(timeout)
+        if ttl:
+            self.local.set(key, pickle.dumps(value, self.pickle_protocol), ttl)
+        else:
+            self.local.delete(key)
+
+    def resolve_timeout(self, timeout):
+        return self.default_timeout if timeout is DEFAULT_TIMEOUT else timeout
+
+    def get(self, key, default=None, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        pickled = self.local.get(local_key)
+        if pickled is not None:
+            return pickle.loads(pickled)
+        value = self.shared.get(key, MISSING, version=version)
+        self.local.count_shared(value is not MISSING)
+        if value is MISSING:
+            return default
+        # The remaining shared timeout isn't known; LOCAL_TIMEOUT bounds the copy
+        self.keep_local(local_key, value, None)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        timeout = self.resolve_timeout(timeout)
+        self.shared.set(key, value, timeout, version=version)
+        self.keep_local(local_key, value, timeout)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        timeout = self.resolve_timeout(timeout)
+        added = self.shared.add(key, value, timeout, version=version)
+        if added:
+            self.keep_local(local_key, value, timeout)
+        else:
+            # Another worker's value is there; don't keep serving ours
+            self.local.delete(local_key)
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        self.local.delete(self.make_and_validate_key(key, version=version))
+        return self.shared.touch(key, self.resolve_timeout(timeout), version=version)
+
+    def delete(self, key, version=None):
+        self.local.delete(self.make_and_validate_key(key, version=version))
+        return self.shared.delete(key, version=version)
+
+    def has_key(self, key, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        return self.local.contains(local_key) or self.shared.has_key(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        # Counters change in other workers; a local copy would only go stale
+        self.local.delete(self.make_and_validate_key(key, version=version))
+        return self.shared.incr(key, delta, version=version)
+
+    def decr(self, key, delta=1, version=None):
+        self.local.delete(self.make_and_validate_key(key, version=version))
+        return self.shared.decr(key, delta, version=version)
+
+    def clear(self):
+        """Clear the shared tier and this worker's local tier; other workers' copies age out"""
+        self.local.clear()
+        self.shared.clear()
+
+    def close(self, **kwargs):
+        self.shared.close(**kwargs)
+
+    def stats(self):
+        """This worker's lookups since it started or since ``reset_stats()``"""
+        local = self.local
+        with local.lock:
+            return {
+                'local': {
+                    'hits': local.hits, 'misses': local.misses, 'evictions': local.evictions,
+                    'entries': len(local.data), 'bytes': local.size, 'max_bytes': local.max_bytes,
+                },
+                'shared': {'hits': local.shared_hits, 'misses': local.shared_misses},
+            }
+
+    def reset_stats(self):
+        with self.local.lock:
+            self.local.reset_stats()
+
+
+def _reset_after_fork():
+    # The pickled values are immutable and safe to share with the child
+    for tier in list(LocalTier._instances):
+        tier.lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,225 @@
+"""
+sitemap.xml, robots.txt and an Atom feed for crawlers and feed readers.
+
+The sitemap lists the fixed pages from urls.py plus every published project,
+dated by the ``updated_at`` of the content each one shows. Past the protocol's
+50,000 URLs per file it becomes a sitemap index pointing at one file per
+section, each split into ``?p=`` pages. The feed carries the most recently
+updated published projects and certificates. Every file is rendered once per
+published version, host and page, then served from the cache with an ETag and a
+Last-Modified date, so a crawler revalidating an unchanged site gets a 304
+without a single query. robots.txt keeps crawlers out of the admin, search
+and the JSON API, and points them at the sitemap.
+
+Last-Modified comes from ``updated_at``, so deleting a row doesn't move it;
+the ETag does change, and wins whenever a client sends both validators.
+"""
+from django.contrib.sitemaps import Sitemap
+from django.contrib.sitemaps import views as sitemap_views
+from django.contrib.syndication.views import Feed
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.urls import reverse, reverse_lazy
+from django.utils.cache import patch_cache_control
+from django.utils.feedgenerator import Atom1Feed
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_GET
+
+from .cache import content_etag, versioned_key
+from .models import About, Skill, Project, Certificate, Experience, Education
+from .publishing import order_by, published
+
+
+CRAWLER_CACHE_TIMEOUT = 60 * 60 * 24
+# Crawlers may reuse a response this long before revalidating
+CRAWLER_MAX_AGE = 60 * 60
+FEED_ITEMS = 20
+
+# Models whose rows appear on each fixed page
+PAGE_CONTENT = {
+    'home': (About, Skill, Project, Certificate, Experience),
+    'about': (About, Skill, Certificate, Project, Experience, Education),
+    'projects': (Project,),
+    'certificates': (Certificate,),
+    'contact': (About,),
+}
+CONTENT_MODELS = (About, Skill, Project, Certificate, Experience, Education)
+
+
+def last_updated(models, content=None):
+    """Latest ``updated_at`` over the published rows of ``models``, or None if there are none"""
+    content = content or published()
+    return max((obj.updated_at for model in models for obj in content.objects(model)), default=None)
+
+
+def content_last_modified(request, *args, **kwargs):
+    """Last-Modified for everything here; looked up once per published version"""
+    content = published()
+    key = versioned_key(content, 'last_modified')
+    modified = cache.get(key)
+    if modified is None:
+        modified = last_updated(CONTENT_MODELS, content) or False
+        cache.set(key, modified, CRAWLER_CACHE_TIMEOUT)
+    return modified or None
+
+
+class PageSitemap(Sitemap):
+    """The fixed pages in urls.py; search results are left to crawl themselves"""
+    changefreq = 'weekly'
+
+    def items(self):
+        return list(PAGE_CONTENT)
+
+    def location(self, item):
+        return reverse(item)
+
+    def lastmod(self, item):
+        return last_updated(PAGE_CONTENT[item])
+
+    def priority(self, item):
+        return 1.0 if item == 'home' else 0.8
+
+
+class ProjectSitemap(Sitemap):
+    changefreq = 'monthly'
+    priority = 0.6
+
+    def items(self):
+        return order_by(published().projects, 'pk')
+
+    def location(self, project):
+        return reverse('project_detail', args=[project.pk])
+
+    def lastmod(self, project):
+        return project.updated_at
+
+
+SITEMAPS = {'pages': PageSitemap, 'projects': ProjectSitemap}
+
+
+def sitemap_needs_index():
+    """
+    Whether the URLs no longer fit one sitemap file, the whole of which is a
+    single page of every section; decided once per published version
+    """
+    key = versioned_key(published(), 'sitemap', 'needs_index')
+    needed = cache.get(key)
+    if needed is None:
+        sections = [site() for site in SITEMAPS.values()]
+        needed = (
+            sum(site.paginator.count for site in sections) > Sitemap.limit
+            or any(site.paginator.num_pages > 1 for site in sections)
+        )
+        cache.set(key, needed, CRAWLER_CACHE_TIMEOUT)
+    return needed
+
+
+class LatestContentFeed(Feed):
+    """Recently added or updated projects and certificates"""
+    feed_type = Atom1Feed
+    link = reverse_lazy('home')
+
+    def title(self):
+        about = published().about
+        return f'{about.name} - Portfolio updates' if about else 'Data Analyst Portfolio'
+
+    def subtitle(self):
+        return 'New and updated projects and certifications'
+
+    def items(self):
+        content = published()
+        items = sorted([*content.projects, *content.certificates], key=lambda item: item.updated_at, reverse=True)
+        return items[:FEED_ITEMS]
+
+    def item_title(self, item):
+        if isinstance(item, Certificate):
+            return f'Certification: {item.certificate_name} ({item.issuing_organization})'
+        return item.title
+
+    def item_description(self, item):
+        if isinstance(item, Certificate):
+            return item.description or f'Issued by {item.issuing_organization} on {item.issue_date:%B %Y}'
+        return item.description
+
+    def item_link(self, item):
+        if isinstance(item, Certificate):
+            return f"{reverse('certificates')}#certificate-{item.pk}"
+        return reverse('project_detail', args=[item.pk])
+
+    def item_categories(self, item):
+        if isinstance(item, Certificate):
+            return ['Certification']
+        return item.get_technologies_list()
+
+    def item_pubdate(self, item):
+        return item.created_at
+
+    def item_updateddate(self, item):
+        return item.updated_at
+
+
+latest_content_feed = LatestContentFeed()
+
+
+def cached_response(request, parts, render):
+    """
+    Serve what ``render(request)`` returns, rendered once per published
+    version and host (absolute URLs inside depend on the host that was asked)
+    and per ``parts``, which must name everything else the output depends on.
+    """
+    content = published()
+    key = versioned_key(content, *parts, request.scheme, request.get_host())
+    cached = cache.get(key)
+    if cached is None:
+        response = render(request)
+        if hasattr(response, 'render'):
+            response.render()
+        headers = {header: response[header] for header in ('Content-Type', 'X-Robots-Tag') if header in response}
+        cached = (response.content, headers)
+        # Rendering reads published() again; store only if this worker didn't switch versions meanwhile
+        if published() is content:
+            cache.set(key, cached, CRAWLER_CACHE_TIMEOUT)
+
+    content, headers = cached
+    response = HttpResponse(content, headers=headers)
+    patch_cache_control(response, public=True, max_age=CRAWLER_MAX_AGE)
+    return response
+
+
+@require_GET
+@condition(etag_func=content_etag, last_modified_func=content_last_modified)
+def sitemap(request):
+    if sitemap_needs_index():
+        return cached_response(request, ['sitemap_index'], lambda r: sitemap_views.index(
+            r, sitemaps=SITEMAPS, sitemap_url_name='sitemap_section'))
+    # Only the page varies the output; an invalid one is a 404 and never cached
+    page = request.GET.get('p', '1')
+    return cached_response(request, ['sitemap', page], lambda r: sitemap_views.sitemap(r, sitemaps=SITEMAPS))
+
+
+@require_GET
+@condition(etag_func=content_etag, last_modified_func=content_last_modified)
+def sitemap_section(request, section):
+    page = request.GET.get('p', '1')
+    return cached_response(request, ['sitemap', section, page], lambda r: sitemap_views.sitemap(
+        r, sitemaps=SITEMAPS, section=section))
+
+
+@require_GET
+@condition(etag_func=content_etag, last_modified_func=content_last_modified)
+def feed(request):
+    return cached_response(request, ['feed'], latest_content_feed)
+
+
+@require_GET
+@cache_control(public=True, max_age=CRAWLER_CACHE_TIMEOUT)
+def robots_txt(request):
+    lines = [
+        'User-agent: *',
+        f"Disallow: {reverse('admin:index')}",
+        f"Disallow: {reverse('search')}",
+        'Disallow: /api/',
+        '',
+        f"Sitemap: {request.build_absolute_uri(reverse('sitemap'))}",
+    ]
+    return HttpResponse('\n'.join(lines) + '\n', content_type='text/plain')
@@ -0,0 +1,117 @@
+"""
+Bulk duplication of projects (with their galleries) and certificates.
+
+Rows are cloned with ``bulk_create`` inside a single transaction and the
+attached media files are copied concurrently beforehand, so duplicating many
+rows costs a handful of queries instead of one save() per row and image.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import transaction
+
+from . import search, similarity, social_cards
+from .models import Project, ProjectImage, Certificate
+
+
+MEDIA_COPY_WORKERS = 8
+
+
+def copy_file(field_file):
+    """Copy a stored file next to the original and return the new name"""
+    storage = field_file.storage
+    with storage.open(field_file.name, 'rb') as source:
+        return storage.save(field_file.name, source)
+
+
+def copy_media(files):
+    """
+    Copy every non-empty FieldFile in ``files`` through a thread pool and
+    point it at its copy. Files missing from storage keep sharing the original
+    name rather than failing the whole duplication.
+    """
+    files = [field_file for field_file in files if field_file]
+    if not files:
+        return
+
+    def copy(field_file):
+        try:
+            field_file.name = copy_file(field_file)
+        except FileNotFoundError:
+            pass
+
+    with ThreadPoolExecutor(max_workers=min(MEDIA_COPY_WORKERS, len(files))) as pool:
+        list(pool.map(copy, files))
+
+
+def clone(instance, **changes):
+    """Unsaved copy of ``instance`` with ``changes`` applied"""
+    instance.pk = None
+    instance._state.adding = True
+    for name, value in changes.items():
+        setattr(instance, name, value)
+    return instance
+
+
+def finish(instances):
+    """
+    bulk_create skips post_save, so do the signal handlers' work once
+    for the whole batch
+    """
+    search.index_objects(instances)
+    projects = [instance for instance in instances if isinstance(instance, Project)]
+    if projects:
+        for tenant_id in {project.tenant_id for project in projects}:
+            similarity.schedule_rebuild(tenant_id)
+        social_cards.schedule_cards(projects)
+
+
+def duplicate_projects(queryset, copy_files=True):
+    """
+    Duplicate projects and their gallery images; returns the new projects.
+    Deferred columns (the admin changelist defers long text) are reloaded.
+    """
+    originals = list(queryset.defer(None).prefetch_related('images'))
+    if not originals:
+        return []
+
+    copies = []
+    galleries = []
+    for project in originals:
+        images = list(project.images.all())
+        copies.append(clone(project, title=f'{project.title} (Copy)', social_card=''))
+        galleries.append([clone(image, project=None) for image in images])
+
+    if copy_files:
+        copy_media(
+            [project.image for project in copies]
+            + [image.image for gallery in galleries for image in gallery]
+        )
+
+    with transaction.atomic():
+        copies = Project.objects.bulk_create(copies)
+        new_images = []
+        for project, gallery in zip(copies, galleries):
+            for image in gallery:
+                image.project = project
+                new_images.append(image)
+        ProjectImage.objects.bulk_create(new_images)
+        transaction.on_commit(lambda: finish(copies), robust=True)
+    return copies
+
+
+def duplicate_certificates(queryset, copy_files=True):
+    """Duplicate certificates; returns the new certificates"""
+    copies = [
+        clone(cert, certificate_name=f'{cert.certificate_name} (Copy)')
+        for cert in queryset.defer(None)
+    ]
+    if not copies:
+        return []
+
+    if copy_files:
+        copy_media([cert.certificate_image for cert in copies])
+
+    with transaction.atomic():
+        copies = Certificate.objects.bulk_create(copies)
+        transaction.on_commit(lambda: finish(copies), robust=True)
+    return copies
@@ -0,0 +1,198 @@
+"""
+Streaming exports of contact messages and portfolio content as CSV, JSONL or
+Parquet.
+
+Rows are read in (created_at, id) order with ``iterator(chunk_size=...)`` and
+encoded a chunk at a time, so memory use doesn't grow with the table. The
+same generators feed the admin's StreamingHttpResponse and the
+``export_data`` management command; incremental exports resume after an
+ExportWatermark.
+"""
+import csv
+import io
+
+from django.apps import apps
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models import Q
+
+CHUNK_SIZE = 2000
+
+# dataset name -> model label
+DATASETS = {
+    'messages': 'portfolio.ContactMessage',
+    'about': 'portfolio.About',
+    'skills': 'portfolio.Skill',
+    'projects': 'portfolio.Project',
+    'project_images': 'portfolio.ProjectImage',
+    'certificates': 'portfolio.Certificate',
+    'experience': 'portfolio.Experience',
+    'education': 'portfolio.Education',
+}
+
+# format -> (content type, file extension)
+FORMATS = {
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'jsonl': ('application/x-ndjson', 'jsonl'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+}
+
+
+def import_pyarrow():
+    """
+    pyarrow is optional and slow to import, so it's only loaded when a
+    Parquet export runs. Returns None if it isn't installed.
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def dataset_model(name):
+    return apps.get_model(DATASETS[name])
+
+
+def export_fields(model):
+    """Every concrete column; files export as their stored names"""
+    return [field.attname for field in model._meta.concrete_fields]
+
+
+def export_queryset(queryset, since=None):
+    """
+    Order ``queryset`` for export and, given a ``(created_at, id)`` position,
+    keep only the rows after it.
+    """
+    queryset = queryset.order_by('created_at', 'pk')
+    if since is not None:
+        created_at, pk = since
+        queryset = queryset.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, pk__gt=pk))
+    return queryset
+
+
+class ExportStream:
+    """
+    Iterable of encoded chunks for ``queryset`` in ``format``. Once fully
+    consumed, ``position`` holds (created_at, id) of the last row written, for
+    saving as an incremental watermark.
+    """
+    def __init__(self, queryset, format):
+        if format not in FORMATS:
+            raise ValueError(f"Unknown export format '{format}'")
+        if format == 'parquet' and import_pyarrow() is None:
+            raise ValueError('Parquet export requires pyarrow: pip install pyarrow')
+        self.model = queryset.model
+        self.fields = export_fields(self.model)
+        self.queryset = queryset
+        self.format = format
+        self.position = None
+        self.count = 0
+
+    @property
+    def content_type(self):
+        return FORMATS[self.format][0]
+
+    @property
+    def extension(self):
+        return FORMATS[self.format][1]
+
+    def __iter__(self):
+        return getattr(self, f'encode_{self.format}')(self.chunks())
+
+    def chunks(self):
+        """Lists of up to CHUNK_SIZE value tuples, tracking the last position"""
+        created_at = self.fields.index('created_at')
+        pk = self.fields.index(self.model._meta.pk.attname)
+        chunk = []
+        for row in self.queryset.values_list(*self.fields).iterator(chunk_size=CHUNK_SIZE):
+            chunk.append(row)
+            if len(chunk) >= CHUNK_SIZE:
+                self.count += len(chunk)
+                self.position = (chunk[-1][created_at], chunk[-1][pk])
+                yield chunk
+                chunk = []
+        if chunk:
+            self.count += len(chunk)
+            self.position = (chunk[-1][created_at], chunk[-1][pk])
+            yield chunk
+
+    def encode_csv(self, chunks):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(self.fields)
+        for chunk in chunks:
+            writer.writerows(chunk)
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode('utf-8')
+
+    def encode_jsonl(self, chunks):
+        encoder = DjangoJSONEncoder(ensure_ascii=False, separators=(',', ':'))
+        for chunk in chunks:
+            yield ''.join(
+                encoder.encode(dict(zip(self.fields, row))) + '\n' for row in chunk
+            ).encode('utf-8')
+
+    def encode_parquet(self, chunks):
+        pyarrow = import_pyarrow()
+        schema = parquet_schema(self.model, self.fields)
+        sink = ChunkSink()
+        writer = pyarrow.parquet.ParquetWriter(sink, schema, compression='zstd')
+        for chunk in chunks:
+            columns = zip(*chunk)
+            writer.write_table(pyarrow.Table.from_arrays(
+                [pyarrow.array(column, type=schema.field(i).type) for i, column in enumerate(columns)],
+                schema=schema,
+            ))
+            yield sink.drain()
+        writer.close()
+        yield sink.drain()
+
+
+class ChunkSink(io.RawIOBase):
+    """Write-only file that hands back what was written since the last drain"""
+    def __init__(self):
+        super().__init__()
+        self.parts = []
+        self.position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.parts.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def drain(self):
+        data = b''.join(self.parts)
+        self.parts = []
+        return data
+
+
+def parquet_schema(model, fields):
+    pyarrow = import_pyarrow()
+    by_attname = {field.attname: field for field in model._meta.concrete_fields}
+    return pyarrow.schema([(name, arrow_type(by_attname[name])) for name in fields])
+
+
+def arrow_type(field):
+    pyarrow = import_pyarrow()
+    if isinstance(field, models.BooleanField):
+        return pyarrow.bool_()
+    if isinstance(field, (models.AutoField, models.IntegerField, models.ForeignKey)):
+        return pyarrow.int64()
+    if isinstance(field, models.FloatField):
+        return pyarrow.float64()
+    if isinstance(field, models.DateTimeField):
+        return pyarrow.timestamp('us', tz='UTC')
+    if isinstance(field, models.DateField):
+        return pyarrow.date32()
+    return pyarrow.string()
@@ -0,0 +1,11 @@
+from django.utils.text import slugify
+
+
+# Generated by `manage.py subset_fonts`, relative to the static root
+FONTS_CSS = 'css/fonts.css'
+
+
+def font_filename(font):
+    """Name of the generated WOFF2 file for a WEB_FONTS entry"""
+    weight = str(font.get('weight', '400')).replace(' ', '-')
+    return f"{slugify(font['family'])}-{weight}.woff2"
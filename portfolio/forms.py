@@ -0,0 +1,23 @@
+from django import forms
+
+from .models import ContactMessage
+
+
+class ContactForm(forms.ModelForm):
+    """Contact page submission, for both plain form posts and AJAX"""
+
+    # Matches the character counter on the contact page
+    message = forms.CharField(max_length=2000, widget=forms.Textarea)
+
+    class Meta:
+        model = ContactMessage
+        fields = ['name', 'email', 'phone', 'subject', 'message']
+
+    def notice(self):
+        """CONTACT_NOTICES code summing up why an invalid form was rejected"""
+        errors = self.errors.as_data()
+        if any(error.code == 'required' for field_errors in errors.values() for error in field_errors):
+            return 'missing'
+        if 'email' in errors:
+            return 'invalid_email'
+        return 'invalid'
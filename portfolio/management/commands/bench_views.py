@@ -0,0 +1,193 @@
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+from portfolio.models import Project
+from portfolio.tenancy import tenant_for_host
+from portfolio.warmup import warmup_host, wsgi_get
+
+
+# Each mode runs in its own interpreter, with the views it would serve
+MODES = {
+    'wsgi': '0',
+    'asgi': '1',
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare throughput of the public pages served by the synchronous views through '
+        'the WSGI handler with the async views through the ASGI handler, in process.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=1000, help='Requests per mode (default 1000)')
+        parser.add_argument(
+            '--concurrency', type=int, default=8,
+            help='WSGI worker threads, or ASGI requests in flight (default 8)'
+        )
+        parser.add_argument('--mode', choices=sorted(MODES), help='Benchmark a single mode and print JSON')
+
+    def handle(self, *args, **options):
+        if options['mode']:
+            result = self.run_mode(options['mode'], options['requests'], options['concurrency'])
+            self.stdout.write(json.dumps(result))
+            return
+
+        results = {}
+        for mode, async_views in MODES.items():
+            env = dict(
+                os.environ,
+                DJANGO_SETTINGS_MODULE=settings.SETTINGS_MODULE,
+                PORTFOLIO_ASYNC_VIEWS=async_views,
+            )
+            completed = subprocess.run(
+                [sys.executable, 'manage.py', 'bench_views', '--mode', mode,
+                 '--requests', str(options['requests']), '--concurrency', str(options['concurrency'])],
+                cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+            )
+            if completed.returncode != 0:
+                raise CommandError(f'{mode} run failed:\n{completed.stderr[-2000:]}')
+            results[mode] = json.loads(completed.stdout.strip().splitlines()[-1])
+
+        self.stdout.write(
+            f"{options['requests']} requests per mode, concurrency {options['concurrency']}\n"
+        )
+        self.stdout.write(
+            f"{'mode':<6}{'req/s':>9}{'median ms':>11}{'p99 ms':>9}{'errors':>8}{'local hits':>12}{'shared hits':>13}"
+        )
+        for mode, result in results.items():
+            stats = result['cache']
+            self.stdout.write(
+                f"{mode:<6}{result['throughput']:9.1f}{result['median_ms']:11.1f}"
+                f"{result['p99_ms']:9.1f}{result['errors']:8d}"
+                f"{hit_rate(stats and stats['local']):>12}{hit_rate(stats and stats['shared']):>13}"
+            )
+
+    def run_mode(self, mode, requests, concurrency):
+        host = warmup_host()
+        paths = bench_paths(host)
+        schedule = [paths[i % len(paths)] for i in range(requests)]
+        runner = self.run_wsgi if mode == 'wsgi' else self.run_asgi
+        # One untimed pass so both modes start with warm caches
+        runner(paths, host, concurrency)
+        tiered = hasattr(cache, 'stats')
+        if tiered:
+            cache.reset_stats()
+        started = time.perf_counter()
+        timings, errors = runner(schedule, host, concurrency)
+        elapsed = time.perf_counter() - started
+
+        ordered = sorted(timings) or [0.0]
+        return {
+            'throughput': len(timings) / elapsed,
+            'median_ms': statistics.median(ordered),
+            'p99_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+            'errors': errors,
+            'cache': cache.stats() if tiered else None,
+        }
+
+    def run_wsgi(self, schedule, host, concurrency):
+        """A threaded WSGI server: ``concurrency`` threads sharing one handler"""
+        handler = WSGIHandler()
+        lock = threading.Lock()
+        timings, errors = [], 0
+
+        def get(path):
+            nonlocal errors
+            started = time.perf_counter()
+            status = wsgi_get(handler, path, host)
+            with lock:
+                timings.append((time.perf_counter() - started) * 1000)
+                if not status.startswith('200'):
+                    errors += 1
+
+        with ThreadPoolExecutor(concurrency) as pool:
+            list(pool.map(get, schedule))
+        return timings, errors
+
+    def run_asgi(self, schedule, host, concurrency):
+        """An ASGI server: one event loop with ``concurrency`` requests in flight"""
+        handler = ASGIHandler()
+        timings, errors = [], 0
+
+        async def get(path, slots):
+            nonlocal errors
+            async with slots:
+                started = time.perf_counter()
+                status = await asgi_get(handler, path, host)
+                timings.append((time.perf_counter() - started) * 1000)
+                if status != 200:
+                    errors += 1
+
+        async def main():
+            slots = asyncio.Semaphore(concurrency)
+            await asyncio.gather(*(get(path, slots) for path in schedule))
+
+        asyncio.run(main())
+        return timings, errors
+
+
+def hit_rate(tier):
+    """'93.1%' for one tier of TwoTierCache.stats(), '-' without lookups or a two-tier cache"""
+    lookups = tier and tier['hits'] + tier['misses']
+    return f"{tier['hits'] / lookups:.1%}" if lookups else '-'
+
+
+def bench_paths(host):
+    """The public pages, a project page of the tenant serving ``host`` and a search"""
+    paths = [reverse(name) for name in ('home', 'about', 'projects', 'certificates', 'contact')]
+    project = Project.objects.filter(tenant=tenant_for_host(host)).order_by('pk').first()
+    if project is not None:
+        paths.append(reverse('project_detail', args=[project.pk]))
+    paths.append(reverse('search') + '?q=data')
+    return paths
+
+
+async def asgi_get(handler, path, host):
+    """GET ``path`` from an ASGI handler; returns the status code"""
+    path, _, query = path.partition('?')
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'query_string': query.encode(),
+        'headers': [(b'host', host.encode()), (b'accept-encoding', b'br, gzip')],
+        'server': (host, 80),
+        'client': ('127.0.0.1', 0),
+    }
+    body_sent = False
+
+    async def receive():
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        # The client stays connected until the response is complete
+        await asyncio.Future()
+
+    status = None
+
+    async def send(message):
+        nonlocal status
+        if message['type'] == 'http.response.start':
+            status = message['status']
+
+    await handler(scope, receive, send)
+    return status
@@ -0,0 +1,204 @@
+import re
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.management.base import BaseCommand, CommandError
+from django.template.loader import get_template
+
+
+STYLESHEETS_TAG = re.compile(r"{%\s*stylesheets\s+(?P<args>[^%]*?)page=['\"](?P<page>[\w-]+)['\"]\s*%}")
+TEMPLATE_SYNTAX = re.compile(r'{%.*?%}|{{.*?}}|{#.*?#}', re.S)
+CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+HTML_COMMENT = re.compile(r'<!--.*?-->', re.S)
+# Icon internals: long path data and no classes any stylesheet targets
+SVG_BODY = re.compile(r'(<svg\b[^>]*>).*?(</svg>)', re.S)
+PSEUDO = re.compile(r'::?[\w-]+(\([^)]*\))?')
+ATTRIBUTE = re.compile(r'\[[^\]]*\]')
+COMBINATOR = re.compile(r'\s*[>+~]\s*|\s+')
+ANIMATION_NAME = re.compile(r'animation(?:-name)?\s*:\s*([^;}]+)')
+# States nobody is in on first paint; the full stylesheet has them by the time anyone is
+INTERACTION = re.compile(r':(?:hover|focus|focus-visible|focus-within|active)\b')
+
+# How much of a page's content markup (comments and icon internals removed)
+# counts as above the fold when its first section runs longer: roughly one
+# viewport of this site's markup.
+FOLD_MARKUP_CHARS = 2000
+
+# Rules that always belong in the critical subset, whatever the markup.
+ALWAYS_CRITICAL = ('@font-face', '@import', '@charset')
+
+
+class Command(BaseCommand):
+    help = (
+        'Extract the above-the-fold subset of each page stylesheet into '
+        'CRITICAL_CSS_DIR so it can be inlined while the rest loads async'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'pages', nargs='*',
+            help='Page names to build (default: every template using {% stylesheets ... page=... %})'
+        )
+
+    def handle(self, *args, **options):
+        base_markup = self.above_the_fold(self.template_source('portfolio/base.html'))
+        pages = self.discover_pages()
+        if options['pages']:
+            unknown = set(options['pages']) - set(pages)
+            if unknown:
+                raise CommandError(f"Unknown page(s): {', '.join(sorted(unknown))}")
+            pages = {name: pages[name] for name in options['pages']}
+
+        budget = settings.CRITICAL_CSS_BUDGET
+        built = {}
+        for page, (template_name, stylesheet_paths) in sorted(pages.items()):
+            markup = base_markup + self.above_the_fold(self.template_source(template_name))
+            tags, classes, ids = self.collect_tokens(markup)
+
+            full_css = ''
+            for path in stylesheet_paths:
+                found = finders.find(path)
+                if not found:
+                    raise CommandError(f"Stylesheet '{path}' used by {template_name} not found")
+                with open(found, encoding='utf-8') as fh:
+                    full_css += fh.read() + '\n'
+
+            critical = self.filter_css(CSS_COMMENT.sub('', full_css), tags, classes, ids)
+            critical = self.keep_used_keyframes(CSS_COMMENT.sub('', full_css), critical)
+            built[page] = critical
+            self.stdout.write(f'{page}: {len(critical.encode()):,} of {len(full_css.encode()):,} bytes critical')
+
+        # Inlined into every response of the page, ahead of its content
+        over = {page: len(css.encode()) for page, css in built.items() if len(css.encode()) > budget}
+        if over:
+            raise CommandError(
+                f'Critical CSS over the {budget:,}-byte CRITICAL_CSS_BUDGET: '
+                + ', '.join(f'{page} ({size:,} bytes)' for page, size in sorted(over.items()))
+                + '. Nothing was written.'
+            )
+        settings.CRITICAL_CSS_DIR.mkdir(parents=True, exist_ok=True)
+        for page, critical in built.items():
+            (settings.CRITICAL_CSS_DIR / f'{page}.css').write_text(critical, encoding='utf-8')
+
+        self.stdout.write(self.style.SUCCESS(f'Built critical CSS for {len(pages)} page(s).'))
+
+    def template_source(self, template_name):
+        return get_template(template_name).template.source
+
+    def discover_pages(self):
+        """Map page name -> (template, stylesheets) from {% stylesheets %} tags"""
+        pages = {}
+        template_dir = settings.BASE_DIR / 'portfolio' / 'templates'
+        for path in sorted(template_dir.rglob('*.html')):
+            source = path.read_text(encoding='utf-8')
+            for match in STYLESHEETS_TAG.finditer(source):
+                template_name = path.relative_to(template_dir).as_posix()
+                stylesheet_paths = re.findall(r"['\"]([^'\"]+\.css)['\"]", match.group('args'))
+                pages[match.group('page')] = (template_name, stylesheet_paths)
+        return pages
+
+    def above_the_fold(self, source):
+        """
+        Approximate what is visible on first paint: the page chrome before the
+        content block, or the content block up to the end of its first section
+        and at most FOLD_MARKUP_CHARS long.
+        """
+        if '{% block content %}' not in source:
+            return source
+        head, _, content = source.partition('{% block content %}')
+        if '{% extends' not in source:
+            return head
+        content = SVG_BODY.sub(r'\1\2', HTML_COMMENT.sub('', content))
+        end = content.find('</section>')
+        if end != -1:
+            content = content[:end]
+        if len(content) > FOLD_MARKUP_CHARS:
+            # Cut after the last complete tag
+            content = content[:content.rfind('>', 0, FOLD_MARKUP_CHARS) + 1]
+        return content
+
+    def collect_tokens(self, markup):
+        markup = TEMPLATE_SYNTAX.sub(' ', markup)
+        tags = {tag.lower() for tag in re.findall(r'<([a-zA-Z][\w-]*)', markup)}
+        tags.update({'html', 'body', 'head'})
+        classes = set()
+        for value in re.findall(r'class\s*=\s*["\']([^"\']*)["\']', markup):
+            classes.update(value.split())
+        ids = set(re.findall(r'id\s*=\s*["\']([^"\']+)["\']', markup))
+        return tags, classes, ids
+
+    def selector_matches(self, selector, tags, classes, ids):
+        selector = ATTRIBUTE.sub('', PSEUDO.sub('', selector)).strip()
+        for compound in COMBINATOR.split(selector):
+            if not compound or compound == '*':
+                continue
+            tag = re.match(r'[a-zA-Z][\w-]*', compound)
+            if tag and tag.group(0).lower() not in tags:
+                return False
+            if not set(re.findall(r'\.([\w-]+)', compound)) <= classes:
+                return False
+            if not set(re.findall(r'#([\w-]+)', compound)) <= ids:
+                return False
+        return True
+
+    def split_rules(self, css):
+        """Yield (prelude, body) for each top-level rule"""
+        i, length = 0, len(css)
+        while i < length:
+            brace = css.find('{', i)
+            if brace == -1:
+                return
+            prelude = css[i:brace].strip()
+            depth, j = 1, brace + 1
+            while j < length and depth:
+                if css[j] == '{':
+                    depth += 1
+                elif css[j] == '}':
+                    depth -= 1
+                j += 1
+            if ';' in prelude:
+                # Statement at-rule such as @import preceding the block
+                statement, _, prelude = prelude.rpartition(';')
+                yield statement + ';', None
+            yield prelude, css[brace + 1:j - 1]
+            i = j
+
+    def filter_css(self, css, tags, classes, ids):
+        kept = []
+        for prelude, body in self.split_rules(css):
+            if body is None or prelude.startswith(ALWAYS_CRITICAL):
+                kept.append(prelude if body is None else f'{prelude}{{{body.strip()}}}')
+            elif prelude.startswith(('@media', '@supports')):
+                inner = self.filter_css(body, tags, classes, ids)
+                if inner:
+                    kept.append(f'{prelude}{{{inner}}}')
+            elif prelude.startswith('@'):
+                # @keyframes and friends are pulled in by keep_used_keyframes
+                continue
+            else:
+                selectors = [
+                    sel.strip() for sel in prelude.split(',')
+                    if not INTERACTION.search(sel) and self.selector_matches(sel, tags, classes, ids)
+                ]
+                if selectors:
+                    kept.append(f'{",".join(selectors)}{{{self.minify_declarations(body)}}}')
+        return '\n'.join(kept)
+
+    def minify_declarations(self, body):
+        declarations = []
+        for declaration in body.split(';'):
+            name, colon, value = declaration.partition(':')
+            if colon:
+                declarations.append(f"{name.strip()}:{' '.join(value.split())}")
+        return ';'.join(declarations)
+
+    def keep_used_keyframes(self, css, critical):
+        used = set()
+        for value in ANIMATION_NAME.findall(critical):
+            used.update(re.findall(r'[\w-]+', value))
+        keyframes = [
+            f'{prelude}{{{body.strip()}}}'
+            for prelude, body in self.split_rules(css)
+            if body is not None and prelude.startswith('@keyframes') and prelude.split()[-1] in used
+        ]
+        return '\n'.join(filter(None, [critical] + keyframes)) + '\n'
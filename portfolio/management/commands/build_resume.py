@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio import resume
+from portfolio.tenancy import add_tenant_argument, command_tenants, use_tenant
+
+
+class Command(BaseCommand):
+    help = 'Render each portfolio\'s PDF and HTML résumé from its published content if it changed since the last build'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Rebuild even if the content is unchanged')
+        add_tenant_argument(parser, help='Build only this tenant\'s résumé (default: every active tenant)')
+
+    def handle(self, *args, **options):
+        tenants = command_tenants(options['tenant'])
+        for tenant in tenants:
+            with use_tenant(tenant):
+                built = resume.build_resume(force=options['force'])
+            if built is None:
+                if len(tenants) == 1:
+                    raise CommandError('Publish an About section before building a résumé')
+                self.stdout.write(f'{tenant.slug}: no About section published, skipped.')
+                continue
+            self.stdout.write(self.style.SUCCESS(
+                f'{tenant.slug}: résumé {built.fingerprint[:12]} built at {built.built_at:%Y-%m-%d %H:%M:%S} '
+                f'({built.pdf.size / 1024:.1f} KB PDF).'
+            ))
@@ -0,0 +1,49 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from portfolio.models import Tenant
+
+
+class Command(BaseCommand):
+    help = 'Add a portfolio served on its own domain, optionally with a staff user who edits it'
+
+    def add_arguments(self, parser):
+        parser.add_argument('slug', help='Short unique name used by the --tenant option of other commands')
+        parser.add_argument('domain', help='Host name the portfolio is served on, without scheme or port')
+        parser.add_argument('--name', help='Display name (defaults to the slug)')
+        parser.add_argument('--owner', metavar='USERNAME',
+                            help='Existing user to make a staff member of the portfolio with edit rights to its content')
+        parser.add_argument('--contact-email', default='', help='Where contact form messages are sent')
+
+    def handle(self, *args, **options):
+        owner = None
+        if options['owner']:
+            owner = get_user_model()._default_manager.filter(username=options['owner']).first()
+            if owner is None:
+                raise CommandError(f"No user '{options['owner']}'")
+
+        tenant = Tenant(
+            slug=options['slug'],
+            name=options['name'] or options['slug'],
+            domain=options['domain'],
+            contact_email=options['contact_email'],
+        )
+        try:
+            tenant.full_clean()
+        except ValidationError as e:
+            raise CommandError('; '.join(f'{field}: {" ".join(errors)}' for field, errors in e.message_dict.items()))
+
+        with transaction.atomic():
+            tenant.save()
+            if owner is not None:
+                if not owner.is_staff:
+                    owner.is_staff = True
+                    owner.save(update_fields=['is_staff'])
+                tenant.members.add(owner)
+                # Tenants and the replica are superuser-only whatever the permissions say (see admin.py)
+                owner.user_permissions.add(*Permission.objects.filter(content_type__app_label='portfolio'))
+
+        self.stdout.write(self.style.SUCCESS(f"Created tenant '{tenant.slug}' served on {tenant.domain}."))
@@ -0,0 +1,84 @@
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+# What each target runs in a fresh interpreter
+TARGETS = {
+    'check': ['manage.py', 'check'],
+    'wsgi': ['-c', 'import portfolio_project.wsgi'],
+    'asgi': ['-c', 'import portfolio_project.asgi'],
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Report per-module import time (python -X importtime) for `manage.py check` or for '
+        'worker startup, optionally failing when the total exceeds a budget.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('target', nargs='?', choices=sorted(TARGETS), default='wsgi')
+        parser.add_argument('--top', type=int, default=20, help='Modules and packages to list (default 20)')
+        parser.add_argument(
+            '--sort', choices=['self', 'cumulative'], default='self',
+            help='Rank modules by their own import time or including their imports'
+        )
+        parser.add_argument(
+            '--budget', type=float,
+            help='Fail if total import time exceeds this many milliseconds'
+        )
+
+    def handle(self, *args, **options):
+        target = options['target']
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings.SETTINGS_MODULE)
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', *TARGETS[target]],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+        )
+        wall_ms = (time.perf_counter() - started) * 1000
+        modules = parse_importtime(result.stderr)
+        if result.returncode != 0 or not modules:
+            raise CommandError(f"'{target}' failed:\n{result.stderr[-2000:]}")
+
+        total_ms = sum(own for _, own, _ in modules) / 1000
+        key = 1 if options['sort'] == 'self' else 2
+        top = options['top']
+
+        self.stdout.write(f'{target}: {len(modules)} modules imported in {total_ms:.0f} ms '
+                          f'({wall_ms:.0f} ms wall clock including start-up work)\n')
+        self.stdout.write(f"{'self ms':>9} {'cumul ms':>9}  module")
+        for name, own, cumulative in sorted(modules, key=lambda m: m[key], reverse=True)[:top]:
+            self.stdout.write(f'{own / 1000:9.1f} {cumulative / 1000:9.1f}  {name}')
+
+        packages = defaultdict(int)
+        for name, own, _ in modules:
+            packages[name.split('.')[0]] += own
+        self.stdout.write(f"\n{'self ms':>9}  top-level package")
+        for package, own in sorted(packages.items(), key=lambda p: p[1], reverse=True)[:top]:
+            self.stdout.write(f'{own / 1000:9.1f}  {package}')
+
+        budget = options['budget']
+        if budget is not None:
+            if total_ms > budget:
+                raise CommandError(f'Import time {total_ms:.0f} ms is over the {budget:.0f} ms budget')
+            self.stdout.write(self.style.SUCCESS(f'\nWithin the {budget:.0f} ms budget.'))
+
+
+def parse_importtime(output):
+    """(module, self µs, cumulative µs) for every line of -X importtime output"""
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        if not own.strip().isdigit():
+            continue  # the header line
+        modules.append((name.strip(), int(own), int(cumulative)))
+    return modules
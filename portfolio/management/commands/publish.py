@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from portfolio import publishing
+from portfolio.tenancy import add_tenant_argument, command_tenant, use_tenant
+
+
+class Command(BaseCommand):
+    help = 'Publish a portfolio\'s current content as a new snapshot version for the public site'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--note', default='', help='Short description kept with the version')
+        parser.add_argument('--force', action='store_true', help='Publish even if nothing changed')
+        add_tenant_argument(parser)
+
+    def handle(self, *args, **options):
+        with use_tenant(command_tenant(options['tenant'])):
+            snapshot, created = publishing.publish(published_by='manage.py', note=options['note'],
+                                                   force=options['force'])
+        if not created:
+            self.stdout.write(f'Nothing changed since version {snapshot.version}.')
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f'Published version {snapshot.version} ({snapshot.size / 1024:.1f} KB of content).'
+        ))
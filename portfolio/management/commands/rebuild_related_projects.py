@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from portfolio import similarity
+from portfolio.tenancy import add_tenant_argument, command_tenant
+
+
+class Command(BaseCommand):
+    help = 'Recompute every project\'s related projects by TF-IDF similarity of their text and technologies'
+
+    def add_arguments(self, parser):
+        add_tenant_argument(parser, help='Rebuild only this tenant\'s projects (default: every tenant)')
+
+    def handle(self, *args, **options):
+        tenant_id = command_tenant(options['tenant']).pk if options['tenant'] else None
+        total = similarity.rebuild_related(tenant_id=tenant_id)
+        self.stdout.write(self.style.SUCCESS(f'Stored {total} related project link(s).'))
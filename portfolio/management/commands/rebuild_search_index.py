@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio import search
+
+
+class Command(BaseCommand):
+    help = ('Rebuild the SQLite FTS5 search indexes: the draft index from projects, certificates, skills and '
+            'experience, and the public index from every portfolio\'s latest published version')
+
+    def handle(self, *args, **options):
+        if not search.search_available():
+            raise CommandError('Full-text search requires the SQLite database backend')
+        search.create_index()
+        total = search.rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f'Indexed {total} draft document(s).'))
+        total = search.rebuild_published_index()
+        self.stdout.write(self.style.SUCCESS(f'Indexed {total} published document(s).'))
@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from portfolio.replica import refresh_snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        'Copy the primary SQLite database to the read-only snapshot that public pages read from. '
+        'Run it from cron, or keep it running with --interval.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval', type=float,
+            help='Keep refreshing every INTERVAL seconds instead of once'
+        )
+
+    def handle(self, *args, **options):
+        if connections[DEFAULT_DB_ALIAS].vendor != 'sqlite':
+            raise CommandError('refresh_replica requires the SQLite database backend')
+
+        interval = options['interval']
+        while True:
+            try:
+                snapshot = refresh_snapshot()
+            except ValueError as e:
+                raise CommandError(str(e))
+            self.stdout.write(self.style.SUCCESS(
+                f'Refreshed {snapshot.alias} snapshot ({snapshot.size / 1024 / 1024:.1f} MB) '
+                f'in {snapshot.duration:.2f}s.'
+            ))
+            if interval is None:
+                break
+            time.sleep(interval)
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from portfolio import social_cards
+from portfolio.models import Project
+from portfolio.tenancy import add_tenant_argument, command_tenants, use_tenant
+
+
+class Command(BaseCommand):
+    help = 'Render the Open Graph preview image of every project whose card is missing or out of date'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Re-render cards that are up to date too')
+        add_tenant_argument(parser, help='Render only this tenant\'s cards (default: every active tenant)')
+
+    def handle(self, *args, **options):
+        rendered = total = 0
+        for tenant in command_tenants(options['tenant']):
+            with use_tenant(tenant):
+                site = social_cards.site_name()
+                fields = ('pk', 'tenant', 'title', 'category', 'technologies', 'image', 'social_card')
+                for project in Project.objects.only(*fields):
+                    total += 1
+                    if social_cards.update_card(project, site, force=options['force']):
+                        rendered += 1
+        self.stdout.write(self.style.SUCCESS(f'Rendered {rendered} of {total} social card(s).'))
@@ -0,0 +1,128 @@
+import statistics
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connection, connections, transaction
+
+from portfolio.models import Certificate, ContactMessage, Project, Skill
+
+
+STRESS_SUBJECT = '[sqlite_stress]'
+WRITER_PAUSE = 0.05
+
+
+class Command(BaseCommand):
+    help = (
+        'Run contact-form writers against public-page readers on the SQLite database and '
+        'fail if any read waits on the write lock or any write hits "database is locked".'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seconds', type=float, default=5.0, help='How long to run (default 5)')
+        parser.add_argument('--readers', type=int, default=4, help='Reader threads (default 4)')
+        parser.add_argument('--writers', type=int, default=2, help='Writer threads (default 2)')
+        parser.add_argument(
+            '--batch', type=int, default=3000,
+            help='Messages inserted per write transaction (default 3000)'
+        )
+        parser.add_argument(
+            '--max-read-ms', type=float, default=250.0,
+            help='Slowest acceptable read in milliseconds (default 250)'
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError('sqlite_stress only applies to the SQLite database backend')
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA journal_mode')
+            journal_mode = cursor.fetchone()[0]
+        self.stdout.write(f'journal_mode={journal_mode}')
+
+        deadline = time.monotonic() + options['seconds']
+        reads, writes = [], []
+        read_errors, write_errors = [], []
+        threads = [
+            threading.Thread(target=self.run_thread, args=(self.read, deadline, reads, read_errors))
+            for _ in range(options['readers'])
+        ] + [
+            threading.Thread(
+                target=self.run_thread,
+                args=(self.write, deadline, writes, write_errors, options['batch']),
+            )
+            for _ in range(options['writers'])
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        ContactMessage.objects.filter(subject=STRESS_SUBJECT).delete()
+
+        self.report('reads', reads, read_errors)
+        self.report('writes', writes, write_errors)
+
+        problems = []
+        if read_errors or write_errors:
+            problems.append(f'{len(read_errors) + len(write_errors)} database error(s)')
+        if not reads:
+            problems.append('no reads completed')
+        elif max(reads) > options['max_read_ms']:
+            problems.append(f"slowest read took {max(reads):.1f} ms (limit {options['max_read_ms']:.0f} ms)")
+        if problems:
+            raise CommandError('; '.join(problems))
+        self.stdout.write(self.style.SUCCESS('Readers were never blocked by the writers.'))
+
+    def run_thread(self, work, deadline, timings, errors, *args):
+        """Call ``work`` until ``deadline`` on this thread's own connection"""
+        try:
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                try:
+                    work(*args)
+                except DatabaseError as e:
+                    errors.append(str(e))
+                    continue
+                timings.append((time.perf_counter() - started) * 1000)
+        finally:
+            connections.close_all()
+
+    def read(self):
+        """The queries behind the public pages, including the table being written"""
+        list(Project.objects.filter(featured=True)[:6])
+        list(Skill.objects.all()[:50])
+        Certificate.objects.count()
+        ContactMessage.objects.filter(read=False).count()
+
+    def write(self, batch):
+        """
+        A burst of ``batch`` contact form submissions in one transaction. The
+        default writes more than SQLite's default 2 MB page cache, so without
+        WAL the writer spills to the database file mid-transaction and holds
+        the exclusive lock that shuts readers out.
+        """
+        with transaction.atomic():
+            ContactMessage.objects.bulk_create(
+                ContactMessage(
+                    name='Stress Test',
+                    email='stress@example.com',
+                    subject=STRESS_SUBJECT,
+                    message='Concurrency check. ' * 100,
+                )
+                for _ in range(batch)
+            )
+        # Give the other writers a turn at the lock
+        time.sleep(WRITER_PAUSE)
+
+    def report(self, label, timings, errors):
+        if timings:
+            ordered = sorted(timings)
+            p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+            self.stdout.write(
+                f'{label}: {len(timings)} ok, {len(errors)} failed, '
+                f'median {statistics.median(ordered):.1f} ms, p99 {p99:.1f} ms, max {ordered[-1]:.1f} ms'
+            )
+        else:
+            self.stdout.write(f'{label}: 0 ok, {len(errors)} failed')
+        for message in sorted(set(errors))[:5]:
+            self.stdout.write(f'  {message}')
@@ -0,0 +1,124 @@
+import re
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import models
+
+from portfolio.fonts import FONTS_CSS, font_filename
+from portfolio.publishing import SNAPSHOT_MODELS
+
+
+TEMPLATE_SYNTAX = re.compile(r'{%.*?%}|{{.*?}}|{#.*?#}', re.S)
+NON_TEXT_BLOCKS = re.compile(r'<(style|script|svg)\b.*?</\1>', re.S | re.I)
+HTML_TAG = re.compile(r'<[^>]+>')
+
+# Always kept so small content edits don't fall back to the system font:
+# printable ASCII, Latin-1 letters and common typographic punctuation.
+BASELINE_TEXT = (
+    ''.join(chr(c) for c in range(0x20, 0x7F))
+    + ''.join(chr(c) for c in range(0xA0, 0x100))
+    + '‐‑–—‘’‚“”„†•…‰′″‹›€™→←↑↓✓'
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Subset the vendored fonts in FONT_SOURCE_DIR to the characters used by '
+        'the templates and database content, writing WOFF2 files and css/fonts.css'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--extra-text', default='',
+            help='Additional characters to keep in every subset'
+        )
+        parser.add_argument(
+            '--skip-database', action='store_true',
+            help='Only scan templates (e.g. when building without a database)'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            from fontTools import subset
+        except ImportError:
+            raise CommandError('fontTools is required: pip install fonttools brotli')
+
+        text = BASELINE_TEXT + options['extra_text'] + self.template_text()
+        if not options['skip_database']:
+            text += self.database_text()
+        codepoints = sorted({ord(char) for char in text if char.isprintable() or char == ' '})
+        self.stdout.write(f'Keeping {len(codepoints)} code points.')
+
+        static_dir = settings.STATICFILES_DIRS[0]
+        font_dir = static_dir / 'fonts'
+        font_dir.mkdir(parents=True, exist_ok=True)
+
+        faces = []
+        for font in settings.WEB_FONTS:
+            source = settings.FONT_SOURCE_DIR / font['file']
+            if not source.exists():
+                raise CommandError(f'Font source {source} not found')
+
+            subset_options = subset.Options()
+            subset_options.flavor = 'woff2'
+            subset_options.layout_features = ['*']
+            subset_options.name_IDs = ['*']
+            subset_options.notdef_outline = True
+
+            ttfont = subset.load_font(str(source), subset_options)
+            subsetter = subset.Subsetter(subset_options)
+            subsetter.populate(unicodes=codepoints)
+            subsetter.subset(ttfont)
+
+            output = font_dir / font_filename(font)
+            subset.save_font(ttfont, str(output), subset_options)
+            self.stdout.write(
+                f"{font['family']} {font.get('weight', '400')}: "
+                f'{source.stat().st_size:,} -> {output.stat().st_size:,} bytes'
+            )
+            faces.append(self.font_face(font))
+
+        css_path = static_dir / FONTS_CSS
+        css_path.write_text(
+            '/* Generated by `manage.py subset_fonts` - do not edit by hand */\n\n'
+            + '\n\n'.join(faces) + '\n',
+            encoding='utf-8',
+        )
+        self.stdout.write(self.style.SUCCESS(f'Wrote {len(faces)} font face(s) to {css_path}'))
+
+    def template_text(self):
+        chunks = []
+        template_dir = settings.BASE_DIR / 'portfolio' / 'templates'
+        for path in template_dir.rglob('*.html'):
+            source = path.read_text(encoding='utf-8')
+            source = NON_TEXT_BLOCKS.sub(' ', TEMPLATE_SYNTAX.sub(' ', source))
+            chunks.append(HTML_TAG.sub(' ', source))
+        return ''.join(chunks)
+
+    def database_text(self):
+        chunks = []
+        for model in map(apps.get_model, SNAPSHOT_MODELS):
+            fields = [
+                field.name for field in model._meta.get_fields()
+                if isinstance(field, (models.CharField, models.TextField))
+                and not isinstance(field, (models.URLField, models.EmailField))
+                and not field.choices
+                and field.name != 'custom_svg'
+            ]
+            if not fields:
+                continue
+            for row in model.objects.values_list(*fields).iterator():
+                chunks.extend(HTML_TAG.sub(' ', value) for value in row if value)
+        return ''.join(chunks)
+
+    def font_face(self, font):
+        return (
+            '@font-face {\n'
+            f"    font-family: '{font['family']}';\n"
+            f"    font-style: {font.get('style', 'normal')};\n"
+            f"    font-weight: {font.get('weight', '400')};\n"
+            '    font-display: swap;\n'
+            f"    src: url('../fonts/{font_filename(font)}') format('woff2');\n"
+            '}'
+        )
@@ -0,0 +1,390 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+from urllib.parse import urlparse
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.auth import middleware as auth
+from django.contrib.messages import middleware as messages
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.cache import cache
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, HttpResponseNotFound, HttpResponseNotModified
+from django.middleware import clickjacking, common, csrf, security
+from django.utils._os import safe_join
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+from . import tenancy
+from .storage import brotli
+
+
+class InlineHooksMixin:
+    """
+    Run a MiddlewareMixin's process_request and process_response directly on
+    the event loop under ASGI. Django otherwise hands each hook to a worker
+    thread, two thread switches per middleware per request. Only for
+    middleware whose hooks never block on I/O; WSGI behaviour is unchanged.
+    """
+
+    async def __acall__(self, request):
+        response = None
+        if hasattr(self, 'process_request'):
+            response = self.process_request(request)
+        response = response or await self.get_response(request)
+        if hasattr(self, 'process_response'):
+            response = self.process_response(request, response)
+        return response
+
+
+class SecurityMiddleware(InlineHooksMixin, security.SecurityMiddleware):
+    pass
+
+
+class CommonMiddleware(InlineHooksMixin, common.CommonMiddleware):
+    pass
+
+
+class CsrfViewMiddleware(InlineHooksMixin, csrf.CsrfViewMiddleware):
+    """The token lives in a cookie (CSRF_USE_SESSIONS is off), so no I/O"""
+
+
+class AuthenticationMiddleware(InlineHooksMixin, auth.AuthenticationMiddleware):
+    """Only attaches a lazy user; loading it is left to whoever asks"""
+
+
+class MessageMiddleware(InlineHooksMixin, messages.MessageMiddleware):
+    """Messages are stored in a signed cookie (see MESSAGE_STORAGE)"""
+
+
+class XFrameOptionsMiddleware(InlineHooksMixin, clickjacking.XFrameOptionsMiddleware):
+    pass
+
+
+class TenantMiddleware:
+    """
+    Serve the request for the tenant its host belongs to (see tenancy.py),
+    which is current until the response is returned. Hosts without a tenant
+    get a 404. Under ASGI a host that was looked up recently is resolved
+    without leaving the event loop.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        tenant = tenancy.tenant_for_host(request.get_host())
+        if tenant is None:
+            return self.not_found()
+        request.tenant = tenant
+        with tenancy.use_tenant(tenant):
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        host = request.get_host()
+        tenant = tenancy.cached_tenant_for_host(host)
+        if tenant is tenancy.MISSING:
+            tenant = await sync_to_async(tenancy.tenant_for_host)(host)
+        if tenant is None:
+            return self.not_found()
+        request.tenant = tenant
+        with tenancy.use_tenant(tenant):
+            return await self.get_response(request)
+
+    def not_found(self):
+        return HttpResponseNotFound('No portfolio is served on this host.', content_type='text/plain; charset=utf-8')
+
+
+class PublicSessionMiddleware(SessionMiddleware):
+    """
+    Session middleware with a fast path for anonymous visitors.
+
+    A safe request without a session cookie can never carry session data, and
+    its session store is never loaded from the database. Unless the view
+    writes to it (e.g. an admin login), the response is returned untouched:
+    no session save, no cookie and no ``Vary: Cookie``, which keeps public
+    pages cacheable by browsers and shared caches.
+    """
+
+    SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+    def process_request(self, request):
+        super().process_request(request)
+        request.session_fast_path = (
+            request.method in self.SAFE_METHODS
+            and settings.SESSION_COOKIE_NAME not in request.COOKIES
+        )
+
+    def process_response(self, request, response):
+        if self.can_skip_save(request):
+            return response
+        return super().process_response(request, response)
+
+    async def __acall__(self, request):
+        # Attaching the lazy session store does no I/O, and neither does a
+        # fast-path response; only saving a session needs a worker thread
+        self.process_request(request)
+        response = await self.get_response(request)
+        if self.can_skip_save(request):
+            return response
+        return await sync_to_async(super().process_response)(request, response)
+
+    def can_skip_save(self, request):
+        if not getattr(request, 'session_fast_path', False):
+            return False
+        session = request.session
+        return not (session.modified or settings.SESSION_SAVE_EVERY_REQUEST) or session.is_empty()
+
+
+def parse_accept_encoding(header):
+    """
+    {coding: q-value} from an Accept-Encoding header. Codings are lowercased,
+    ``x-gzip`` counts as ``gzip``, and a malformed q-value counts as 0.
+    """
+    qvalues = {}
+    for item in header.split(','):
+        coding, *params = [part.strip() for part in item.split(';')]
+        if not coding:
+            continue
+        coding = coding.lower()
+        if coding == 'x-gzip':
+            coding = 'gzip'
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding] = max(q, qvalues.get(coding, 0.0))
+    return qvalues
+
+
+def accepts_encoding(qvalues, encoding):
+    """Whether the client takes ``encoding``, by name or through ``*``; q=0 means not acceptable"""
+    return qvalues.get(encoding, qvalues.get('*', 0.0)) > 0
+
+
+class StaticFilesMiddleware:
+    """
+    Serve collected static files straight from STATIC_ROOT.
+
+    Picks the smallest encoding the client accepts from the precompressed
+    ``.br``/``.gz`` siblings written by collectstatic, and marks content-hashed
+    names as immutable so browsers never revalidate them. This keeps static
+    delivery efficient on hosts without a front web server doing the same job.
+    Requests for files that were not collected fall through to the URLconf.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    HASHED_NAME = re.compile(r'\.[0-9a-f]{12}\.[^./]+$')
+    ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+    IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+    MUTABLE_MAX_AGE = 60 * 60
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.static_url = urlparse(settings.STATIC_URL).path
+        if not self.static_url.startswith('/'):
+            self.static_url = '/' + self.static_url
+        self.static_root = settings.STATIC_ROOT
+        # url path -> {encoding: (filesystem path, size, mtime)}, for collected files only
+        self.files = {}
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.static_response(request)
+        if response is None:
+            response = self.get_response(request)
+        return response
+
+    async def __acall__(self, request):
+        response = self.static_response(request)
+        if response is None:
+            response = await self.get_response(request)
+        return response
+
+    def static_response(self, request):
+        """The collected file for a static URL, or None to pass the request on"""
+        if (
+            self.static_root
+            and request.method in ('GET', 'HEAD')
+            and request.path_info.startswith(self.static_url)
+        ):
+            variants = self.find_variants(request.path_info)
+            if variants:
+                return self.serve(request, variants)
+        return None
+
+    def find_variants(self, url_path):
+        if url_path in self.files:
+            return self.files[url_path]
+
+        try:
+            path = safe_join(self.static_root, url_path[len(self.static_url):])
+        except SuspiciousFileOperation:
+            return None
+        # Misses aren't remembered: the set of URLs a client can ask for is unbounded
+        if not os.path.isfile(path):
+            return None
+        variants = {}
+        for encoding, suffix in (('identity', ''),) + self.ENCODINGS:
+            try:
+                stat = os.stat(path + suffix)
+            except OSError:
+                continue
+            variants[encoding] = (path + suffix, stat.st_size, stat.st_mtime)
+        self.files[url_path] = variants
+        return variants
+
+    def serve(self, request, variants):
+        original_path, _, mtime = variants['identity']
+        accepted = parse_accept_encoding(request.headers.get('Accept-Encoding', ''))
+        choices = [
+            (variants[encoding][1], encoding)
+            for encoding, _ in self.ENCODINGS
+            if encoding in variants and accepts_encoding(accepted, encoding)
+        ]
+        encoding = min(choices)[1] if choices else 'identity'
+
+        if not was_modified_since(request.headers.get('If-Modified-Since'), int(mtime)):
+            response = HttpResponseNotModified()
+        else:
+            path = variants[encoding][0]
+            content_type, _ = mimetypes.guess_type(original_path)
+            response = FileResponse(
+                open(path, 'rb'),
+                content_type=content_type or 'application/octet-stream',
+                filename=os.path.basename(original_path),
+            )
+            if encoding != 'identity':
+                response['Content-Encoding'] = encoding
+
+        response['Last-Modified'] = http_date(mtime)
+        if len(variants) > 1:
+            patch_vary_headers(response, ('Accept-Encoding',))
+        if self.HASHED_NAME.search(original_path):
+            response['Cache-Control'] = f'public, max-age={self.IMMUTABLE_MAX_AGE}, immutable'
+        else:
+            response['Cache-Control'] = f'public, max-age={self.MUTABLE_MAX_AGE}'
+        return response
+
+
+class CompressionMiddleware:
+    """
+    Brotli/gzip compression for dynamic responses.
+
+    Compressed bodies of shareable responses are cached under the encoding
+    and a digest of the uncompressed body, so an identical page is compressed
+    once instead of once per request.
+    Responses that set cookies or vary on them (e.g. pages with a CSRF token)
+    are still compressed, just not cached.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    COMPRESSIBLE_TYPES = re.compile(
+        r'^(text/|application/(json|xml|javascript|atom\+xml|rss\+xml)|image/svg\+xml)'
+    )
+    MIN_LENGTH = 200
+    CACHE_TIMEOUT = 60 * 60 * 24
+    BROTLI_QUALITY = 6
+    GZIP_LEVEL = 6
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        # The sync code path runs on the event loop. It does no version lookup:
+        # the cache key is the body's digest. A body this worker compressed
+        # recently is a memory hit; otherwise the lookup reads one file from
+        # the shared tier, or compresses, which blocks the loop briefly.
+        return self.process_response(request, await self.get_response(request))
+
+    def process_response(self, request, response):
+        if not self.is_compressible(response):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = self.choose_encoding(request)
+        if encoding is None:
+            return response
+
+        content = response.content
+        if self.is_shareable(request, response):
+            digest = hashlib.md5(content, usedforsecurity=False).hexdigest()
+            # The digest names the body exactly; the entry is valid for as long as it's kept
+            key = f'portfolio:compressed:{encoding}:{digest}'
+            compressed = cache.get(key)
+            if compressed is None:
+                compressed = self.compress(content, encoding)
+                cache.set(key, compressed, self.CACHE_TIMEOUT)
+        else:
+            compressed = self.compress(content, encoding)
+
+        if len(compressed) >= len(content):
+            return response
+
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encoding
+        # Compressed and uncompressed bodies must not share a strong ETag
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        return response
+
+    def is_compressible(self, response):
+        return not (
+            response.streaming
+            or response.status_code != 200
+            or response.has_header('Content-Encoding')
+            or not self.COMPRESSIBLE_TYPES.match(response.get('Content-Type', ''))
+            or len(response.content) < self.MIN_LENGTH
+        )
+
+    def choose_encoding(self, request):
+        accepted = parse_accept_encoding(request.headers.get('Accept-Encoding', ''))
+        if brotli is not None and accepts_encoding(accepted, 'br'):
+            return 'br'
+        if accepts_encoding(accepted, 'gzip'):
+            return 'gzip'
+        return None
+
+    def is_shareable(self, request, response):
+        return (
+            request.method in ('GET', 'HEAD')
+            and not response.cookies
+            and 'cookie' not in response.get('Vary', '').lower()
+            and 'private' not in response.get('Cache-Control', '')
+        )
+
+    def compress(self, content, encoding):
+        if encoding == 'br':
+            return brotli.compress(content, quality=self.BROTLI_QUALITY)
+        return gzip.compress(content, compresslevel=self.GZIP_LEVEL, mtime=0)
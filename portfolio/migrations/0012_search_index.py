@@ -0,0 +1,60 @@
+from django.db import migrations
+from django.utils.html import strip_tags
+
+
+# The index as this migration created it; later migrations change it. Kept
+# here rather than imported from portfolio.search, which describes the
+# current schema.
+SEARCH_TABLE = 'portfolio_search'
+
+# kind -> (code, model name, title field, body fields)
+SEARCH_DOCUMENTS = {
+    'project': (1, 'Project', 'title', ('description', 'detailed_description', 'technologies', 'key_achievements')),
+    'certificate': (2, 'Certificate', 'certificate_name', ('issuing_organization', 'credential_id', 'description')),
+    'skill': (3, 'Skill', 'name', ('category',)),
+    'experience': (4, 'Experience', 'position', ('company', 'location', 'description', 'achievements')),
+}
+KIND_BITS = 3
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    db = schema_editor.connection.alias
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5('
+            "kind UNINDEXED, object_id UNINDEXED, title, body, tokenize = 'porter unicode61')"
+        )
+        for kind, (code, model_name, title_field, body_fields) in SEARCH_DOCUMENTS.items():
+            model = apps.get_model('portfolio', model_name)
+            rows = [
+                (
+                    (values['pk'] << KIND_BITS) | code, kind, values['pk'], values[title_field] or '',
+                    '\n'.join(strip_tags(values[field] or '') for field in body_fields),
+                )
+                for values in model.objects.using(db).values('pk', title_field, *body_fields)
+            ]
+            cursor.executemany(
+                f'INSERT OR REPLACE INTO {SEARCH_TABLE} (rowid, kind, object_id, title, body) '
+                'VALUES (%s, %s, %s, %s, %s)',
+                rows,
+            )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'DROP TABLE IF EXISTS {SEARCH_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0011_education_certificate_image'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-19 05:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0012_search_index'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='contactmessage',
+            options={'ordering': ['-created_at', '-id']},
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['-created_at', '-id'], name='contact_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(condition=models.Q(('read', False)), fields=['-created_at', '-id'], name='contact_unread_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.9 on 2026-10-19 05:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0013_contact_message_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExportWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text="Export consumer, e.g. 'crm'", max_length=100, unique=True)),
+                ('dataset', models.CharField(max_length=50)),
+                ('last_created_at', models.DateTimeField()),
+                ('last_id', models.PositiveIntegerField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+    ]
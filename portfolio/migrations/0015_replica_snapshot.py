@@ -0,0 +1,27 @@
+# Generated by Django 5.2.9 on 2026-10-19 05:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0014_export_watermark'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReplicaSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.CharField(max_length=100, unique=True)),
+                ('refreshed_at', models.DateTimeField(help_text='When the copy of the primary was taken')),
+                ('duration', models.FloatField(help_text='Seconds the backup took')),
+                ('size', models.BigIntegerField(help_text='Snapshot file size in bytes')),
+                ('content_version', models.BigIntegerField(help_text='Content version the snapshot is current with')),
+            ],
+            options={
+                'ordering': ['alias'],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.9 on 2026-10-19 06:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0015_replica_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PageViewCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('page', models.CharField(help_text="URL name of the page, e.g. 'project_detail'", max_length=50)),
+                ('object_id', models.PositiveBigIntegerField(default=0, help_text='Project shown on detail pages, 0 elsewhere')),
+                ('day', models.DateField()),
+                ('views', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['-day', 'page', 'object_id'],
+                'constraints': [models.UniqueConstraint(fields=('page', 'object_id', 'day'), name='pageview_page_day_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.9 on 2026-10-19 06:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from portfolio import similarity
+
+
+def compute_related(apps, schema_editor):
+    similarity.rebuild_related(apps.get_model, using=schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0016_page_view_counter'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedProject',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField(help_text='1 is the most similar')),
+                ('score', models.FloatField(help_text="Cosine similarity of the projects' TF-IDF vectors")),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similar', to='portfolio.project')),
+                ('related', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similar_to', to='portfolio.project')),
+            ],
+            options={
+                'ordering': ['project', 'rank'],
+                'constraints': [models.UniqueConstraint(fields=('project', 'rank'), name='related_project_rank_unique')],
+            },
+        ),
+        migrations.RunPython(compute_related, migrations.RunPython.noop),
+    ]
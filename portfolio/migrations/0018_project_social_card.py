@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-19 06:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0017_related_project'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='social_card',
+            field=models.ImageField(blank=True, editable=False, help_text='Open Graph preview image, rendered by social_cards.py', upload_to='projects/cards/'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.9 on 2026-10-19 06:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0018_project_social_card'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GeneratedResume',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fingerprint', models.CharField(help_text='Hash of the content it was rendered from', max_length=64)),
+                ('filename', models.CharField(help_text='Download name of the PDF', max_length=200)),
+                ('pdf', models.FileField(upload_to='resumes/generated/')),
+                ('html', models.FileField(upload_to='resumes/generated/')),
+                ('built_at', models.DateTimeField()),
+                ('duration', models.FloatField(help_text='Seconds the build took')),
+            ],
+            options={
+                'verbose_name': 'Generated résumé',
+                'verbose_name_plural': 'Generated résumé',
+            },
+        ),
+        migrations.AlterField(
+            model_name='about',
+            name='resume',
+            field=models.FileField(blank=True, help_text='Optional: linked instead of the résumé generated from your experience, education, skills and certificates', null=True, upload_to='resumes/'),
+        ),
+    ]
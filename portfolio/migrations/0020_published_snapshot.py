@@ -0,0 +1,40 @@
+# Generated by Django 5.2.9 on 2026-10-19 06:18
+
+from django.db import migrations, models
+
+from portfolio import publishing
+
+
+def publish_existing_content(apps, schema_editor):
+    # Keep the site showing what it showed before the draft/publish split
+    publishing.create_snapshot(apps.get_model, using=schema_editor.connection.alias, note='Initial version')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0019_generated_resume'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PublishedSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField(unique=True)),
+                ('digest', models.CharField(help_text='SHA-256 of the uncompressed payload', max_length=64)),
+                ('payload', models.BinaryField(help_text='zlib-compressed JSON of every published row')),
+                ('size', models.PositiveIntegerField(help_text='Uncompressed payload size in bytes')),
+                ('counts', models.JSONField(default=dict, help_text='Published rows per model')),
+                ('published_at', models.DateTimeField()),
+                ('published_by', models.CharField(blank=True, max_length=150)),
+                ('note', models.CharField(blank=True, max_length=200)),
+            ],
+            options={
+                'verbose_name': 'Published snapshot',
+                'verbose_name_plural': 'Published snapshots',
+                'ordering': ['-version'],
+            },
+        ),
+        migrations.RunPython(publish_existing_content, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,223 @@
+# Generated by Django 5.2.9 on 2026-10-19 06:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.core.management.color import no_style
+from django.db import migrations, models
+
+
+SEARCH_TABLE = 'portfolio_search'
+
+
+def create_default_tenant(apps, schema_editor):
+    """Everything that exists so far belongs to the portfolio this site already serves"""
+    Tenant = apps.get_model('portfolio', 'Tenant')
+    About = apps.get_model('portfolio', 'About')
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    db = schema_editor.connection.alias
+
+    about = About.objects.using(db).first()
+    hosts = [host.lstrip('.') for host in settings.ALLOWED_HOSTS if host.lstrip('.') not in ('', '*')]
+    tenant = Tenant.objects.using(db).create(
+        pk=1, slug='default', name=about.name if about else 'Default',
+        domain=hosts[0].lower() if hosts else 'localhost',
+    )
+    # The explicit pk leaves PostgreSQL's sequence behind
+    with schema_editor.connection.cursor() as cursor:
+        for sql in schema_editor.connection.ops.sequence_reset_sql(no_style(), [Tenant]):
+            cursor.execute(sql)
+    tenant.members.set(User.objects.using(db).filter(is_staff=True, is_superuser=False))
+
+
+def copy_search_index(schema_editor, columns, tenant=None):
+    """
+    Re-create the index with ``columns`` (FTS5 tables can't be altered) and
+    copy every row across, with ``tenant`` as the new tenant column's token.
+    """
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    copied = 'rowid, kind, object_id, title, body'
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'ALTER TABLE {SEARCH_TABLE} RENAME TO {SEARCH_TABLE}_old')
+        cursor.execute(
+            f'CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5('
+            f"kind UNINDEXED, object_id UNINDEXED, {columns}, tokenize = 'porter unicode61')"
+        )
+        if tenant is None:
+            cursor.execute(f'INSERT INTO {SEARCH_TABLE} ({copied}) SELECT {copied} FROM {SEARCH_TABLE}_old')
+        else:
+            cursor.execute(
+                f'INSERT INTO {SEARCH_TABLE} ({copied}, tenant) SELECT {copied}, %s FROM {SEARCH_TABLE}_old',
+                [tenant],
+            )
+        cursor.execute(f'DROP TABLE {SEARCH_TABLE}_old')
+
+
+def index_with_tenants(apps, schema_editor):
+    # Every row so far belongs to the default tenant created above
+    copy_search_index(schema_editor, 'title, body, tenant', tenant='t1')
+
+
+def index_without_tenants(apps, schema_editor):
+    copy_search_index(schema_editor, 'title, body')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0020_published_snapshot'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tenant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('slug', models.SlugField(help_text="Short name used by management commands' --tenant", unique=True)),
+                ('name', models.CharField(help_text='For the admin; the site shows the About name', max_length=200)),
+                ('domain', models.CharField(help_text='Host the portfolio is served on, e.g. jane.example.com (no scheme or port)', max_length=253, unique=True)),
+                ('contact_email', models.EmailField(blank=True, help_text='Where contact form messages go; CONTACT_EMAIL if blank', max_length=254)),
+                ('is_active', models.BooleanField(default=True, help_text='Inactive portfolios answer 404')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['slug'],
+            },
+        ),
+        migrations.RemoveConstraint(
+            model_name='pageviewcounter',
+            name='pageview_page_day_unique',
+        ),
+        migrations.RemoveIndex(
+            model_name='contactmessage',
+            name='contact_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='contactmessage',
+            name='contact_unread_idx',
+        ),
+        migrations.RemoveField(
+            model_name='replicasnapshot',
+            name='content_version',
+        ),
+        migrations.AlterField(
+            model_name='exportwatermark',
+            name='name',
+            field=models.CharField(help_text="Export consumer, e.g. 'crm'", max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='publishedsnapshot',
+            name='version',
+            field=models.PositiveIntegerField(),
+        ),
+        migrations.AddField(
+            model_name='tenant',
+            name='members',
+            field=models.ManyToManyField(blank=True, help_text='Staff users who manage this portfolio in its admin', related_name='tenants', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(create_default_tenant, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='about',
+            name='tenant',
+            field=models.ForeignKey(default=1, editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='portfolio.tenant'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='certificate',
+            name='tenant',
+            field=models.ForeignKey(default=1, editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='portfolio.tenant'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='contactmessage',
+            name='tenant',
+            field=models.ForeignKey(default=1, editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='portfolio.tenant'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='education',
+            name='tenant',
+            field=models.ForeignKey(default=1, editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='portfolio.tenant'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='experience',
+            name='tenant',
+            field=models.ForeignKey(default=1, editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='portfolio.tenant'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='exportwatermark',
+            name='tenant',
+            field=models.ForeignKey(default=1, editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='portfolio.tenant'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='generatedresume',
+            name='tenant',
+            field=models.ForeignKey(default=1, editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='portfolio.tenant'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='pageviewcounter',
+            name='tenant',
+            field=models.ForeignKey(default=1, editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='portfolio.tenant'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='tenant',
+            field=models.ForeignKey(default=1, editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='portfolio.tenant'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='projectimage',
+            name='tenant',
+            field=models.ForeignKey(default=1, editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='portfolio.tenant'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='publishedsnapshot',
+            name='tenant',
+            field=models.ForeignKey(default=1, editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='portfolio.tenant'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='relatedproject',
+            name='tenant',
+            field=models.ForeignKey(default=1, editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='portfolio.tenant'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='skill',
+            name='tenant',
+            field=models.ForeignKey(default=1, editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='portfolio.tenant'),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['tenant', '-created_at', '-id'], name='contact_tenant_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(condition=models.Q(('read', False)), fields=['tenant', '-created_at', '-id'], name='contact_tenant_unread_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='exportwatermark',
+            constraint=models.UniqueConstraint(fields=('tenant', 'name'), name='export_watermark_tenant_name_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='generatedresume',
+            constraint=models.UniqueConstraint(fields=('tenant',), name='generated_resume_tenant_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='pageviewcounter',
+            constraint=models.UniqueConstraint(fields=('tenant', 'page', 'object_id', 'day'), name='pageview_tenant_page_day_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='publishedsnapshot',
+            constraint=models.UniqueConstraint(fields=('tenant', 'version'), name='published_tenant_version_unique'),
+        ),
+        migrations.RunPython(index_with_tenants, index_without_tenants),
+    ]
@@ -0,0 +1,77 @@
+import json
+import zlib
+
+from django.db import migrations
+from django.utils.html import strip_tags
+
+
+# The index as this migration created it, kept here rather than imported
+# from portfolio.search, which describes the current schema.
+PUBLISHED_SEARCH_TABLE = 'portfolio_published_search'
+
+# kind -> (code, serialized model label, title field, body fields)
+SEARCH_DOCUMENTS = {
+    'project': (1, 'portfolio.project', 'title',
+                ('description', 'detailed_description', 'technologies', 'key_achievements')),
+    'certificate': (2, 'portfolio.certificate', 'certificate_name',
+                    ('issuing_organization', 'credential_id', 'description')),
+    'skill': (3, 'portfolio.skill', 'name', ('category',)),
+    'experience': (4, 'portfolio.experience', 'position',
+                   ('company', 'location', 'description', 'achievements')),
+}
+KIND_BITS = 3
+
+
+def create_published_index(apps, schema_editor):
+    """Index every tenant's latest published snapshot, the way publishing it again would"""
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    Tenant = apps.get_model('portfolio', 'Tenant')
+    PublishedSnapshot = apps.get_model('portfolio', 'PublishedSnapshot')
+    db = schema_editor.connection.alias
+    kinds = {label: (kind, code, title_field, body_fields)
+             for kind, (code, label, title_field, body_fields) in SEARCH_DOCUMENTS.items()}
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS {PUBLISHED_SEARCH_TABLE} USING fts5('
+            "kind UNINDEXED, object_id UNINDEXED, title, body, tenant, tokenize = 'porter unicode61')"
+        )
+        for tenant_id in Tenant.objects.using(db).values_list('pk', flat=True):
+            latest = PublishedSnapshot.objects.using(db).filter(tenant_id=tenant_id).order_by('-version').first()
+            if latest is None:
+                continue
+            documents = []
+            for row in json.loads(zlib.decompress(latest.payload)):
+                if row['model'] not in kinds:
+                    continue
+                kind, code, title_field, body_fields = kinds[row['model']]
+                fields = row['fields']
+                documents.append((
+                    (row['pk'] << KIND_BITS) | code, kind, row['pk'], fields.get(title_field) or '',
+                    '\n'.join(strip_tags(fields.get(field) or '') for field in body_fields),
+                    f't{tenant_id}',
+                ))
+            cursor.executemany(
+                f'INSERT OR REPLACE INTO {PUBLISHED_SEARCH_TABLE} (rowid, kind, object_id, title, body, tenant) '
+                'VALUES (%s, %s, %s, %s, %s, %s)',
+                documents,
+            )
+
+
+def drop_published_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'DROP TABLE IF EXISTS {PUBLISHED_SEARCH_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0021_tenants'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_published_index, drop_published_index),
+    ]
@@ -0,0 +1,159 @@
+"""
+Buffered page-view counting.
+
+Public views wrapped in ``@counts_views`` add one to an in-memory counter per
+successful GET; nothing touches the database on the request path. A
+background thread in each worker process flushes the buffer every
+PAGE_VIEW_FLUSH_INTERVAL seconds as one batch of upserts into
+PageViewCounter (``views = views + ?``), in a single transaction.
+
+Because every flush adds to the stored count instead of overwriting it, any
+number of worker processes can flush into the same rows without a lost
+update. A worker that is killed outright loses at most one interval of its
+own views; a normal shutdown flushes what is left.
+"""
+import atexit
+import logging
+import os
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections, transaction
+from django.utils import timezone
+
+from .tenancy import current_tenant_id
+
+
+logger = logging.getLogger(__name__)
+
+_counting = ContextVar('portfolio_counting_views', default=True)
+
+# (tenant_id, page, object_id, day) -> views not yet written
+_pending = Counter()
+_lock = threading.Lock()
+_flusher = None
+_stop = threading.Event()
+
+
+def flush_interval():
+    return getattr(settings, 'PAGE_VIEW_FLUSH_INTERVAL', 10)
+
+
+def record(page, object_id=0):
+    """Count one view of the current tenant's ``page``; only touches memory"""
+    tenant_id = current_tenant_id()
+    if not _counting.get() or tenant_id is None:
+        return
+    key = (tenant_id, page, object_id, timezone.localdate())
+    with _lock:
+        _pending[key] += 1
+    if _flusher is None:
+        start_flusher()
+
+
+@contextmanager
+def not_counted():
+    """Requests made inside the block (e.g. worker warmup) aren't counted"""
+    token = _counting.set(False)
+    try:
+        yield
+    finally:
+        _counting.reset(token)
+
+
+def counts_views(view):
+    """Record a view of the page for every GET the view answers with 200"""
+    def count(request, kwargs, response):
+        if request.method == 'GET' and response.status_code == 200:
+            page = getattr(request.resolver_match, 'url_name', None) or view.__name__
+            record(page, int(kwargs.get('pk', 0)))
+        return response
+
+    if iscoroutinefunction(view):
+        async def wrapper(request, *args, **kwargs):
+            return count(request, kwargs, await view(request, *args, **kwargs))
+    else:
+        def wrapper(request, *args, **kwargs):
+            return count(request, kwargs, view(request, *args, **kwargs))
+    return wraps(view)(wrapper)
+
+
+def flush():
+    """
+    Write the buffered counts to the primary database; returns the number of
+    rows touched. If the write fails the counts go back into the buffer for
+    the next flush.
+    """
+    from .models import PageViewCounter
+
+    global _pending
+    with _lock:
+        batch, _pending = _pending, Counter()
+    if not batch:
+        return 0
+
+    connection = connections[DEFAULT_DB_ALIAS]
+    qn = connection.ops.quote_name
+    sql = (
+        f'INSERT INTO {qn(PageViewCounter._meta.db_table)} '
+        f'({qn("tenant_id")}, {qn("page")}, {qn("object_id")}, {qn("day")}, {qn("views")}) '
+        f'VALUES (%s, %s, %s, %s, %s) '
+        f'ON CONFLICT ({qn("tenant_id")}, {qn("page")}, {qn("object_id")}, {qn("day")}) '
+        f'DO UPDATE SET {qn("views")} = {qn("views")} + excluded.{qn("views")}'
+    )
+    rows = [
+        (tenant_id, page, object_id, day.isoformat(), views)
+        for (tenant_id, page, object_id, day), views in batch.items()
+    ]
+    try:
+        with transaction.atomic(using=DEFAULT_DB_ALIAS), connection.cursor() as cursor:
+            cursor.executemany(sql, rows)
+    except Exception:
+        with _lock:
+            _pending.update(batch)
+        raise
+    return len(rows)
+
+
+def run_flusher():
+    while not _stop.wait(flush_interval()):
+        # Honour CONN_MAX_AGE and drop broken connections, like a request would
+        close_old_connections()
+        try:
+            flush()
+        except Exception:
+            logger.exception('Flushing page views failed; will retry')
+    connections.close_all()
+
+
+def start_flusher():
+    global _flusher
+    with _lock:
+        if _flusher is not None:
+            return
+        _flusher = threading.Thread(target=run_flusher, name='pageview-flusher', daemon=True)
+        _flusher.start()
+
+
+def flush_at_exit():
+    _stop.set()
+    try:
+        flush()
+    except Exception:
+        logger.exception('Flushing page views at exit failed')
+
+
+def _reset_after_fork():
+    """A forked worker starts with an empty buffer and its own flusher"""
+    global _pending, _flusher, _lock, _stop
+    _pending, _flusher, _lock, _stop = Counter(), None, threading.Lock(), threading.Event()
+
+
+atexit.register(flush_at_exit)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,207 @@
+"""
+A small PDF writer for text documents, used for the generated résumé.
+
+Only what a one- or two-page text document needs: the built-in Helvetica
+fonts (no embedding, so files stay a few KB), word wrapping against the
+fonts' real glyph widths, bullets, rules, colour and automatic page breaks.
+Text is encoded as WinAnsi (cp1252); characters outside it print as '?'.
+Output is deterministic: the same calls always produce the same bytes.
+"""
+import zlib
+
+
+A4 = (595.28, 841.89)
+
+FONTS = {
+    'regular': ('F1', 'Helvetica'),
+    'bold': ('F2', 'Helvetica-Bold'),
+    'italic': ('F3', 'Helvetica-Oblique'),
+}
+
+# Glyph widths (1/1000 em) for cp1252 bytes 32-126, from the standard AFM files
+_HELVETICA_WIDTHS = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+]
+_HELVETICA_BOLD_WIDTHS = [
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+]
+# A few cp1252 punctuation marks above 126; other accented letters are close to 556
+_EXTRA_WIDTHS = {0x91: 222, 0x92: 222, 0x93: 333, 0x94: 333, 0x95: 350, 0x96: 556, 0x97: 1000, 0xB7: 278}
+WIDTHS = {
+    'regular': _HELVETICA_WIDTHS,
+    'bold': _HELVETICA_BOLD_WIDTHS,
+    'italic': _HELVETICA_WIDTHS,
+}
+
+
+def encode(text):
+    return text.encode('cp1252', errors='replace')
+
+
+def escape(data):
+    return data.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+
+
+def text_width(text, font, size):
+    widths = WIDTHS[font]
+    total = 0
+    for byte in encode(text):
+        if 32 <= byte <= 126:
+            total += widths[byte - 32]
+        else:
+            total += _EXTRA_WIDTHS.get(byte, 556)
+    return total * size / 1000
+
+
+def wrap(text, font, size, width):
+    """Split ``text`` into lines no wider than ``width`` points"""
+    lines = []
+    for paragraph in text.splitlines() or ['']:
+        line = ''
+        for word in paragraph.split():
+            candidate = f'{line} {word}' if line else word
+            if line and text_width(candidate, font, size) > width:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+    return lines
+
+
+class PdfDocument:
+    """
+    Flowing text laid out top to bottom. Call ``text``, ``bullet``, ``rule``
+    and ``space`` in reading order, then ``render`` for the file's bytes.
+    """
+
+    def __init__(self, title='', author='', page_size=A4, margin=50):
+        self.title = title
+        self.author = author
+        self.page_width, self.page_height = page_size
+        self.margin = margin
+        self.width = self.page_width - 2 * margin
+        self.pages = []
+        self.new_page()
+
+    def new_page(self):
+        self.pages.append([])
+        self.y = self.page_height - self.margin
+
+    def ensure_space(self, height):
+        if self.y - height < self.margin:
+            self.new_page()
+
+    def draw_text(self, x, y, text, font, size, color):
+        name = FONTS[font][0]
+        self.pages[-1].append(
+            b'BT %.3f %.3f %.3f rg /%s %.1f Tf %.2f %.2f Td (%s) Tj ET'
+            % (*color, name.encode(), size, x, y, escape(encode(text)))
+        )
+
+    def text(self, text, font='regular', size=10, color=(0, 0, 0), indent=0, leading=1.35, align='left'):
+        """Wrapped text starting at the cursor; returns the number of lines"""
+        line_height = size * leading
+        lines = wrap(text, font, size, self.width - indent)
+        for line in lines:
+            self.ensure_space(line_height)
+            self.y -= line_height
+            x = self.margin + indent
+            if align == 'right':
+                x = self.margin + self.width - text_width(line, font, size)
+            self.draw_text(x, self.y + (line_height - size) / 2, line, font, size, color)
+        return len(lines)
+
+    def text_pair(self, left, right, font='bold', size=10.5, right_font='regular', color=(0, 0, 0),
+                  right_color=(0.35, 0.35, 0.35)):
+        """One line with ``left`` at the margin and ``right`` flush right (e.g. a date range)"""
+        right_width = text_width(right, right_font, size) if right else 0
+        lines = wrap(left, font, size, self.width - right_width - 12)
+        line_height = size * 1.35
+        self.ensure_space(line_height * len(lines))
+        for i, line in enumerate(lines):
+            self.y -= line_height
+            baseline = self.y + (line_height - size) / 2
+            self.draw_text(self.margin, baseline, line, font, size, color)
+            if i == 0 and right:
+                self.draw_text(self.margin + self.width - right_width, baseline, right, right_font, size, right_color)
+
+    def bullet(self, text, size=10, color=(0, 0, 0), indent=12):
+        line_height = size * 1.35
+        lines = wrap(text, 'regular', size, self.width - indent)
+        self.ensure_space(line_height)
+        self.draw_text(self.margin + indent - 9, self.y - line_height + (line_height - size) / 2,
+                       '•', 'regular', size, color)
+        for line in lines:
+            self.ensure_space(line_height)
+            self.y -= line_height
+            self.draw_text(self.margin + indent, self.y + (line_height - size) / 2, line, 'regular', size, color)
+
+    def rule(self, color=(0.8, 0.8, 0.8), width=0.75, gap=4):
+        self.ensure_space(gap * 2)
+        self.y -= gap
+        self.pages[-1].append(
+            b'%.3f %.3f %.3f RG %.2f w %.2f %.2f m %.2f %.2f l S'
+            % (*color, width, self.margin, self.y, self.margin + self.width, self.y)
+        )
+        self.y -= gap
+
+    def space(self, points):
+        self.y -= points
+        if self.y < self.margin:
+            self.new_page()
+
+    def render(self):
+        objects = []
+
+        def add(body):
+            objects.append(body)
+            return len(objects)
+
+        catalog = add(None)
+        pages = add(None)
+        fonts = {
+            name: add(b'<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding /WinAnsiEncoding >>'
+                      % base.encode())
+            for name, base in FONTS.values()
+        }
+        font_resources = b' '.join(b'/%s %d 0 R' % (name.encode(), ref) for name, ref in fonts.items())
+
+        page_refs = []
+        for commands in self.pages:
+            stream = zlib.compress(b'\n'.join(commands), 9)
+            content = add(b'<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream' % (len(stream), stream))
+            page_refs.append(add(
+                b'<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %.2f %.2f] '
+                b'/Resources << /Font << %s >> >> /Contents %d 0 R >>'
+                % (pages, self.page_width, self.page_height, font_resources, content)
+            ))
+        objects[catalog - 1] = b'<< /Type /Catalog /Pages %d 0 R >>' % pages
+        objects[pages - 1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (
+            b' '.join(b'%d 0 R' % ref for ref in page_refs), len(page_refs)
+        )
+        info = add(b'<< /Title (%s) /Author (%s) /Producer (portfolio) >>'
+                   % (escape(encode(self.title)), escape(encode(self.author))))
+
+        output = bytearray(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(len(output))
+            output += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+        xref = len(output)
+        output += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+        output += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+        output += b'trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (
+            len(objects) + 1, catalog, info, xref
+        )
+        return bytes(output)
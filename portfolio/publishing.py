@@ -0,0 +1,338 @@
+"""
+Draft and published content.
+
+Saving a row in the admin edits the draft: the tables themselves. Nothing
+public reads them. ``publish()`` serializes every public row into one
+PublishedSnapshot, compact JSON compressed with zlib, under the next version
+number. Snapshots are never changed afterwards. Each worker deserializes the
+latest one into unsaved model instances once (``published()``), and the
+public pages, the API, the sitemap, the feed and the résumé all read from that
+in memory. Editors can save as often as they like without touching anything
+the public sees. There is no cache invalidation: anything cached from
+published content is keyed by the version it came from (see cache.py).
+
+Workers check for a newer version at most every PUBLISHED_CHECK_INTERVAL
+seconds, with one indexed query. The process that publishes switches at once.
+
+Each tenant publishes its own snapshots, numbered from 1. A worker holds the
+content of at most PUBLISHED_CACHE_SIZE tenants and drops the least recently
+served first; a dropped tenant is loaded again on its next request.
+"""
+import bisect
+import datetime
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core import serializers
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils import timezone
+
+from .tenancy import LRU, current_tenant_id, is_tenant_owned, require_tenant
+
+
+# Every model whose rows appear publicly; parents before children
+SNAPSHOT_MODELS = (
+    'portfolio.About', 'portfolio.Skill', 'portfolio.Project', 'portfolio.ProjectImage',
+    'portfolio.Certificate', 'portfolio.Experience', 'portfolio.Education', 'portfolio.RelatedProject',
+)
+
+
+class Slot:
+    """A tenant's content in this worker, when it was last checked, and the lock for checking"""
+    __slots__ = ('content', 'checked_at', 'lock')
+
+    def __init__(self):
+        self.content = None
+        self.checked_at = 0.0
+        self.lock = threading.Lock()
+
+
+def check_interval():
+    return getattr(settings, 'PUBLISHED_CHECK_INTERVAL', 5)
+
+
+# tenant id -> Slot
+_slots = LRU(getattr(settings, 'PUBLISHED_CACHE_SIZE', 100))
+
+
+def order_by(objects, *fields):
+    """
+    ``objects`` sorted like ``QuerySet.order_by(*fields)`` sorts on SQLite,
+    where NULL comes before every value. The sort is stable, so ties keep
+    their primary key order as they would in the table.
+    """
+    result = list(objects)
+    if not result:
+        return result
+    meta = result[0]._meta
+    for field in reversed(fields):
+        name = field.lstrip('-')
+        attname = meta.pk.attname if name == 'pk' else meta.get_field(name).attname
+
+        def key(obj):
+            value = getattr(obj, attname)
+            return (value is not None, value if value is not None else 0)
+        result.sort(key=key, reverse=field.startswith('-'))
+    return result
+
+
+# ==================== PUBLISHED CONTENT ====================
+
+class PublishedContent:
+    """
+    One published snapshot as unsaved model instances. Lists come in each
+    model's default ordering; projects carry their gallery, so
+    ``project.images.all`` in a template runs no query.
+    """
+
+    def __init__(self, version=0, published_at=None, rows=()):
+        from django.apps import apps
+
+        self.version = version
+        self.published_at = published_at
+        by_model = defaultdict(list)
+        for item in serializers.deserialize('python', rows, ignorenonexistent=True):
+            by_model[item.object._meta.label].append(item.object)
+        self._objects = {
+            label: order_by(
+                sorted(by_model[label], key=lambda obj: obj.pk),
+                *apps.get_model(label)._meta.ordering
+            )
+            for label in SNAPSHOT_MODELS
+        }
+        self._by_pk = {
+            label: {obj.pk: obj for obj in objects} for label, objects in self._objects.items()
+        }
+        # Sorted once per version for keyset pagination
+        self._pks = {label: sorted(objects) for label, objects in self._by_pk.items()}
+
+        self.about = next(iter(self.objects('portfolio.About')), None)
+        self.skills = self.objects('portfolio.Skill')
+        self.projects = self.objects('portfolio.Project')
+        self.certificates = self.objects('portfolio.Certificate')
+        self.experiences = self.objects('portfolio.Experience')
+        self.education = self.objects('portfolio.Education')
+
+        from .models import Project, ProjectImage
+
+        images = defaultdict(list)
+        for image in self.objects('portfolio.ProjectImage'):
+            images[image.project_id].append(image)
+        for project in self.projects:
+            gallery = ProjectImage.objects.none()
+            gallery._result_cache = images[project.pk]
+            gallery._prefetch_done = True
+            project._prefetched_objects_cache = {'images': gallery}
+
+        self._related = defaultdict(list)
+        for link in self.objects('portfolio.RelatedProject'):
+            related = self.get(Project, link.related_id)
+            if related is not None:
+                self._related[link.project_id].append(related)
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        return cls(snapshot.version, snapshot.published_at, decode(snapshot.payload))
+
+    def objects(self, model):
+        """Every published row of ``model`` (a class or 'app.Model' label)"""
+        label = model if isinstance(model, str) else model._meta.label
+        return self._objects[label]
+
+    def get(self, model, pk):
+        label = model if isinstance(model, str) else model._meta.label
+        return self._by_pk[label].get(pk)
+
+    def after(self, model, pk, limit):
+        """Up to ``limit`` rows of ``model`` with a primary key above ``pk``, in primary key order"""
+        label = model if isinstance(model, str) else model._meta.label
+        pks = self._pks[label]
+        start = bisect.bisect_right(pks, pk)
+        return [self._by_pk[label][key] for key in pks[start:start + limit]]
+
+    def related_projects(self, pk):
+        """The project's most similar projects, best first (see similarity.py)"""
+        return self._related.get(pk, [])
+
+    def preview_projects(self, limit):
+        """Featured projects first, topped up with the most recent others"""
+        projects = order_by(self.projects, '-date_completed')
+        featured = [project for project in projects if project.featured]
+        return (featured + [project for project in projects if not project.featured])[:limit]
+
+
+def snapshots(tenant_id):
+    from .models import PublishedSnapshot
+
+    snapshots = PublishedSnapshot._base_manager.using(DEFAULT_DB_ALIAS)
+    return snapshots.filter(tenant_id=tenant_id).order_by('-version')
+
+
+def latest_version(tenant_id):
+    return snapshots(tenant_id).values_list('version', flat=True).first()
+
+
+def load_latest(tenant_id):
+    snapshot = snapshots(tenant_id).first()
+    return PublishedContent.from_snapshot(snapshot) if snapshot else PublishedContent()
+
+
+def fresh_content(tenant_id):
+    """This worker's content for the tenant if it was checked recently enough, else None"""
+    slot = _slots.get(tenant_id)
+    if slot is not None and slot.content is not None and time.monotonic() - slot.checked_at < check_interval():
+        return slot.content
+    return None
+
+
+def published():
+    """The current tenant's latest published content, loaded once per worker"""
+    tenant_id = require_tenant().pk
+    content = fresh_content(tenant_id)
+    if content is not None:
+        return content
+    slot = _slots.setdefault(tenant_id, Slot())
+    with slot.lock:
+        content = fresh_content(tenant_id)
+        if content is None:
+            content = slot.content
+            if content is None or latest_version(tenant_id) != (content.version or None):
+                content = load_latest(tenant_id)
+            slot.content, slot.checked_at = content, time.monotonic()
+    return content
+
+
+async def apublished():
+    """``published()`` for async views; only a check that's due leaves the event loop"""
+    tenant_id = current_tenant_id()
+    return (tenant_id and fresh_content(tenant_id)) or await sync_to_async(published)()
+
+
+def set_current(tenant_id, content):
+    slot = _slots.setdefault(tenant_id, Slot())
+    with slot.lock:
+        slot.content, slot.checked_at = content, time.monotonic()
+
+
+def _reset_after_fork():
+    # The content itself is immutable and safe to share with the child
+    for slot in list(_slots.data.values()):
+        slot.lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+# ==================== PUBLISHING ====================
+
+class SnapshotEncoder(DjangoJSONEncoder):
+    """Keeps the microseconds DjangoJSONEncoder drops, so updated_at round-trips exactly"""
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def encode(rows):
+    return json.dumps(rows, cls=SnapshotEncoder, separators=(',', ':'), sort_keys=True).encode()
+
+
+def decode(payload):
+    return json.loads(zlib.decompress(payload))
+
+
+def tenant_rows(model, using, tenant_id):
+    """The tenant's rows of ``model``; every row for models from before tenants existed"""
+    rows = model._base_manager.using(using)
+    return rows.filter(tenant_id=tenant_id) if is_tenant_owned(model) else rows
+
+
+def serialize_content(get_model, using=DEFAULT_DB_ALIAS, tenant_id=None):
+    rows = []
+    for label in SNAPSHOT_MODELS:
+        model = get_model(label)
+        rows += serializers.serialize('python', tenant_rows(model, using, tenant_id).order_by('pk'))
+    for row in rows:
+        # A snapshot belongs to one tenant already; leaving the column out keeps digests comparable
+        row['fields'].pop('tenant', None)
+    return rows
+
+
+def draft_digest():
+    """Digest the current tenant's draft would be published under; compare with the latest snapshot's"""
+    from django.apps import apps
+
+    return hashlib.sha256(encode(serialize_content(apps.get_model, tenant_id=require_tenant().pk))).hexdigest()
+
+
+def create_snapshot(get_model, using=DEFAULT_DB_ALIAS, published_by='', note='', force=False, tenant_id=None):
+    """
+    Store the tenant's draft as its next version; returns (snapshot,
+    created). When the draft matches the latest version exactly, that
+    version is returned instead unless ``force`` is set. ``get_model`` lets
+    migrations pass ``apps.get_model``.
+    """
+    PublishedSnapshot = get_model('portfolio.PublishedSnapshot')
+    owner = {'tenant_id': tenant_id} if is_tenant_owned(PublishedSnapshot) else {}
+    with transaction.atomic(using=using):
+        rows = serialize_content(get_model, using, tenant_id)
+        data = encode(rows)
+        digest = hashlib.sha256(data).hexdigest()
+        latest = tenant_rows(PublishedSnapshot, using, tenant_id).order_by('-version').first()
+        if latest is not None and latest.digest == digest and not force:
+            return latest, False
+        counts = defaultdict(int)
+        for row in rows:
+            counts[row['model']] += 1
+        snapshot = PublishedSnapshot._base_manager.using(using).create(
+            **owner,
+            version=latest.version + 1 if latest else 1,
+            digest=digest,
+            payload=zlib.compress(data, 9),
+            size=len(data),
+            counts=dict(counts),
+            published_at=timezone.now(),
+            published_by=published_by,
+            note=note,
+        )
+    return snapshot, True
+
+
+def publish(published_by='', note='', force=False):
+    """
+    Publish the current tenant's draft. Once the snapshot is committed this
+    process switches to it, and so to cache keys of the new version, and
+    everything derived from its published content is brought up to date.
+    """
+    from django.apps import apps
+
+    snapshot, created = create_snapshot(apps.get_model, published_by=published_by, note=note, force=force,
+                                        tenant_id=require_tenant().pk)
+    if created:
+        transaction.on_commit(lambda: went_live(snapshot), robust=True)
+    return snapshot, created
+
+
+def went_live(snapshot):
+    from . import resume, search, social_cards
+    from .replica import replica_path, schedule_refresh
+
+    tenant_id = snapshot.tenant_id
+    content = PublishedContent.from_snapshot(snapshot)
+    set_current(tenant_id, content)
+    social_cards.delete_unused_cards(tenant_id, keep=[project.social_card.name for project in content.projects])
+    resume.schedule_build(tenant_id)
+    if search.search_available():
+        search.index_published(tenant_id, content)
+    # Public search reads the replica; copy the index as of this publish
+    if replica_path() is not None:
+        schedule_refresh()
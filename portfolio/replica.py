@@ -0,0 +1,206 @@
+"""
+Read-only SQLite snapshot for public traffic.
+
+Public views wrapped in ``@reads_from_replica`` send their queries to the
+``replica`` database alias, a copy of the primary refreshed with SQLite's
+online backup API by ``manage.py refresh_replica`` and, on a background
+thread, after every publish. Page
+content comes from the published snapshot (see publishing.py); what's left
+for the replica is the search index. Every write, and every
+read outside those views (admin, contact form handling, management commands),
+goes to the primary. Until the first snapshot exists everything reads from the
+primary. There is one snapshot for the whole deployment, holding every
+tenant's rows.
+
+A refresh never writes to the file readers have open: it backs up into a
+temporary file next to it and renames that over the snapshot. Readers that
+already have the old file open finish on it; a persistent connection notices
+the new file at the start of its next request and reconnects. The snapshot
+is kept in rollback-journal mode, since WAL's -wal and -shm files are found
+by name and would be shared between the old file and its replacement.
+"""
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils import timezone
+
+
+logger = logging.getLogger(__name__)
+
+REPLICA_ALIAS = 'replica'
+
+_reading_from_replica = ContextVar('portfolio_reading_from_replica', default=False)
+
+_executor = None
+# Whether a refresh has been submitted but not started yet
+_pending = False
+_lock = threading.Lock()
+
+
+def replica_path():
+    if REPLICA_ALIAS not in connections.settings:
+        return None
+    return connections.settings[REPLICA_ALIAS]['NAME']
+
+
+def replica_available():
+    """True once a snapshot has been taken"""
+    path = replica_path()
+    return path is not None and os.path.exists(path)
+
+
+def use_latest_snapshot():
+    """
+    Close this thread's replica connection if a refresh has replaced the file
+    it has open. The file is checked before the connection is (re)opened, so
+    a refresh in between only costs one extra reconnect.
+    """
+    connection = connections[REPLICA_ALIAS]
+    inode = os.stat(replica_path()).st_ino
+    if connection.connection is not None and getattr(connection, 'replica_inode', None) != inode:
+        connection.close()
+    connection.replica_inode = inode
+
+
+def reads_from_replica(view):
+    """Route the view's queries to the snapshot when there is one"""
+    if iscoroutinefunction(view):
+        async def wrapper(request, *args, **kwargs):
+            if not replica_available():
+                return await view(request, *args, **kwargs)
+            # The async ORM's thread, whose connection the view will use
+            await sync_to_async(use_latest_snapshot)()
+            # Context variables follow the async ORM into its worker thread
+            token = _reading_from_replica.set(True)
+            try:
+                return await view(request, *args, **kwargs)
+            finally:
+                _reading_from_replica.reset(token)
+    else:
+        def wrapper(request, *args, **kwargs):
+            if not replica_available():
+                return view(request, *args, **kwargs)
+            use_latest_snapshot()
+            token = _reading_from_replica.set(True)
+            try:
+                return view(request, *args, **kwargs)
+            finally:
+                _reading_from_replica.reset(token)
+    return wraps(view)(wrapper)
+
+
+class ReplicaRouter:
+    """
+    Reads inside ``@reads_from_replica`` views go to the snapshot; all writes
+    and migrations go to the primary.
+    """
+    def db_for_read(self, model, **hints):
+        if _reading_from_replica.get():
+            return REPLICA_ALIAS
+        return None
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == REPLICA_ALIAS:
+            return False
+        return None
+
+
+def refresh_snapshot():
+    """
+    Copy the primary database with the online backup API into a new file,
+    rename it over the snapshot and record when it happened. Writers on the
+    primary aren't blocked under WAL, and readers of the snapshot keep
+    reading the previous file until the rename.
+    """
+    from .models import ReplicaSnapshot
+
+    path = replica_path()
+    if path is None:
+        raise ValueError(f"No '{REPLICA_ALIAS}' database is configured")
+
+    primary = connections[DEFAULT_DB_ALIAS]
+    primary.ensure_connection()
+    started = timezone.now()
+    timer = time.perf_counter()
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                      prefix=f'{os.path.basename(path)}.', suffix='.tmp')
+    os.close(fd)
+    try:
+        target = sqlite3.connect(temp_path)
+        try:
+            primary.connection.backup(target)
+            # The copy comes out in the primary's WAL mode
+            target.execute('PRAGMA journal_mode=DELETE')
+        finally:
+            target.close()
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    # Left over from a snapshot that was still in WAL mode
+    for suffix in ('-wal', '-shm'):
+        if os.path.exists(f'{path}{suffix}'):
+            os.unlink(f'{path}{suffix}')
+    duration = time.perf_counter() - timer
+
+    snapshot, _ = ReplicaSnapshot.objects.update_or_create(
+        alias=REPLICA_ALIAS,
+        defaults={
+            'refreshed_at': started,
+            'duration': duration,
+            'size': os.path.getsize(path),
+        },
+    )
+    return snapshot
+
+
+def run_pending_refresh():
+    global _pending
+    with _lock:
+        _pending = False
+    try:
+        refresh_snapshot()
+    except Exception:
+        logger.exception('Refreshing the replica failed')
+    finally:
+        connections.close_all()
+
+
+def schedule_refresh():
+    """
+    Refresh the snapshot on a background thread. A refresh copies the whole
+    database, so one that is waiting to start covers every later request.
+    """
+    global _executor, _pending
+    with _lock:
+        if _pending:
+            return
+        _pending = True
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='replica')
+    _executor.submit(run_pending_refresh)
+
+
+def _reset_after_fork():
+    global _executor, _pending, _lock
+    _executor, _pending, _lock = None, False, threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
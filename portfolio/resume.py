@@ -0,0 +1,367 @@
+"""
+Résumé generated from the portfolio content.
+
+``build_resume()`` gathers the published About, Experience, Education, Skill
+and Certificate rows into plain résumé data, hashes it, and renders a PDF
+(pdf.py) and a printable HTML page from it, but only when the hash differs
+from the last build. Every publish queues a build on a background thread (see
+publishing.py); ``manage.py build_resume`` runs one directly.
+
+Each tenant has its own build, stored under a directory named after it.
+``/resume.pdf`` and ``/resume/`` serve the stored files, never rendering on
+demand. The content hash is a strong ETag, and single byte ranges are
+supported so PDF viewers and download managers can fetch parts or resume.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connections, transaction
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.html import strip_tags
+from django.utils.http import http_date, parse_http_date_safe
+from django.views.decorators.http import condition, require_safe
+
+from .pdf import PdfDocument
+from .publishing import order_by, published
+from .tenancy import require_tenant, use_tenant
+
+
+logger = logging.getLogger(__name__)
+
+# Bump to rebuild after changing the layout of either format
+RESUME_LAYOUT_VERSION = 1
+RESUME_DIR = 'resumes/generated'
+RETRY_AFTER = 30
+
+HEADING_COLOR = (0.04, 0.52, 1.0)
+MUTED_COLOR = (0.35, 0.35, 0.35)
+
+RANGE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+_executor = None
+# Tenants with a build submitted but not started yet
+_queued = set()
+_lock = threading.Lock()
+
+
+# ==================== CONTENT ====================
+
+def month_year(value):
+    return value.strftime('%b %Y') if value else ''
+
+
+def resume_data():
+    """Everything printed on the current tenant's résumé, as JSON-serializable values"""
+    content = published()
+    about = content.about
+    if about is None:
+        return None
+
+    skills = {}
+    for skill in order_by(content.skills, 'category', '-proficiency', 'name'):
+        skills.setdefault(skill.get_category_display(), []).append(skill.name)
+
+    return {
+        'layout': RESUME_LAYOUT_VERSION,
+        'name': about.name,
+        'title': about.title,
+        'contact': [value for value in (about.email, about.phone, about.location) if value],
+        'links': [value for value in (about.linkedin_url, about.github_url) if value],
+        'summary': strip_tags(about.bio).strip(),
+        'experience': [
+            {
+                'position': job.position,
+                'company': job.company,
+                'location': job.location,
+                'dates': f"{month_year(job.start_date)} - {'Present' if job.current else month_year(job.end_date)}",
+                'description': strip_tags(job.description).strip(),
+                'achievements': job.get_achievements_list(),
+            }
+            for job in content.experiences
+        ],
+        'education': [
+            {
+                'degree': entry.degree,
+                'field': entry.field_of_study,
+                'institution': entry.institution,
+                'dates': entry.get_date_range(),
+                'grade': entry.grade,
+            }
+            for entry in content.education
+        ],
+        'skills': [{'category': category, 'names': names} for category, names in skills.items()],
+        'certificates': [
+            {
+                'name': cert.certificate_name,
+                'organization': cert.issuing_organization,
+                'issued': month_year(cert.issue_date),
+            }
+            for cert in order_by(content.certificates, '-issue_date')
+        ],
+    }
+
+
+def fingerprint(data):
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+# ==================== RENDERING ====================
+
+def render_html(data):
+    return render_to_string('portfolio/resume.html', {'resume': data}).encode()
+
+
+def render_pdf(data):
+    doc = PdfDocument(title=f"{data['name']} - Résumé", author=data['name'])
+    doc.text(data['name'], font='bold', size=22)
+    doc.text(data['title'], size=12, color=MUTED_COLOR)
+    doc.space(4)
+    doc.text('  ·  '.join(data['contact'] + data['links']), size=9, color=MUTED_COLOR)
+
+    def section(title):
+        doc.space(12)
+        doc.text(title.upper(), font='bold', size=11, color=HEADING_COLOR)
+        doc.rule(gap=3)
+
+    if data['summary']:
+        section('Summary')
+        doc.text(data['summary'])
+
+    if data['experience']:
+        section('Experience')
+        for i, job in enumerate(data['experience']):
+            if i:
+                doc.space(8)
+            doc.text_pair(job['position'], job['dates'])
+            doc.text(', '.join(filter(None, [job['company'], job['location']])), font='italic', color=MUTED_COLOR)
+            if job['description']:
+                doc.space(2)
+                doc.text(job['description'])
+            for achievement in job['achievements']:
+                doc.bullet(achievement)
+
+    if data['education']:
+        section('Education')
+        for i, entry in enumerate(data['education']):
+            if i:
+                doc.space(6)
+            doc.text_pair(f"{entry['degree']}, {entry['field']}", entry['dates'])
+            doc.text(' · '.join(filter(None, [entry['institution'], entry['grade']])), font='italic',
+                     color=MUTED_COLOR)
+
+    if data['skills']:
+        section('Skills')
+        for group in data['skills']:
+            doc.text(f"{group['category']}: {', '.join(group['names'])}")
+
+    if data['certificates']:
+        section('Certifications')
+        for cert in data['certificates']:
+            doc.text_pair(cert['name'], cert['issued'], font='regular', size=10)
+            doc.text(cert['organization'], size=9, color=MUTED_COLOR)
+
+    return doc.render()
+
+
+# ==================== BUILDING ====================
+
+def build_resume(force=False):
+    """
+    Render and store the current tenant's résumé if its content changed since
+    the last build; returns the GeneratedResume, or None when no About is
+    published.
+    """
+    from .models import GeneratedResume
+
+    tenant = require_tenant()
+    data = resume_data()
+    if data is None:
+        return None
+    digest = fingerprint(data)
+    current = GeneratedResume._base_manager.filter(tenant=tenant).first()
+    if current is not None and current.fingerprint == digest and not force:
+        return current
+
+    started = time.perf_counter()
+    files = {}
+    for extension, render in (('pdf', render_pdf), ('html', render_html)):
+        name = f'{RESUME_DIR}/{tenant.pk}/resume-{digest[:16]}.{extension}'
+        if default_storage.exists(name):
+            default_storage.delete(name)
+        files[extension] = default_storage.save(name, ContentFile(render(data)))
+
+    resume, _ = GeneratedResume._base_manager.update_or_create(tenant=tenant, defaults={
+        'fingerprint': digest,
+        'filename': download_name(data['name']),
+        'pdf': files['pdf'],
+        'html': files['html'],
+        'built_at': timezone.now(),
+        'duration': time.perf_counter() - started,
+    })
+    if current is not None:
+        for old in {current.pdf.name, current.html.name} - set(files.values()):
+            default_storage.delete(old)
+    return resume
+
+
+def download_name(name):
+    slug = re.sub(r'[^A-Za-z0-9]+', '-', name).strip('-')
+    return f'{slug}-resume.pdf' if slug else 'resume.pdf'
+
+
+def run_queued_build(tenant_id):
+    from .models import Tenant
+
+    with _lock:
+        _queued.discard(tenant_id)
+    try:
+        with use_tenant(Tenant.objects.get(pk=tenant_id)):
+            build_resume()
+    except Exception:
+        logger.exception('Building the résumé of tenant %s failed', tenant_id)
+    finally:
+        connections.close_all()
+
+
+def schedule_build(tenant_id=None):
+    """
+    Build the tenant's résumé (the current tenant's by default) on a
+    background thread after the current transaction commits
+    """
+    if tenant_id is None:
+        tenant_id = require_tenant().pk
+
+    def submit():
+        global _executor
+        with _lock:
+            if tenant_id in _queued:
+                return  # a build that hasn't started yet will see this change
+            _queued.add(tenant_id)
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='resume')
+        _executor.submit(run_queued_build, tenant_id)
+
+    transaction.on_commit(submit)
+
+
+def _reset_after_fork():
+    global _executor, _queued, _lock
+    _executor, _queued, _lock = None, set(), threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+# ==================== SERVING ====================
+
+def current_resume(request):
+    """The tenant's latest build, looked up once per request on the primary database"""
+    if not hasattr(request, '_generated_resume'):
+        from .models import GeneratedResume
+        request._generated_resume = GeneratedResume.objects.using('default').first()
+    return request._generated_resume
+
+
+def resume_etag(request, *args, **kwargs):
+    resume = current_resume(request)
+    return f'"{resume.fingerprint}"' if resume else None
+
+
+def resume_last_modified(request, *args, **kwargs):
+    resume = current_resume(request)
+    return resume.built_at if resume else None
+
+
+def artifact_content(field_file, digest):
+    """The stored file's bytes, kept in the cache; the name changes with the content"""
+    key = f'portfolio:resume:{digest}:{field_file.name}'
+    content = cache.get(key)
+    if content is None:
+        with field_file.open('rb') as source:
+            content = source.read()
+        cache.set(key, content, None)
+    return content
+
+
+def byte_range(request, size, etag, last_modified):
+    """
+    (start, end) inclusive for a satisfiable single-range request, 'invalid'
+    if the range can't be satisfied, or None to send the whole file. Multiple
+    ranges aren't supported; like a Range header that doesn't parse, or an
+    If-Range that doesn't match, they get the full response.
+    """
+    header = request.headers.get('Range')
+    if not header or request.method != 'GET':
+        return None
+    if_range = request.headers.get('If-Range')
+    if if_range and if_range != etag and parse_http_date_safe(if_range) != int(last_modified.timestamp()):
+        return None
+    match = RANGE.match(header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if last and int(last) < start:
+            return None
+    else:
+        start, end = max(0, size - int(last)), size - 1
+    if start >= size or size == 0:
+        return 'invalid'
+    return start, end
+
+
+def artifact_response(request, resume, field_file, content_type, filename=None):
+    if resume is None:
+        schedule_build()
+        response = HttpResponse('The résumé is being generated; try again shortly.',
+                                status=503, content_type='text/plain; charset=utf-8')
+        response['Retry-After'] = str(RETRY_AFTER)
+        return response
+
+    content = artifact_content(field_file, resume.fingerprint)
+    size = len(content)
+    selected = byte_range(request, size, f'"{resume.fingerprint}"', resume.built_at)
+    if selected == 'invalid':
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+    elif selected:
+        start, end = selected
+        response = HttpResponse(content[start:end + 1], status=206, content_type=content_type)
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    else:
+        response = HttpResponse(content, content_type=content_type)
+    response['Accept-Ranges'] = 'bytes'
+    if filename:
+        response['Content-Disposition'] = f'inline; filename="{filename}"'
+    # Revalidated with the ETag, so edits show up on the next request
+    response['Cache-Control'] = 'public, no-cache'
+    response['Last-Modified'] = http_date(resume.built_at.timestamp())
+    return response
+
+
+@require_safe
+@condition(etag_func=resume_etag, last_modified_func=resume_last_modified)
+def resume_pdf(request):
+    resume = current_resume(request)
+    return artifact_response(request, resume, resume and resume.pdf, 'application/pdf', resume and resume.filename)
+
+
+@require_safe
+@condition(etag_func=resume_etag, last_modified_func=resume_last_modified)
+def resume_html(request):
+    resume = current_resume(request)
+    return artifact_response(request, resume, resume and resume.html, 'text/html; charset=utf-8')
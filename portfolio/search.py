@@ -0,0 +1,292 @@
+"""
+SQLite FTS5 full-text indexes over portfolio content.
+
+There are two, with the same columns. ``portfolio_search`` indexes the draft:
+signals (see signals.py) keep it in sync with every save, and the admin's
+search boxes use it. ``portfolio_published_search`` indexes what each tenant
+last published; it is rebuilt from the snapshot when a version goes live, and
+it is the only one the public site searches, so a saved but unpublished edit
+never shows up in public results. Both can be rebuilt with
+``manage.py rebuild_search_index``.
+
+Every row lives under a rowid derived from its model and primary key, so
+updates and deletes are direct rowid lookups.
+
+One index serves every tenant. Each row's ``tenant`` column holds a single
+token naming its tenant, and every query ANDs that token with the search
+terms, so FTS5 intersects the terms' posting lists with the tenant's
+instead of filtering the other tenants' matches afterwards.
+"""
+import re
+
+from django.apps import apps
+from django.db import connection, connections, router, transaction
+from django.db.models.expressions import RawSQL
+from django.utils.html import escape, strip_tags
+from django.utils.safestring import mark_safe
+
+from .tenancy import current_tenant_id, is_tenant_owned
+
+
+SEARCH_TABLE = 'portfolio_search'
+PUBLISHED_SEARCH_TABLE = 'portfolio_published_search'
+
+# kind -> (code, model label, title field, body fields)
+SEARCH_DOCUMENTS = {
+    'project': (1, 'portfolio.Project', 'title',
+                ('description', 'detailed_description', 'technologies', 'key_achievements')),
+    'certificate': (2, 'portfolio.Certificate', 'certificate_name',
+                    ('issuing_organization', 'credential_id', 'description')),
+    'skill': (3, 'portfolio.Skill', 'name', ('category',)),
+    'experience': (4, 'portfolio.Experience', 'position',
+                   ('company', 'location', 'description', 'achievements')),
+}
+KIND_BITS = 3
+
+# Column weights for bm25(): kind and object_id are unindexed, titles count most
+# and the tenant token doesn't count at all
+BM25_WEIGHTS = '0.0, 0.0, 10.0, 1.0, 0.0'
+
+# Snippet markers that can't appear in indexed text; replaced after escaping
+MARK_START, MARK_END = '\x02', '\x03'
+
+WORD = re.compile(r'\w+', re.UNICODE)
+
+INSERT_SQL = (
+    'INSERT OR REPLACE INTO {table} (rowid, kind, object_id, title, body, tenant) '
+    'VALUES (%s, %s, %s, %s, %s, %s)'
+)
+DRAFT_INSERT_SQL = INSERT_SQL.format(table=SEARCH_TABLE)
+PUBLISHED_INSERT_SQL = INSERT_SQL.format(table=PUBLISHED_SEARCH_TABLE)
+
+
+def search_available():
+    return connection.vendor == 'sqlite'
+
+
+def read_connection():
+    """Connection for public searches: the snapshot inside replica-routed views"""
+    return connections[router.db_for_read(apps.get_model(SEARCH_DOCUMENTS['project'][1]))]
+
+
+def kind_for_model(model):
+    label = model._meta.label
+    for kind, (_, model_label, _, _) in SEARCH_DOCUMENTS.items():
+        if model_label == label:
+            return kind
+    return None
+
+
+def rowid_for(kind, pk):
+    return (pk << KIND_BITS) | SEARCH_DOCUMENTS[kind][0]
+
+
+def tenant_token(tenant_id):
+    return f't{tenant_id or 0}'
+
+
+def build_document(kind, values):
+    """Return (title, body) for a row given its field values as a dict"""
+    _, _, title_field, body_fields = SEARCH_DOCUMENTS[kind]
+    body = '\n'.join(strip_tags(values[field] or '') for field in body_fields)
+    return values[title_field] or '', body
+
+
+def create_index(conn=connection):
+    with conn.cursor() as cursor:
+        for table in (SEARCH_TABLE, PUBLISHED_SEARCH_TABLE):
+            cursor.execute(
+                f'CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5('
+                "kind UNINDEXED, object_id UNINDEXED, title, body, tenant, tokenize = 'porter unicode61')"
+            )
+
+
+def drop_index(conn=connection):
+    with conn.cursor() as cursor:
+        for table in (SEARCH_TABLE, PUBLISHED_SEARCH_TABLE):
+            cursor.execute(f'DROP TABLE IF EXISTS {table}')
+
+
+def rebuild_index(get_model=None, batch_size=1000, conn=connection):
+    """
+    Re-create every draft index row from the database. ``get_model`` and ``conn``
+    let migrations pass ``apps.get_model`` and their schema editor's connection.
+    """
+    if get_model is None:
+        from django.apps import apps
+        get_model = apps.get_model
+
+    total = 0
+    # One transaction: in autocommit mode every executemany row would commit (and sync) alone
+    with transaction.atomic(using=conn.alias), conn.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+        for kind, (_, label, title_field, body_fields) in SEARCH_DOCUMENTS.items():
+            model = get_model(label)
+            fields = ('pk', title_field) + body_fields + (('tenant_id',) if is_tenant_owned(model) else ())
+            rows = model._base_manager.using(conn.alias).values(*fields).iterator(chunk_size=batch_size)
+            batch = []
+            for values in rows:
+                batch.append((
+                    rowid_for(kind, values['pk']), kind, values['pk'], *build_document(kind, values),
+                    tenant_token(values.get('tenant_id')),
+                ))
+                if len(batch) >= batch_size:
+                    cursor.executemany(DRAFT_INSERT_SQL, batch)
+                    total += len(batch)
+                    batch = []
+            if batch:
+                cursor.executemany(DRAFT_INSERT_SQL, batch)
+                total += len(batch)
+    return total
+
+
+def index_object(instance):
+    kind = kind_for_model(type(instance))
+    if kind is None or not search_available():
+        return
+    _, _, title_field, body_fields = SEARCH_DOCUMENTS[kind]
+    values = {field: getattr(instance, field) for field in (title_field,) + body_fields}
+    with connection.cursor() as cursor:
+        cursor.execute(DRAFT_INSERT_SQL, (
+            rowid_for(kind, instance.pk), kind, instance.pk, *build_document(kind, values),
+            tenant_token(instance.tenant_id),
+        ))
+
+
+def index_objects(instances):
+    """Index many rows in one executemany, e.g. after bulk_create"""
+    rows = []
+    for instance in instances:
+        kind = kind_for_model(type(instance))
+        if kind is None:
+            continue
+        _, _, title_field, body_fields = SEARCH_DOCUMENTS[kind]
+        values = {field: getattr(instance, field) for field in (title_field,) + body_fields}
+        rows.append((
+            rowid_for(kind, instance.pk), kind, instance.pk, *build_document(kind, values),
+            tenant_token(instance.tenant_id),
+        ))
+    if rows and search_available():
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.executemany(DRAFT_INSERT_SQL, rows)
+
+
+def remove_object(instance):
+    kind = kind_for_model(type(instance))
+    if kind is None or not search_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [rowid_for(kind, instance.pk)])
+
+
+def index_published(tenant_id, content, conn=connection):
+    """
+    Replace the tenant's rows in the published index with the documents of
+    ``content``, a PublishedContent. Returns the number of rows indexed.
+    """
+    rows = []
+    for kind, (_, label, title_field, body_fields) in SEARCH_DOCUMENTS.items():
+        for obj in content.objects(label):
+            values = {field: getattr(obj, field) for field in (title_field,) + body_fields}
+            rows.append((
+                rowid_for(kind, obj.pk), kind, obj.pk, *build_document(kind, values), tenant_token(tenant_id),
+            ))
+    with transaction.atomic(using=conn.alias), conn.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {PUBLISHED_SEARCH_TABLE} WHERE rowid IN '
+            f'(SELECT rowid FROM {PUBLISHED_SEARCH_TABLE} WHERE {PUBLISHED_SEARCH_TABLE} MATCH %s)',
+            [f'tenant : "{tenant_token(tenant_id)}"'],
+        )
+        cursor.executemany(PUBLISHED_INSERT_SQL, rows)
+    return len(rows)
+
+
+def rebuild_published_index(conn=connection):
+    """Re-create the published index from every tenant's latest snapshot"""
+    from .models import PublishedSnapshot, Tenant
+    from .publishing import PublishedContent
+
+    total = 0
+    with transaction.atomic(using=conn.alias):
+        with conn.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {PUBLISHED_SEARCH_TABLE}')
+        for tenant_id in Tenant.objects.using(conn.alias).values_list('pk', flat=True):
+            latest = (PublishedSnapshot._base_manager.using(conn.alias)
+                      .filter(tenant_id=tenant_id).order_by('-version').first())
+            if latest is not None:
+                total += index_published(tenant_id, PublishedContent.from_snapshot(latest), conn)
+    return total
+
+
+def build_match_query(text, tenant_id=None):
+    """
+    Turn free text into a safe FTS5 query over the tenant's rows (the
+    current tenant's by default): every word must match the title or body,
+    the last one as a prefix so results appear while typing. Returns '' if
+    there are no searchable words.
+    """
+    words = WORD.findall(text)[:12]
+    if not words:
+        return ''
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += '*'
+    if tenant_id is None:
+        tenant_id = current_tenant_id()
+    return f'tenant : "{tenant_token(tenant_id)}" AND {{title body}} : ({" ".join(terms)})'
+
+
+def search(text, kinds=None, limit=20):
+    """
+    Ranked full-text search of the current tenant's published rows. Returns
+    dicts with ``kind``, ``object_id``, ``title`` and a highlighted, HTML-safe
+    ``snippet``.
+    """
+    match = build_match_query(text)
+    if not match or not search_available():
+        return []
+
+    sql = (
+        f'SELECT kind, object_id, title, '
+        f"snippet({PUBLISHED_SEARCH_TABLE}, 3, '{MARK_START}', '{MARK_END}', '…', 24), "
+        f'bm25({PUBLISHED_SEARCH_TABLE}, {BM25_WEIGHTS}) AS rank '
+        f'FROM {PUBLISHED_SEARCH_TABLE} WHERE {PUBLISHED_SEARCH_TABLE} MATCH %s'
+    )
+    params = [match]
+    if kinds:
+        sql += f" AND kind IN ({', '.join(['%s'] * len(kinds))})"
+        params.extend(kinds)
+    sql += ' ORDER BY rank LIMIT %s'
+    params.append(limit)
+
+    with read_connection().cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    return [
+        {
+            'kind': kind,
+            'object_id': object_id,
+            'title': title,
+            'snippet': highlight(snippet),
+            'rank': rank,
+        }
+        for kind, object_id, title, snippet, rank in rows
+    ]
+
+
+def matching_pks(kind, text):
+    """
+    Subquery for ``filter(pk__in=...)`` selecting every one of the current
+    tenant's draft ``kind`` rows that matches ``text``, so the database joins the
+    matches instead of Python passing their ids back. None if there are no
+    searchable words.
+    """
+    match = build_match_query(text)
+    if not match:
+        return None
+    return RawSQL(f'SELECT object_id FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s AND kind = %s', [match, kind])
+
+
+def highlight(snippet):
+    return mark_safe(
+        escape(snippet or '').replace(MARK_START, '<mark>').replace(MARK_END, '</mark>')
+    )
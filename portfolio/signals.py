@@ -0,0 +1,60 @@
+from django.apps import apps
+from django.db.models.signals import post_save, post_delete
+
+from . import publishing, search, similarity, social_cards, tenancy
+from .models import Skill, Project, Certificate, Experience, Tenant
+
+
+# Saves only edit the draft. Public pages, caches and the résumé change when
+# the draft is published (see publishing.py), so nothing here touches them.
+
+# Models mirrored into the draft search index the admin searches; the public
+# index is rebuilt from each published version instead (see search.py)
+SEARCH_MODELS = (Project, Certificate, Skill, Experience)
+
+
+def search_document_saved(sender, instance, **kwargs):
+    search.index_object(instance)
+
+
+def search_document_deleted(sender, instance, **kwargs):
+    search.remove_object(instance)
+
+
+for model in SEARCH_MODELS:
+    post_save.connect(search_document_saved, sender=model, dispatch_uid=f'search_saved_{model.__name__}')
+    post_delete.connect(search_document_deleted, sender=model, dispatch_uid=f'search_deleted_{model.__name__}')
+
+
+def project_changed(sender, instance, **kwargs):
+    """Any project edit can change every related list of the project's tenant"""
+    similarity.schedule_rebuild(instance.tenant_id)
+
+
+post_save.connect(project_changed, sender=Project, dispatch_uid='related_saved_Project')
+post_delete.connect(project_changed, sender=Project, dispatch_uid='related_deleted_Project')
+
+
+def project_card_saved(sender, instance, raw=False, **kwargs):
+    """
+    Render the social card in the background once the save is committed;
+    fixtures are left alone. Cards that are no longer used are deleted at the
+    next publish.
+    """
+    if not raw:
+        social_cards.schedule_cards([instance])
+
+
+post_save.connect(project_card_saved, sender=Project, dispatch_uid='card_saved_Project')
+
+
+def tenant_changed(sender, instance, created=False, **kwargs):
+    """A new or changed domain applies at once in this process, within a minute in the others"""
+    tenancy.forget_tenants()
+    if created:
+        # An empty version 1, so the site has something to serve
+        publishing.create_snapshot(apps.get_model, note='Initial version', tenant_id=instance.pk)
+
+
+post_save.connect(tenant_changed, sender=Tenant, dispatch_uid='tenant_saved')
+post_delete.connect(tenant_changed, sender=Tenant, dispatch_uid='tenant_deleted')
@@ -0,0 +1,155 @@
+"""
+Related projects by content similarity.
+
+Every project becomes a TF-IDF vector built from the words of its title,
+description and detailed description (HTML stripped), plus each of its
+technologies and its category as whole tokens. The ``RELATED_PROJECTS``
+nearest neighbours by cosine similarity are stored as RelatedProject rows,
+so the detail page reads its list with one indexed query instead of ranking
+anything per request.
+
+A tenant's rows are recomputed in one batch after a transaction that saved
+or deleted one of its projects (see signals.py), since any change moves the
+IDF weights of every project, and can be rebuilt with ``manage.py
+rebuild_related_projects``. Projects are only ever compared with projects of
+the same tenant.
+"""
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from functools import partial
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils.html import strip_tags
+
+from .tenancy import is_tenant_owned
+
+
+RELATED_PROJECTS = 3
+
+# How much one occurrence of a token from each source counts
+TITLE_WEIGHT = 2.0
+TEXT_WEIGHT = 1.0
+TECHNOLOGY_WEIGHT = 3.0
+CATEGORY_WEIGHT = 1.0
+
+WORD = re.compile(r'[^\W\d_]{3,}', re.UNICODE)
+
+STOP_WORDS = frozenset('''
+    and are but can for from had has have into its not our out over that the their them then
+    there these they this those through using was were what when which while who will with
+    within without you your also more most other some such than very via
+'''.split())
+
+
+def words(text):
+    return [word for word in WORD.findall(strip_tags(text or '').lower()) if word not in STOP_WORDS]
+
+
+def project_terms(title, description, detailed_description, technologies, category):
+    """Weighted term counts for one project"""
+    terms = Counter()
+    for word in words(title):
+        terms[word] += TITLE_WEIGHT
+    for word in words(description) + words(detailed_description):
+        terms[word] += TEXT_WEIGHT
+    for technology in (technologies or '').split(','):
+        technology = technology.strip().lower()
+        if technology:
+            terms[f'tech:{technology}'] += TECHNOLOGY_WEIGHT
+    if category:
+        terms[f'category:{category}'] += CATEGORY_WEIGHT
+    return terms
+
+
+def tfidf_vectors(documents):
+    """
+    ``documents`` maps pk -> weighted term counts. Returns pk -> unit-length
+    sparse vector, with sublinear term frequency and smoothed IDF.
+    """
+    total = len(documents)
+    document_frequency = Counter(term for terms in documents.values() for term in terms)
+    idf = {term: math.log((1 + total) / (1 + df)) + 1 for term, df in document_frequency.items()}
+
+    vectors = {}
+    for pk, terms in documents.items():
+        vector = {term: (1 + math.log(weight)) * idf[term] for term, weight in terms.items()}
+        norm = math.sqrt(sum(value * value for value in vector.values()))
+        vectors[pk] = {term: value / norm for term, value in vector.items()} if norm else {}
+    return vectors
+
+
+def rank_related(documents, limit=RELATED_PROJECTS):
+    """
+    pk -> [(related pk, score), ...] best first, for every project in
+    ``documents``. Dot products are accumulated through an inverted index, so
+    only pairs sharing at least one term are ever scored.
+    """
+    vectors = tfidf_vectors(documents)
+    postings = defaultdict(list)
+    for pk, vector in vectors.items():
+        for term, value in vector.items():
+            postings[term].append((pk, value))
+
+    rankings = {}
+    for pk, vector in vectors.items():
+        scores = defaultdict(float)
+        for term, value in vector.items():
+            for other, other_value in postings[term]:
+                if other != pk:
+                    scores[other] += value * other_value
+        # Ties go to the older project, so rankings are stable between rebuilds
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        rankings[pk] = [(other, score) for other, score in best if score > 0]
+    return rankings
+
+
+def rebuild_related(get_model=None, using=DEFAULT_DB_ALIAS, limit=RELATED_PROJECTS, tenant_id=None):
+    """
+    Recompute the tenant's related lists, or every tenant's, and replace the
+    stored rows; returns the number of rows written. ``get_model`` lets
+    migrations pass ``apps.get_model``.
+    """
+    if get_model is None:
+        from django.apps import apps
+        get_model = apps.get_model
+    Project = get_model('portfolio.Project')
+    RelatedProject = get_model('portfolio.RelatedProject')
+    projects = Project._base_manager.using(using)
+    stored = RelatedProject._base_manager.using(using)
+    if tenant_id is not None:
+        projects, stored = projects.filter(tenant_id=tenant_id), stored.filter(tenant_id=tenant_id)
+
+    fields = ['pk', 'title', 'description', 'detailed_description', 'technologies', 'category']
+    if is_tenant_owned(Project):
+        fields.append('tenant_id')
+    # tenant id -> pk -> terms; None for models from before tenants existed
+    documents = defaultdict(dict)
+    for values in projects.values(*fields).iterator():
+        pk, owner = values.pop('pk'), values.pop('tenant_id', None)
+        documents[owner][pk] = project_terms(**values)
+    rows = []
+    for owner, tenant_documents in documents.items():
+        for pk, related in rank_related(tenant_documents, limit).items():
+            for rank, (other, score) in enumerate(related, start=1):
+                row = RelatedProject(project_id=pk, related_id=other, rank=rank, score=score)
+                if owner is not None:
+                    row.tenant_id = owner
+                rows.append(row)
+    with transaction.atomic(using=using):
+        stored.delete()
+        RelatedProject._base_manager.using(using).bulk_create(rows, batch_size=500)
+    return len(rows)
+
+
+def schedule_rebuild(tenant_id):
+    """
+    Rebuild the tenant's rows once the current transaction commits (at once
+    in autocommit). A transaction that saves many projects still triggers a
+    single rebuild per tenant.
+    """
+    for _, func, _ in connections[DEFAULT_DB_ALIAS].run_on_commit:
+        if isinstance(func, partial) and func.func is rebuild_related and func.keywords['tenant_id'] == tenant_id:
+            return
+    transaction.on_commit(partial(rebuild_related, tenant_id=tenant_id), using=DEFAULT_DB_ALIAS)
@@ -0,0 +1,20 @@
+from django.contrib import admin
+
+
+class PortfolioAdminSite(admin.AdminSite):
+    """
+    The admin of the portfolio the request's host belongs to (see
+    tenancy.py). Staff can sign in only to portfolios they're a member of,
+    and every tenant-owned changelist and form shows that tenant's rows only;
+    superusers can sign in to any portfolio.
+    """
+
+    def has_permission(self, request):
+        if not super().has_permission(request):
+            return False
+        if request.user.is_superuser:
+            return True
+        if not hasattr(request, '_tenant_member'):
+            tenant = getattr(request, 'tenant', None)
+            request._tenant_member = tenant is not None and tenant.members.filter(pk=request.user.pk).exists()
+        return request._tenant_member
@@ -0,0 +1,308 @@
+"""
+Open Graph preview images for project pages.
+
+Each project gets a 1200x630 JPEG card showing its category, title,
+technologies and a crop of its cover image, so link previews fetch a ~100 KB
+file instead of the full-size upload. Cards are rendered on a background
+thread once a project save or duplication commits (see signals.py), or by
+``manage.py render_social_cards``. A card's file
+name carries a hash of everything drawn on it, so an unchanged project is
+never rendered twice and a changed one gets a new URL that social networks
+can't have cached. Replaced cards stay on disk until a publish no longer
+references them, since the published pages keep pointing at the old one.
+Each tenant's cards live in their own directory, so one tenant's publish
+never looks at another's files.
+"""
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connections, transaction
+
+from .tenancy import use_tenant
+
+
+logger = logging.getLogger(__name__)
+
+CARD_SIZE = (1200, 630)
+CARD_DIR = 'projects/cards'
+# Cards rendered before tenants existed sit directly in CARD_DIR
+LEGACY_CARD = re.compile(r'^project-(\d+)-[0-9a-f]+\.jpg$')
+# Bump to re-render every card after changing the layout
+CARD_LAYOUT_VERSION = 1
+JPEG_QUALITY = 85
+MAX_TECHNOLOGIES = 5
+
+# Colours from static/css/base.css
+BACKGROUND = '#050816'
+PANEL = '#0A0E27'
+PRIMARY = '#0A84FF'
+SECONDARY = '#FF6B35'
+ACCENT = '#00D9FF'
+TEXT = '#E8ECF4'
+MUTED = '#8E95A8'
+
+PADDING = 72
+COVER_WIDTH = 520
+
+_executor = None
+# Projects with a render submitted but not started yet
+_queued = set()
+_lock = threading.Lock()
+
+
+def card_fields(project, site_name):
+    """Everything drawn on the card; the card is re-rendered when any of it changes"""
+    return {
+        'layout': CARD_LAYOUT_VERSION,
+        'title': project.title,
+        'category': project.get_category_display(),
+        'technologies': [tech for tech in project.get_technologies_list() if tech][:MAX_TECHNOLOGIES],
+        'cover': project.image.name if project.image else '',
+        'site': site_name,
+    }
+
+
+def card_name(project, fields):
+    digest = hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()[:16]
+    return f'{tenant_card_dir(project.tenant_id)}/project-{project.pk}-{digest}.jpg'
+
+
+def tenant_card_dir(tenant_id):
+    return f'{CARD_DIR}/{tenant_id}'
+
+
+def site_name():
+    """The current tenant's name, printed on its cards"""
+    from .models import About
+
+    about = About.objects.only('name').first()
+    return about.name if about else ''
+
+
+def load_font(family, size):
+    """A font from FONT_SOURCE_DIR (see WEB_FONTS), or Pillow's built-in one"""
+    from PIL import ImageFont
+
+    for font in getattr(settings, 'WEB_FONTS', []):
+        if font['family'] == family:
+            path = settings.FONT_SOURCE_DIR / font['file']
+            if path.exists():
+                return ImageFont.truetype(str(path), size)
+    return ImageFont.load_default(size)
+
+
+def load_cover(name):
+    """The cover image cropped to the card's right-hand column, or None"""
+    from PIL import Image, ImageOps
+
+    try:
+        with default_storage.open(name, 'rb') as source:
+            cover = Image.open(source)
+            cover.draft('RGB', (COVER_WIDTH * 2, CARD_SIZE[1] * 2))
+            return ImageOps.fit(cover.convert('RGB'), (COVER_WIDTH, CARD_SIZE[1]), Image.Resampling.LANCZOS)
+    except (OSError, ValueError):
+        logger.warning('Cover image %s could not be read for a social card', name)
+        return None
+
+
+def wrap_words(draw, text, font, width):
+    """Greedy word wrap by rendered width; a word wider than ``width`` gets a line of its own"""
+    lines = []
+    for word in text.split():
+        if lines and draw.textlength(f'{lines[-1]} {word}', font=font) <= width:
+            lines[-1] = f'{lines[-1]} {word}'
+        else:
+            lines.append(word)
+    return lines
+
+
+def ellipsize(draw, text, font, width):
+    """``text`` cut to end in '…' within ``width`` pixels: by whole words, then by characters"""
+    words = text.split()
+    while len(words) > 1 and draw.textlength(' '.join(words) + '…', font=font) > width:
+        words.pop()
+    text = ' '.join(words)
+    while len(text) > 1 and draw.textlength(text + '…', font=font) > width:
+        text = text[:-1]
+    return text.rstrip() + '…'
+
+
+def wrap_title(draw, title, width):
+    """Largest title size that fits in three lines of ``width`` pixels"""
+    for size in (72, 64, 56, 48):
+        font = load_font('Syne', size)
+        lines = wrap_words(draw, title, font, width)
+        if len(lines) <= 3 and all(draw.textlength(line, font=font) <= width for line in lines):
+            return font, lines
+    # Still too long at the smallest size: keep at most three lines, cutting
+    # any that's too wide and the last one if more text followed
+    kept = [
+        line if draw.textlength(line, font=font) <= width else ellipsize(draw, line, font, width)
+        for line in lines[:3]
+    ]
+    if len(lines) > 3 and not kept[-1].endswith('…'):
+        kept[-1] = ellipsize(draw, lines[2], font, width)
+    return font, kept
+
+
+def render_card(fields):
+    """JPEG bytes of the card described by ``fields``"""
+    from PIL import Image, ImageDraw
+
+    width, height = CARD_SIZE
+    card = Image.new('RGB', CARD_SIZE, BACKGROUND)
+    text_width = width - 2 * PADDING
+
+    cover = load_cover(fields['cover']) if fields['cover'] else None
+    if cover is not None:
+        # Fade the cover into the background behind the text
+        fade = Image.linear_gradient('L').rotate(90).resize((COVER_WIDTH, height))
+        fade = fade.point(lambda value: min(255, value * 2))
+        card.paste(cover, (width - COVER_WIDTH, 0), fade)
+        text_width = width - COVER_WIDTH - PADDING
+
+    draw = ImageDraw.Draw(card)
+    draw.rectangle([0, 0, 12, height], fill=PRIMARY)
+
+    y = PADDING
+    draw.text((PADDING, y), fields['category'].upper(), font=load_font('JetBrains Mono', 26), fill=ACCENT)
+    y += 60
+
+    title_font, lines = wrap_title(draw, fields['title'], text_width)
+    line_height = int(title_font.size * 1.15)
+    for line in lines:
+        draw.text((PADDING, y), line, font=title_font, fill=TEXT)
+        y += line_height
+    y += 28
+
+    chip_font = load_font('JetBrains Mono', 24)
+    x = PADDING
+    for tech in fields['technologies']:
+        chip_width = int(draw.textlength(tech, font=chip_font)) + 32
+        if x + chip_width > PADDING + text_width:
+            break
+        draw.rounded_rectangle([x, y, x + chip_width, y + 44], radius=10, fill=PANEL, outline=PRIMARY, width=2)
+        draw.text((x + 16, y + 22), tech, font=chip_font, fill=TEXT, anchor='lm')
+        x += chip_width + 12
+
+    if fields['site']:
+        draw.text((PADDING, height - PADDING), fields['site'], font=load_font('Syne', 30),
+                  fill=MUTED, anchor='ls')
+    draw.rectangle([0, height - 8, width // 2, height], fill=PRIMARY)
+    draw.rectangle([width // 2, height - 8, width, height], fill=SECONDARY)
+
+    buffer = io.BytesIO()
+    card.save(buffer, format='JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def update_card(project, site=None, force=False):
+    """
+    Render the project's card unless an up-to-date one exists and point the
+    project at it. Returns True if a card was written.
+    """
+    from .models import Project
+
+    fields = card_fields(project, site_name() if site is None else site)
+    name = card_name(project, fields)
+    old = project.social_card.name
+    if old == name and not force and default_storage.exists(name):
+        return False
+
+    if default_storage.exists(name):
+        default_storage.delete(name)
+    default_storage.save(name, ContentFile(render_card(fields)))
+    # update() rather than save(): the card is derived data, not an edit
+    Project.objects.filter(pk=project.pk).update(social_card=name)
+    project.social_card.name = name
+    return True
+
+
+def render_queued_cards(tenant_id, pks):
+    from .models import Project, Tenant
+
+    with _lock:
+        _queued.difference_update(pks)
+    try:
+        with use_tenant(Tenant.objects.get(pk=tenant_id)):
+            site = site_name()
+            for project in Project.objects.filter(pk__in=pks):
+                try:
+                    update_card(project, site)
+                except Exception:
+                    logger.exception('Rendering the social card of project %s failed', project.pk)
+    except Exception:
+        logger.exception('Rendering social cards of tenant %s failed', tenant_id)
+    finally:
+        connections.close_all()
+
+
+def schedule_cards(projects):
+    """
+    Render the projects' cards on a background thread after the current
+    transaction commits, so a request never waits on Pillow or fails with it
+    """
+    pks_by_tenant = defaultdict(set)
+    for project in projects:
+        pks_by_tenant[project.tenant_id].add(project.pk)
+
+    def submit():
+        global _executor
+        for tenant_id, pks in pks_by_tenant.items():
+            with _lock:
+                pks = pks - _queued  # a render that hasn't started yet will see this change
+                if not pks:
+                    continue
+                _queued.update(pks)
+                if _executor is None:
+                    _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='social-cards')
+            _executor.submit(render_queued_cards, tenant_id, pks)
+
+    transaction.on_commit(submit, robust=True)
+
+
+def _reset_after_fork():
+    global _executor, _queued, _lock
+    _executor, _queued, _lock = None, set(), threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def listdir(directory):
+    try:
+        return default_storage.listdir(directory)[1]
+    except FileNotFoundError:
+        return []
+
+
+def delete_unused_cards(tenant_id, keep=()):
+    """
+    Delete the tenant's cards that neither one of its projects nor ``keep``
+    (its published content's cards) points at; returns how many were deleted
+    """
+    from .models import Project
+
+    projects = Project._base_manager.filter(tenant_id=tenant_id)
+    used = set(keep) | set(projects.exclude(social_card='').values_list('social_card', flat=True))
+    directory = tenant_card_dir(tenant_id)
+    candidates = [f'{directory}/{name}' for name in listdir(directory)]
+    legacy = [name for name in listdir(CARD_DIR) if LEGACY_CARD.match(name)]
+    if legacy:
+        pks = set(projects.values_list('pk', flat=True))
+        candidates += [f'{CARD_DIR}/{name}' for name in legacy if int(LEGACY_CARD.match(name)[1]) in pks]
+    unused = [name for name in candidates if name not in used]
+    for name in unused:
+        default_storage.delete(name)
+    return len(unused)
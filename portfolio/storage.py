@@ -0,0 +1,74 @@
+import gzip
+import os
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; gzip siblings are always written
+    brotli = None
+
+
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.mjs', '.svg', '.html', '.json', '.txt', '.xml', '.map')
+
+# Below this size the encoding headers cost more than compression saves.
+MIN_COMPRESS_SIZE = 256
+
+
+def compress_file(path):
+    """
+    Write ``path.gz`` (and ``path.br`` when Brotli is installed) next to
+    ``path``, skipping any variant that wouldn't be smaller than the original.
+    A skipped variant's existing file is deleted, so an older build's copy is
+    never served for the new content. Returns the suffixes written.
+    """
+    with open(path, 'rb') as fh:
+        content = fh.read()
+
+    variants = [
+        ('.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0)),
+        ('.br', None if brotli is None else lambda data: brotli.compress(data, quality=11)),
+    ]
+
+    written = []
+    for suffix, compress in variants:
+        compressed = None
+        if compress is not None and len(content) >= MIN_COMPRESS_SIZE:
+            compressed = compress(content)
+        if compressed is not None and len(compressed) < len(content):
+            with open(path + suffix, 'wb') as fh:
+                fh.write(compressed)
+            written.append(suffix)
+        else:
+            try:
+                os.remove(path + suffix)
+            except FileNotFoundError:
+                pass
+    return written
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    Manifest storage that also emits precompressed ``.gz``/``.br`` siblings
+    for text assets, so StaticFilesMiddleware can serve them without
+    compressing on every request.
+    """
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+        if dry_run:
+            return
+
+        for name in self.compressible_names(paths):
+            for suffix in compress_file(self.path(name)):
+                yield name, name + suffix, True
+
+    def compressible_names(self, paths):
+        """Original and hashed names of every compressible collected file"""
+        for name in paths:
+            if not name.endswith(COMPRESSIBLE_EXTENSIONS):
+                continue
+            yield name
+            hashed_name = self.hashed_files.get(self.hash_key(self.clean_name(name)))
+            if hashed_name and hashed_name != name:
+                yield hashed_name
@@ -0,0 +1,91 @@
+from functools import lru_cache
+
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import mark_safe
+
+from portfolio.fonts import FONTS_CSS, font_filename
+
+register = template.Library()
+
+GOOGLE_FONTS_URL = (
+    'https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;600;700'
+    '&family=Syne:wght@400;600;700;800&display=swap'
+)
+
+_critical_css_cache = {}
+
+
+def get_critical_css(page):
+    """Return the generated critical CSS for a page, or '' if it hasn't been built"""
+    if page in _critical_css_cache and not settings.DEBUG:
+        return _critical_css_cache[page]
+    path = settings.CRITICAL_CSS_DIR / f'{page}.css'
+    try:
+        css = path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        css = ''
+    _critical_css_cache[page] = css
+    return css
+
+
+@register.simple_tag
+def stylesheets(*paths, page=None):
+    """
+    Emit the stylesheets for a page.
+
+    When critical CSS has been built for ``page`` (see ``manage.py
+    build_critical_css``) it is inlined and the full stylesheets are loaded
+    asynchronously; otherwise they are linked as ordinary blocking stylesheets.
+    """
+    urls = [(static(path),) for path in paths]
+    critical = get_critical_css(page) if page else ''
+    if not critical:
+        return format_html_join('\n', '<link rel="stylesheet" href="{}">', urls)
+
+    return format_html(
+        '<style>{}</style>\n{}\n<noscript>{}</noscript>',
+        mark_safe(critical),
+        format_html_join(
+            '\n',
+            '<link rel="preload" href="{}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">',
+            urls,
+        ),
+        format_html_join('', '<link rel="stylesheet" href="{}">', urls),
+    )
+
+
+@register.simple_tag(takes_context=True)
+def absolute_url(context, url):
+    """``url`` with the scheme and host of the current request, e.g. for og:image"""
+    return context['request'].build_absolute_uri(url)
+
+
+@lru_cache(maxsize=None)
+def self_hosted_fonts_built():
+    return finders.find(FONTS_CSS) is not None
+
+
+@register.simple_tag
+def web_fonts():
+    """
+    Preload the self-hosted WOFF2 fonts and link their @font-face rules, or
+    fall back to Google Fonts if `manage.py subset_fonts` hasn't been run.
+    """
+    if not self_hosted_fonts_built():
+        return format_html(
+            '<link rel="preconnect" href="https://fonts.googleapis.com">\n'
+            '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>\n'
+            '<link href="{}" rel="stylesheet">',
+            GOOGLE_FONTS_URL,
+        )
+
+    preloads = format_html_join(
+        '\n',
+        '<link rel="preload" href="{}" as="font" type="font/woff2" crossorigin>',
+        ((static(f'fonts/{font_filename(font)}'),) for font in settings.WEB_FONTS),
+    )
+    return format_html('{}\n<link rel="stylesheet" href="{}">', preloads, static(FONTS_CSS))
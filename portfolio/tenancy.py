@@ -0,0 +1,225 @@
+"""
+Many portfolios served from one deployment.
+
+Each Tenant is one hosted portfolio, served on its own domain. TenantMiddleware
+matches the request's host to a tenant and makes it current for the rest of
+the request, in a context variable like the replica flag in replica.py, so it
+follows async views into their worker threads. Hosts no tenant claims are
+served by the TENANT_FALLBACK tenant, or get a 404 when that's None.
+
+Every content model derives from TenantOwned, whose default manager scopes
+queries to the current tenant: the admin, model forms, unique checks and
+related managers only ever see the current tenant's rows, and new rows are
+assigned to it. Outside a request (management commands, migrations,
+background threads) no tenant is current and managers return every tenant's
+rows; code that works on one tenant either enters ``use_tenant()`` or filters
+on ``tenant_id`` itself.
+
+Host lookups and published content (see publishing.py) are held in LRU maps,
+so a worker keeps in memory only the tenants that are actually getting
+traffic, however many exist.
+"""
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.http.request import split_domain_port
+
+
+# Seconds a worker trusts its host -> tenant lookups; the admin process
+# forgets them as soon as a tenant is saved (see signals.py)
+HOST_CACHE_TIMEOUT = 60
+
+_current = ContextVar('portfolio_tenant', default=None)
+MISSING = object()
+
+
+class LRU:
+    """A map of at most ``maxsize`` items that drops the least recently used first; thread-safe"""
+    _instances = weakref.WeakSet()
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.lock = threading.Lock()
+        LRU._instances.add(self)
+
+    def __len__(self):
+        return len(self.data)
+
+    def get(self, key, default=None):
+        with self.lock:
+            if key not in self.data:
+                return default
+            self.data.move_to_end(key)
+            return self.data[key]
+
+    def set(self, key, value):
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+    def setdefault(self, key, value):
+        """The stored value for ``key``, storing ``value`` first if there's none"""
+        with self.lock:
+            if key in self.data:
+                self.data.move_to_end(key)
+                return self.data[key]
+        self.set(key, value)
+        return value
+
+    def pop(self, key, default=None):
+        with self.lock:
+            return self.data.pop(key, default)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+
+
+def cache_size():
+    return getattr(settings, 'TENANT_CACHE_SIZE', 1000)
+
+
+_hosts = LRU(cache_size())
+
+
+# ==================== CURRENT TENANT ====================
+
+def current_tenant():
+    """The tenant of the request being served, or None outside one"""
+    return _current.get()
+
+
+def current_tenant_id():
+    tenant = _current.get()
+    return tenant.pk if tenant is not None else None
+
+
+@contextmanager
+def use_tenant(tenant):
+    """Make ``tenant`` current inside the block, e.g. in a management command or worker thread"""
+    token = _current.set(tenant)
+    try:
+        yield tenant
+    finally:
+        _current.reset(token)
+
+
+def require_tenant():
+    """
+    The current tenant, or outside a request the fallback tenant, which keeps
+    scripts written for a single portfolio working
+    """
+    tenant = current_tenant() or fallback_tenant()
+    if tenant is None:
+        raise RuntimeError('No tenant is current; wrap the call in use_tenant()')
+    return tenant
+
+
+def is_tenant_owned(model):
+    """False for models as migrations from before tenants existed see them"""
+    return any(field.name == 'tenant' for field in model._meta.concrete_fields)
+
+
+# ==================== RESOLVING ====================
+
+def cached(key, load):
+    now = time.monotonic()
+    entry = _hosts.get(key)
+    if entry is not None and entry[1] > now:
+        return entry[0]
+    tenant = load()
+    _hosts.set(key, (tenant, now + HOST_CACHE_TIMEOUT))
+    return tenant
+
+
+def cached_only(key):
+    """The cached lookup for ``key`` if it's still fresh, else ``MISSING``; never queries"""
+    entry = _hosts.get(key)
+    if entry is not None and entry[1] > time.monotonic():
+        return entry[0]
+    return MISSING
+
+
+def find_tenant(slug):
+    from .models import Tenant
+
+    return cached(('slug', slug), lambda: Tenant.objects.filter(slug=slug, is_active=True).first())
+
+
+def fallback_tenant():
+    slug = getattr(settings, 'TENANT_FALLBACK', None)
+    return find_tenant(slug) if slug else None
+
+
+def normalize_domain(host):
+    domain, _ = split_domain_port(host)
+    return domain or host.lower().rstrip('.')
+
+
+def tenant_for_host(host):
+    """The active tenant serving ``host`` (port ignored), else the fallback tenant, else None"""
+    from .models import Tenant
+
+    domain = normalize_domain(host)
+    tenant = cached(('host', domain), lambda: Tenant.objects.filter(domain=domain, is_active=True).first())
+    return tenant or fallback_tenant()
+
+
+def cached_tenant_for_host(host):
+    """``tenant_for_host`` answered from memory, or ``MISSING`` when that needs a query"""
+    tenant = cached_only(('host', normalize_domain(host)))
+    if tenant is MISSING or tenant is not None:
+        return tenant
+    slug = getattr(settings, 'TENANT_FALLBACK', None)
+    return cached_only(('slug', slug)) if slug else None
+
+
+def forget_tenants():
+    """Drop this worker's lookups, e.g. after a tenant's domain changed"""
+    _hosts.clear()
+
+
+# ==================== MANAGEMENT COMMANDS ====================
+
+def add_tenant_argument(parser, help=None):
+    parser.add_argument(
+        '--tenant', metavar='SLUG',
+        help=help or 'Slug of the tenant to work on (default: the TENANT_FALLBACK tenant)'
+    )
+
+
+def command_tenant(slug):
+    """The tenant a command's --tenant names, or the fallback tenant"""
+    from django.core.management.base import CommandError
+
+    tenant = find_tenant(slug) if slug else fallback_tenant()
+    if tenant is None:
+        raise CommandError(f"No active tenant '{slug}'" if slug else 'Pass --tenant; there is no fallback tenant')
+    return tenant
+
+
+def command_tenants(slug):
+    """The tenant --tenant names, or every active tenant"""
+    from .models import Tenant
+
+    if slug:
+        return [command_tenant(slug)]
+    return list(Tenant.objects.filter(is_active=True))
+
+
+def _reset_after_fork():
+    for lru in list(LRU._instances):
+        lru.lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -1,3 +1,1403 @@
-from django.test import TestCase
+import asyncio
+import csv
+import gzip
+import importlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.cache import cache, caches
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import ContentFile
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, connection, connections
+from django.http import HttpResponse
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import clear_url_caches, resolve, reverse
+from django.utils import timezone
+
+from . import (
+    async_views, crawlers, duplication, pageviews, publishing, replica, resume, search, similarity, tenancy,
+    urls, warmup,
+)
+from .admin import ContactMessageAdmin
+from .cache import versioned_key
+from .cache_backends import TwoTierCache
+from .export import export_queryset, import_pyarrow
+from .management.commands import build_critical_css, import_times
+from .middleware import CompressionMiddleware, accepts_encoding, parse_accept_encoding
+from .models import (
+    About, Certificate, ContactMessage, Education, Experience, PageViewCounter, Project, ProjectImage,
+    PublishedSnapshot, RelatedProject, ReplicaSnapshot, Skill, Tenant,
+)
+from .social_cards import CARD_SIZE, PADDING, wrap_title
+from .storage import compress_file
+from .templatetags import portfolio_tags
+
+
+@override_settings(
+    ALLOWED_HOSTS=['.test'],
+    TENANT_FALLBACK=None,
+    # Every request re-checks the latest version, like a worker whose check is due
+    PUBLISHED_CHECK_INTERVAL=0,
+    WARMUP_URLS=[],
+    STORAGES={
+        'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    },
+    CACHES={
+        'default': {
+            'BACKEND': 'portfolio.cache_backends.TwoTierCache',
+            'LOCATION': 'portfolio-tests',
+            'OPTIONS': {'SHARED': 'shared'},
+        },
+        'shared': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'portfolio-tests'},
+    },
+)
+class PortfolioTestCase(TestCase):
+    """
+    Tenants one.test and two.test. Test transactions are rolled back, so
+    SQLite hands out the same tenant ids and versions again; the worker's
+    memory of them is dropped before each test.
+    """
+
+    def setUp(self):
+        tenancy.forget_tenants()
+        publishing._slots.clear()
+        cache.clear()
+        # A counted view starts the flusher thread, which would outlive the test database
+        counting = pageviews.not_counted()
+        counting.__enter__()
+        self.addCleanup(counting.__exit__, None, None, None)
+        self.one = Tenant.objects.create(slug='one', name='One', domain='one.test')
+        self.two = Tenant.objects.create(slug='two', name='Two', domain='two.test')
+
+    def add_projects(self, tenant, *titles):
+        with tenancy.use_tenant(tenant):
+            return [
+                Project.objects.create(title=title, description=title, technologies='Python, SQL')
+                for title in titles
+            ]
+
+    def publish(self, tenant):
+        with tenancy.use_tenant(tenant):
+            return publishing.publish(published_by='tests')
+
+
+class SessionTests(PortfolioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.add_projects(self.one, 'Churn model')
+        self.publish(self.one)
+
+    def test_anonymous_pages_set_no_cookie(self):
+        for url in ('/', '/projects/', '/search/?q=churn', '/contact/'):
+            with self.subTest(url=url):
+                response = self.client.get(url, HTTP_HOST='one.test')
+                self.assertEqual(response.status_code, 200)
+                self.assertNotIn(settings.SESSION_COOKIE_NAME, response.cookies)
+                # The contact form's CSRF token varies on its own cookie
+                if url != '/contact/':
+                    self.assertNotIn('Cookie', response.get('Vary', ''))
+
+    def test_logging_in_still_starts_a_session(self):
+        get_user_model().objects.create_superuser('admin', 'admin@example.com', 'pw')
+        response = self.client.post(
+            '/admin/login/', {'username': 'admin', 'password': 'pw', 'next': '/admin/'}, HTTP_HOST='one.test'
+        )
+        self.assertRedirects(response, '/admin/', fetch_redirect_response=False)
+        self.assertIn(settings.SESSION_COOKIE_NAME, response.cookies)
+        self.assertEqual(self.client.get('/admin/', HTTP_HOST='one.test').status_code, 200)
+
+
+class CriticalCssTests(SimpleTestCase):
+
+    def test_committed_files_fit_the_budget(self):
+        sizes = {path.name: path.stat().st_size for path in settings.CRITICAL_CSS_DIR.glob('*.css')}
+        self.assertTrue(sizes)
+        self.assertEqual({name: size for name, size in sizes.items() if size > settings.CRITICAL_CSS_BUDGET}, {})
+
+    def test_fold_stops_within_a_long_first_section(self):
+        content = '<div class="hero">Title</div>' + '<p class="below">Body</p>' * 500
+        source = '{% extends "portfolio/base.html" %}{% block content %}' + content + '{% endblock %}'
+        fold = build_critical_css.Command().above_the_fold(source)
+        self.assertLessEqual(len(fold), build_critical_css.FOLD_MARKUP_CHARS)
+        self.assertTrue(fold.startswith('<div class="hero">'))
+        self.assertTrue(fold.endswith('>'))
+
+    def test_over_budget_build_fails_without_writing(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with override_settings(CRITICAL_CSS_DIR=Path(directory), CRITICAL_CSS_BUDGET=1024):
+                with self.assertRaisesMessage(CommandError, 'CRITICAL_CSS_BUDGET'):
+                    call_command('build_critical_css', 'home', stdout=StringIO())
+            self.assertEqual(os.listdir(directory), [])
+
+
+class AcceptEncodingTests(SimpleTestCase):
+
+    def accepts(self, header, encoding):
+        return accepts_encoding(parse_accept_encoding(header), encoding)
+
+    def test_listed_codings(self):
+        self.assertTrue(self.accepts('gzip, deflate, br', 'br'))
+        self.assertTrue(self.accepts('GZIP', 'gzip'))
+        self.assertTrue(self.accepts('x-gzip', 'gzip'))
+        self.assertFalse(self.accepts('gzip', 'br'))
+        self.assertFalse(self.accepts('', 'gzip'))
+
+    def test_zero_q_value_refuses_a_coding(self):
+        self.assertFalse(self.accepts('br;q=0, gzip', 'br'))
+        self.assertFalse(self.accepts('br; q=0.0', 'br'))
+        self.assertTrue(self.accepts('br;q=0.1', 'br'))
+        self.assertFalse(self.accepts('br;q=nonsense', 'br'))
+
+    def test_wildcard(self):
+        self.assertTrue(self.accepts('*', 'br'))
+        self.assertFalse(self.accepts('*;q=0', 'gzip'))
+        self.assertFalse(self.accepts('*, br;q=0', 'br'))
+        self.assertTrue(self.accepts('*;q=0, gzip', 'gzip'))
+
+
+class StaticCompressionTests(PortfolioTestCase):
+
+    def test_static_files_honour_q_values(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, 'site.css')
+            with open(path, 'w') as fh:
+                fh.write('body { color: #333; }\n' * 100)
+            compress_file(path)
+            with override_settings(STATIC_ROOT=root):
+                # A new client builds its middleware with this STATIC_ROOT
+                client = self.client_class()
+                response = client.get('/static/site.css', HTTP_HOST='one.test', HTTP_ACCEPT_ENCODING='br;q=0, gzip')
+                self.assertEqual(response['Content-Encoding'], 'gzip')
+                self.assertEqual(gzip.decompress(b''.join(response.streaming_content)).count(b'body'), 100)
+                response.close()
+                response = client.get('/static/site.css', HTTP_HOST='one.test', HTTP_ACCEPT_ENCODING='*;q=0')
+                self.assertFalse(response.has_header('Content-Encoding'))
+                response.close()
+
+    def test_skipped_variants_delete_stale_siblings(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, 'site.css')
+            with open(path, 'w') as fh:
+                fh.write('body { color: #333; }\n' * 100)
+            self.assertIn('.gz', compress_file(path))
+            with open(path, 'w') as fh:
+                fh.write('a{}')
+            self.assertEqual(compress_file(path), [])
+            self.assertFalse(os.path.exists(path + '.gz'))
+            self.assertFalse(os.path.exists(path + '.br'))
+
+
+class CompressionMiddlewareTests(PortfolioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.add_projects(self.one, *[f'Project {n}' for n in range(5)])
+        self.publish(self.one)
+
+    def encoding(self, accept):
+        response = self.client.get('/api/portfolio.json', HTTP_HOST='one.test', HTTP_ACCEPT_ENCODING=accept)
+        return response.get('Content-Encoding')
+
+    def test_dynamic_responses_honour_q_values(self):
+        self.assertEqual(self.encoding('gzip'), 'gzip')
+        self.assertEqual(self.encoding('br;q=0, gzip'), 'gzip')
+        self.assertIsNone(self.encoding('gzip;q=0'))
+        self.assertIsNone(self.encoding(''))
+
+    def test_identical_bodies_are_compressed_once(self):
+        with mock.patch.object(CompressionMiddleware, 'compress', autospec=True,
+                               side_effect=lambda middleware, content, encoding: gzip.compress(content)) as compress:
+            first = self.client.get('/api/portfolio.json', HTTP_HOST='one.test', HTTP_ACCEPT_ENCODING='gzip')
+            second = self.client.get('/api/portfolio.json', HTTP_HOST='one.test', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(compress.call_count, 1)
+        self.assertEqual(first.content, second.content)
+        self.assertIn(b'Project 0', gzip.decompress(second.content))
+
+
+@override_settings(STORAGES={'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'}})
+class WebFontTests(SimpleTestCase):
+
+    def test_google_fonts_until_the_subsets_are_built(self):
+        with mock.patch.object(portfolio_tags, 'self_hosted_fonts_built', return_value=False):
+            html = portfolio_tags.web_fonts()
+        self.assertIn('fonts.googleapis.com', html)
+        self.assertNotIn('rel="preload"', html)
+
+    def test_self_hosted_fonts_are_preloaded(self):
+        with mock.patch.object(portfolio_tags, 'self_hosted_fonts_built', return_value=True):
+            html = portfolio_tags.web_fonts()
+        self.assertNotIn('googleapis', html)
+        self.assertEqual(html.count('rel="preload"'), len(settings.WEB_FONTS))
+        self.assertIn('/static/css/fonts.css', html)
+
+    def test_subsetting_needs_the_font_sources(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with override_settings(FONT_SOURCE_DIR=Path(directory), STATICFILES_DIRS=[Path(directory)]):
+                with self.assertRaisesMessage(CommandError, 'not found'):
+                    call_command('subset_fonts', '--skip-database', stdout=StringIO())
+
+
+class AdminSearchTests(PortfolioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(get_user_model().objects.create_superuser('admin', 'admin@example.com', 'pw'))
+        self.churn, _ = self.add_projects(self.one, 'Churn model', 'Sales dashboard')
+        self.add_projects(self.two, 'Churn forecast')
+
+    def results(self, query):
+        response = self.client.get('/admin/portfolio/project/', {'q': query}, HTTP_HOST='one.test')
+        return sorted(project.title for project in response.context['cl'].result_list)
+
+    def test_search_box_matches_the_draft_index(self):
+        self.assertEqual(self.results('churn'), ['Churn model'])
+        self.assertEqual(self.results('sales dash'), ['Sales dashboard'])
+        with tenancy.use_tenant(self.one):
+            self.churn.title = 'Retention model'
+            self.churn.save()
+        # Saves are searchable in the admin at once, published or not
+        self.assertEqual(self.results('retention'), ['Retention model'])
+        self.assertEqual(self.results('forecast'), [])
+
+    def test_text_without_words_matches_nothing(self):
+        self.assertEqual(self.results('"*"'), [])
+        self.assertEqual(self.results(''), ['Churn model', 'Sales dashboard'])
+
+    def test_matches_are_filtered_in_the_changelist_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.results('churn')
+        searches = [query['sql'] for query in queries if search.SEARCH_TABLE in query['sql']]
+        self.assertTrue(searches)
+        self.assertTrue(all('portfolio_project' in sql for sql in searches))
+
+
+class ApiTests(PortfolioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.projects = self.add_projects(self.one, *[f'Project {n}' for n in range(5)])
+        self.publish(self.one)
+
+    def test_keyset_pages_cover_every_row_once(self):
+        seen = []
+        url = '/api/projects/?limit=2&fields=id'
+        while url:
+            data = self.client.get(url, HTTP_HOST='one.test').json()
+            seen += [row['id'] for row in data['results']]
+            self.assertLessEqual(len(data['results']), 2)
+            url = data['next']
+        self.assertEqual(seen, [project.pk for project in self.projects])
+
+    def test_etag_revalidates_until_the_next_publish(self):
+        response = self.client.get('/api/projects/', HTTP_HOST='one.test')
+        etag = response['ETag']
+        response = self.client.get('/api/projects/', HTTP_HOST='one.test', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.add_projects(self.one, 'Project 5')
+        self.publish(self.one)
+        response = self.client.get('/api/projects/', HTTP_HOST='one.test', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_etag_differs_per_query(self):
+        first = self.client.get('/api/projects/?limit=2', HTTP_HOST='one.test')
+        second = self.client.get('/api/projects/?limit=3', HTTP_HOST='one.test')
+        self.assertNotEqual(first['ETag'], second['ETag'])
+
+
+class ChangelistQueryTests(PortfolioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(get_user_model().objects.create_superuser('admin', 'admin@example.com', 'pw'))
+
+    def add_project(self, title, technologies, images=0, views=0):
+        with tenancy.use_tenant(self.one):
+            project = Project.objects.create(title=title, description=title, technologies=technologies)
+            for number in range(images):
+                ProjectImage.objects.create(project=project, image=f'projects/gallery/{title}-{number}.png')
+            if views:
+                PageViewCounter.objects.create(page='project_detail', object_id=project.pk,
+                                               day=timezone.localdate(), views=views)
+        return project
+
+    def changelist(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/admin/portfolio/project/', HTTP_HOST='one.test')
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries)
+
+    def test_columns_come_from_the_changelist_query(self):
+        self.add_project('Churn model', ' Python ,SQL, Pandas, Tableau', images=2, views=7)
+        response, _ = self.changelist()
+        project = response.context['cl'].result_list[0]
+        self.assertEqual((project.tech_1, project.tech_2, project.tech_3), ('Python', 'SQL', 'Pandas'))
+        self.assertEqual((project.image_total, project.view_total), (2, 7))
+        self.assertEqual(
+            project.get_deferred_fields(),
+            {'description', 'detailed_description', 'technologies', 'key_achievements'},
+        )
+        self.assertNotContains(response, 'Tableau')
+
+    def test_short_technology_lists_leave_the_rest_blank(self):
+        self.add_project('Churn model', 'Python')
+        project = self.changelist()[0].context['cl'].result_list[0]
+        self.assertEqual((project.tech_1, project.tech_2, project.tech_3), ('Python', '', ''))
+        self.assertEqual((project.image_total, project.view_total), (0, 0))
+
+    def test_query_count_does_not_grow_with_rows(self):
+        self.add_project('Churn model', 'Python, SQL', images=1, views=3)
+        # The first request also looks up the tenant
+        self.changelist()
+        _, few = self.changelist()
+        for number in range(10):
+            self.add_project(f'Project {number}', 'Python, SQL', images=2, views=number + 1)
+        _, many = self.changelist()
+        self.assertEqual(many, few)
+
+
+class DuplicationTests(PortfolioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.enterContext(self.settings(MEDIA_ROOT=media.name))
+
+    def add_gallery(self, project, count):
+        with tenancy.use_tenant(project.tenant):
+            for number in range(count):
+                image = ProjectImage(project=project, caption=f'Shot {number}')
+                image.image.save(f'shot-{number}.png', ContentFile(b'png'), save=False)
+                image.save()
+
+    def duplicate(self, queryset, **kwargs):
+        with mock.patch('portfolio.similarity.schedule_rebuild'), \
+                mock.patch('portfolio.social_cards.schedule_cards'):
+            with self.captureOnCommitCallbacks(execute=True):
+                return duplication.duplicate_projects(queryset, **kwargs)
+
+    def test_copies_projects_with_their_galleries(self):
+        churn, = self.add_projects(self.one, 'Churn model')
+        self.add_gallery(churn, 2)
+        with tenancy.use_tenant(self.one):
+            copy, = self.duplicate(Project.objects.filter(pk=churn.pk))
+            self.assertEqual(copy.title, 'Churn model (Copy)')
+            self.assertEqual(copy.tenant, self.one)
+            originals = list(churn.images.order_by('caption'))
+            copies = list(copy.images.order_by('caption'))
+        self.assertEqual([image.caption for image in copies], ['Shot 0', 'Shot 1'])
+        for original, image in zip(originals, copies):
+            # Each copy gets its own file, so deleting one doesn't break the other
+            self.assertNotEqual(image.image.name, original.image.name)
+            self.assertTrue(image.image.storage.exists(image.image.name))
+        self.assertEqual(ProjectImage.objects.filter(project=churn).count(), 2)
+
+    def test_copies_are_searchable_in_the_admin(self):
+        self.add_projects(self.one, 'Churn model')
+        with tenancy.use_tenant(self.one):
+            self.duplicate(Project.objects.all(), copy_files=False)
+            matches = Project.objects.filter(pk__in=search.matching_pks('project', 'copy'))
+            self.assertEqual([project.title for project in matches], ['Churn model (Copy)'])
+
+    def test_query_count_does_not_grow_with_rows(self):
+        def queries_to_duplicate(count):
+            projects = self.add_projects(self.one, *[f'Project {number}' for number in range(count)])
+            for project in projects:
+                self.add_gallery(project, 2)
+            with tenancy.use_tenant(self.one), CaptureQueriesContext(connection) as queries:
+                self.duplicate(Project.objects.filter(pk__in=[project.pk for project in projects]), copy_files=False)
+            return len(queries)
+
+        self.assertEqual(queries_to_duplicate(5), queries_to_duplicate(1))
+
+    def test_admin_action(self):
+        self.client.force_login(get_user_model().objects.create_superuser('admin', 'admin@example.com', 'pw'))
+        projects = self.add_projects(self.one, 'Churn model', 'Sales dashboard')
+        with mock.patch('portfolio.similarity.schedule_rebuild'), mock.patch('portfolio.social_cards.schedule_cards'):
+            response = self.client.post(
+                '/admin/portfolio/project/',
+                {'action': 'duplicate_project', '_selected_action': [project.pk for project in projects]},
+                HTTP_HOST='one.test', follow=True,
+            )
+        self.assertContains(response, '2 project(s) duplicated with their galleries.')
+        with tenancy.use_tenant(self.one):
+            self.assertEqual(
+                sorted(Project.objects.values_list('title', flat=True)),
+                ['Churn model', 'Churn model (Copy)', 'Sales dashboard', 'Sales dashboard (Copy)'],
+            )
+
+
+class ContactInboxTests(PortfolioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        admin = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'pw')
+        self.client.force_login(admin)
+        now = timezone.now()
+        with tenancy.use_tenant(self.one):
+            for n in range(7):
+                ContactMessage.objects.create(name=f'Sender {n}', email='a@example.com', subject='Hi', message='')
+            # Pairs share a timestamp; the id breaks the tie
+            for n, message in enumerate(ContactMessage.objects.order_by('pk')):
+                ContactMessage.objects.filter(pk=message.pk).update(created_at=now - timedelta(days=n // 2))
+            self.expected = list(ContactMessage.objects.values_list('pk', flat=True))
+        with tenancy.use_tenant(self.two):
+            ContactMessage.objects.create(name='Other', email='b@example.com', subject='Hi', message='')
+
+    @mock.patch.object(ContactMessageAdmin, 'list_per_page', 3)
+    def test_keyset_pages_follow_the_inbox_order(self):
+        seen = []
+        url = '/admin/portfolio/contactmessage/'
+        while url:
+            response = self.client.get(url, HTTP_HOST='one.test')
+            changelist = response.context['cl']
+            seen += [message.pk for message in changelist.result_list]
+            url = changelist.keyset_next_url and '/admin/portfolio/contactmessage/' + changelist.keyset_next_url
+        self.assertEqual(seen, self.expected)
+
+
+class ExportTests(PortfolioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.output = os.path.join(directory.name, 'export')
+        self.add_messages(self.one, 'Ada', 'Grace', 'Linus')
+        self.add_messages(self.two, 'Other')
+
+    def add_messages(self, tenant, *names):
+        with tenancy.use_tenant(tenant):
+            for name in names:
+                ContactMessage.objects.create(name=name, email='a@example.com', subject='Hi', message='Hello, "you"')
+
+    def export(self, *args):
+        # Chunks of two rows, so a three-row export spans several
+        with mock.patch('portfolio.export.CHUNK_SIZE', 2):
+            call_command('export_data', 'messages', '--tenant', 'one', '-o', self.output, *args, stderr=StringIO())
+
+    def test_csv(self):
+        self.export('--format', 'csv')
+        with open(self.output, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([row['name'] for row in rows], ['Ada', 'Grace', 'Linus'])
+        self.assertEqual(rows[0]['message'], 'Hello, "you"')
+
+    def test_jsonl(self):
+        self.export('--format', 'jsonl')
+        with open(self.output, encoding='utf-8') as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual([row['name'] for row in rows], ['Ada', 'Grace', 'Linus'])
+        self.assertEqual({row['tenant_id'] for row in rows}, {self.one.pk})
+
+    def test_incremental_exports_resume_after_the_watermark(self):
+        def exported():
+            self.export('--format', 'jsonl', '--incremental', '--watermark', 'crm')
+            with open(self.output, encoding='utf-8') as f:
+                return [json.loads(line)['name'] for line in f]
+
+        self.assertEqual(exported(), ['Ada', 'Grace', 'Linus'])
+        self.assertEqual(exported(), [])
+        self.add_messages(self.one, 'Margaret')
+        self.assertEqual(exported(), ['Margaret'])
+
+    def test_export_order(self):
+        with tenancy.use_tenant(self.one):
+            first = ContactMessage.objects.get(name='Ada')
+            ContactMessage.objects.filter(pk=first.pk).update(created_at=timezone.now() + timedelta(days=1))
+            queryset = export_queryset(ContactMessage.objects.all())
+            self.assertEqual([message.name for message in queryset], ['Grace', 'Linus', 'Ada'])
+            grace = ContactMessage.objects.get(name='Grace')
+            since = export_queryset(ContactMessage.objects.all(), since=(grace.created_at, grace.pk))
+            self.assertEqual([message.name for message in since], ['Linus', 'Ada'])
+
+    @skipUnless(import_pyarrow(), 'pyarrow is not installed')
+    def test_parquet(self):
+        self.export('--format', 'parquet')
+        table = import_pyarrow().parquet.read_table(self.output)
+        self.assertEqual(table.column('name').to_pylist(), ['Ada', 'Grace', 'Linus'])
+        self.assertEqual(table.schema.field('id').type, import_pyarrow().int64())
+
+    def test_parquet_without_pyarrow(self):
+        with mock.patch('portfolio.export.import_pyarrow', return_value=None):
+            with self.assertRaisesMessage(CommandError, 'Parquet export requires pyarrow'):
+                self.export('--format', 'parquet')
+        self.assertFalse(os.path.exists(self.output))
+
+
+class SeedTests(PortfolioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.enterContext(self.settings(MEDIA_ROOT=media.name))
+
+    def seed(self, *args):
+        call_command(
+            'seed', '--tenant', 'one', '--skills', '3', '--projects', '8', '--certificates', '6',
+            '--experience', '2', '--education', '1', '--messages', '25', '--image-pool', '2',
+            '--batch-size', '3', *args, stdout=StringIO(),
+        )
+
+    def test_creates_the_requested_rows(self):
+        self.seed()
+        with tenancy.use_tenant(self.one):
+            self.assertEqual(About.objects.get().name, 'Alex Johnson')
+            self.assertEqual(Skill.objects.count(), 3)
+            self.assertEqual(Project.objects.count(), 8)
+            self.assertEqual(ProjectImage.objects.count(), 16)
+            self.assertEqual(Certificate.objects.count(), 6)
+            self.assertEqual(Experience.objects.count(), 2)
+            self.assertEqual(Education.objects.count(), 1)
+            self.assertEqual(ContactMessage.objects.count(), 25)
+            # The hand-written samples come first
+            self.assertEqual(Project.objects.order_by('order').first().title, 'E-Commerce Sales Analytics Dashboard')
+            self.assertTrue(RelatedProject.objects.exists())
+            self.assertTrue(Project.objects.filter(pk__in=search.matching_pks('project', 'churn')).exists())
+            self.assertTrue(ProjectImage.objects.first().image.storage.exists(ProjectImage.objects.first().image.name))
+        # Nothing lands in the other tenant
+        with tenancy.use_tenant(self.two):
+            self.assertFalse(Project.objects.exists())
+            self.assertFalse(ContactMessage.objects.exists())
+
+    def test_publishes_what_it_seeded(self):
+        self.seed()
+        # A new tenant starts at an empty version 1
+        snapshot = PublishedSnapshot.objects.filter(tenant=self.one).latest('version')
+        self.assertEqual(snapshot.version, 2)
+        self.assertEqual(snapshot.published_by, 'seed')
+        self.assertEqual(snapshot.counts['portfolio.project'], 8)
+
+    def test_same_seed_same_content(self):
+        def titles():
+            with tenancy.use_tenant(self.one):
+                return list(Project.objects.order_by('order').values_list('title', 'technologies'))
+
+        self.seed('--seed', '7')
+        first = titles()
+        self.seed('--seed', '7', '--flush')
+        self.assertEqual(titles(), first)
+        self.seed('--seed', '8', '--flush')
+        self.assertNotEqual(titles(), first)
+
+    def test_no_images(self):
+        self.seed('--no-images')
+        with tenancy.use_tenant(self.one):
+            self.assertFalse(Project.objects.exclude(image='').exists())
+            self.assertFalse(ProjectImage.objects.exists())
+
+    def test_rejects_an_empty_batch_size(self):
+        with self.assertRaisesMessage(CommandError, '--batch-size must be positive'):
+            self.seed('--batch-size', '0')
+
+
+class SqliteConcurrencyTests(SimpleTestCase):
+    """
+    The configured pragmas on a real database file (the test database lives
+    in memory, where WAL doesn't apply): readers carry on while a contact form
+    burst holds the write lock, and a second writer waits for it instead of
+    failing with "database is locked".
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.settings_dict = {**connections['default'].settings_dict, 'NAME': os.path.join(directory.name, 'db.sqlite3')}
+        db = self.connect()
+        with db.cursor() as cursor:
+            cursor.execute('CREATE TABLE message (id INTEGER PRIMARY KEY, body TEXT)')
+            cursor.execute('PRAGMA journal_mode')
+            self.assertEqual(cursor.fetchone()[0], 'wal')
+        db.close()
+
+    def connect(self):
+        """A connection of its own, opened with the settings' init_command"""
+        return type(connections['default'])(self.settings_dict, alias='stress')
+
+    def insert_burst(self, cursor, rows):
+        cursor.executemany('INSERT INTO message (body) VALUES (%s)', [('Concurrency check. ' * 100,)] * rows)
+
+    def read(self, holding, done, results):
+        db = self.connect()
+        try:
+            holding.wait(5)
+            with db.cursor() as cursor:
+                for _ in range(20):
+                    started = time.perf_counter()
+                    cursor.execute('SELECT COUNT(*) FROM message')
+                    results.append((cursor.fetchone()[0], time.perf_counter() - started))
+        except Exception as e:
+            results.append(e)
+        finally:
+            done.wait(5)
+            db.close()
+
+    def write(self, holding, results):
+        db = self.connect()
+        try:
+            holding.wait(5)
+            started = time.perf_counter()
+            with db.cursor() as cursor:
+                cursor.execute('BEGIN IMMEDIATE')
+                self.insert_burst(cursor, 10)
+                cursor.execute('COMMIT')
+            results.append(time.perf_counter() - started)
+        except Exception as e:
+            results.append(e)
+        finally:
+            db.close()
+
+    def test_readers_never_wait_for_the_writer(self):
+        holding, readers_done = threading.Event(), threading.Event()
+        reads, writes = [], []
+        readers = [threading.Thread(target=self.read, args=(holding, readers_done, reads)) for _ in range(4)]
+        second_writer = threading.Thread(target=self.write, args=(holding, writes))
+        for thread in readers + [second_writer]:
+            thread.start()
+
+        db = self.connect()
+        try:
+            with db.cursor() as cursor:
+                # A burst bigger than the writer's page cache: without WAL it spills into the
+                # database file mid-transaction, taking the exclusive lock that shuts readers out
+                cursor.execute('PRAGMA cache_size=-1000')
+                cursor.execute('BEGIN IMMEDIATE')
+                self.insert_burst(cursor, 3000)
+                holding.set()
+                # Hold the lock until every reader is through
+                deadline = time.monotonic() + 10
+                while len(reads) < 80 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                readers_done.set()
+                self.assertEqual(writes, [])
+                cursor.execute('COMMIT')
+        finally:
+            holding.set()
+            readers_done.set()
+            for thread in readers + [second_writer]:
+                thread.join(10)
+
+        errors = [result for result in reads + writes if isinstance(result, Exception)]
+        self.assertEqual(errors, [])
+        self.assertEqual(len(reads), 80)
+        # Readers see the last commit, not the burst in progress, and never wait on the lock
+        self.assertEqual({count for count, _ in reads}, {0})
+        self.assertLess(max(seconds for _, seconds in reads), 0.5)
+        # The second writer waited out the burst, well within busy_timeout
+        self.assertEqual(len(writes), 1)
+        with db.cursor() as cursor:
+            cursor.execute('SELECT COUNT(*) FROM message')
+            self.assertEqual(cursor.fetchone()[0], 3010)
+        db.close()
+
+
+class ReplicaPathMixin:
+    """Points the replica at a file in a temporary directory"""
+
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'db.replica.sqlite3')
+        patcher = mock.patch.object(replica, 'replica_path', return_value=self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class ReplicaRefreshTests(ReplicaPathMixin, TransactionTestCase):
+    """The backup needs committed data: it can't copy a database with a transaction open"""
+
+    def tenant_count(self, db):
+        return db.execute('SELECT COUNT(*) FROM portfolio_tenant').fetchone()[0]
+
+    def test_refresh_replaces_the_file_instead_of_writing_into_it(self):
+        Tenant.objects.create(slug='one', name='One', domain='one.test')
+        replica.refresh_snapshot()
+        reader = sqlite3.connect(self.path)
+        self.addCleanup(reader.close)
+        reader.execute('BEGIN')
+        tenants = self.tenant_count(reader)
+        inode = os.stat(self.path).st_ino
+
+        Tenant.objects.create(slug='two', name='Two', domain='two.test')
+        replica.refresh_snapshot()
+        # The open reader finishes on the file it started with
+        self.assertEqual(self.tenant_count(reader), tenants)
+        self.assertNotEqual(os.stat(self.path).st_ino, inode)
+        fresh = sqlite3.connect(self.path)
+        self.addCleanup(fresh.close)
+        self.assertEqual(self.tenant_count(fresh), tenants + 1)
+        self.assertEqual(fresh.execute('PRAGMA journal_mode').fetchone()[0], 'delete')
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ['db.replica.sqlite3'])
+
+
+class ReplicaTests(ReplicaPathMixin, PortfolioTestCase):
+
+    def test_replica_routed_views_read_the_snapshot(self):
+        router = replica.ReplicaRouter()
+        routes = []
+
+        @replica.reads_from_replica
+        def view(request):
+            routes.append(router.db_for_read(Project))
+            return HttpResponse()
+
+        view(None)
+        sqlite3.connect(self.path).close()
+        view(None)
+        self.assertEqual(routes, [None, replica.REPLICA_ALIAS])
+        self.assertIsNone(router.db_for_read(Project))
+        self.assertEqual(router.db_for_write(Project), 'default')
+        self.assertFalse(router.allow_migrate(replica.REPLICA_ALIAS, 'portfolio'))
+
+    def test_changelist_checks_every_snapshot_in_one_query(self):
+        self.client.force_login(get_user_model().objects.create_superuser('admin', 'admin@example.com', 'pw'))
+        self.add_projects(self.one, 'Churn model')
+        ReplicaSnapshot.objects.create(alias='old', refreshed_at=timezone.now() - timedelta(days=1),
+                                       duration=1, size=1)
+        self.publish(self.one)
+        ReplicaSnapshot.objects.create(alias='replica', refreshed_at=timezone.now(), duration=1, size=1)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/admin/portfolio/replicasnapshot/', HTTP_HOST='one.test')
+        self.assertContains(response, 'Behind primary', count=1)
+        self.assertContains(response, 'Up to date', count=1)
+        self.assertEqual(sum('portfolio_publishedsnapshot' in query['sql'] for query in queries), 1)
+
+
+class WarmupTests(PortfolioTestCase):
+    IMPORTTIME = (
+        'import time: self [us] | cumulative | imported package\n'
+        'import time:       900 |        900 |   json.decoder\n'
+        'import time:      1200 |       2100 | json\n'
+        'import time:     40000 |      42100 | django.db\n'
+    )
+
+    def test_prerenders_the_named_pages(self):
+        with self.settings(ALLOWED_HOSTS=['one.test', '.test']):
+            self.assertEqual(warmup.warmup_host(), 'one.test')
+            self.assertEqual(warmup.prerender_pages(['home', 'projects', 'api_bundle']), 3)
+            # The admin redirects to its login page
+            with self.assertLogs('portfolio.warmup', 'WARNING') as logs:
+                self.assertEqual(warmup.prerender_pages(['home', 'admin:index']), 1)
+        self.assertIn('/admin/ returned 302', logs.output[0])
+
+    def test_compiles_every_template(self):
+        templates = Path(warmup.__file__).parent / 'templates'
+        self.assertEqual(warmup.preload_templates(), len(list(templates.rglob('*.html'))))
+
+    def test_failures_dont_stop_the_worker(self):
+        with mock.patch.object(warmup, 'preload_templates', side_effect=RuntimeError('broken')):
+            with self.assertLogs('portfolio.warmup', 'ERROR') as logs:
+                warmup.warm_up()
+        self.assertIn('Warmup failed', logs.output[0])
+
+    def import_times(self, *args):
+        result = mock.Mock(returncode=0, stderr=self.IMPORTTIME)
+        with mock.patch('subprocess.run', return_value=result) as run:
+            out = StringIO()
+            call_command('import_times', 'wsgi', *args, stdout=out)
+        self.assertEqual(run.call_args.args[0][1:], ['-X', 'importtime', '-c', 'import portfolio_project.wsgi'])
+        return out.getvalue()
+
+    def test_import_times_within_budget(self):
+        self.assertEqual(
+            import_times.parse_importtime(self.IMPORTTIME),
+            [('json.decoder', 900, 900), ('json', 1200, 2100), ('django.db', 40000, 42100)],
+        )
+        out = self.import_times('--budget', '50')
+        self.assertIn('3 modules imported in 42 ms', out)
+        self.assertIn('Within the 50 ms budget.', out)
+
+    def test_import_times_over_budget(self):
+        with self.assertRaisesMessage(CommandError, 'Import time 42 ms is over the 40 ms budget'):
+            self.import_times('--budget', '40')
+
+
+class AsyncViewTests(PortfolioTestCase):
+    """The pages ASGI workers serve, through the full middleware stack"""
+
+    def setUp(self):
+        super().setUp()
+        # Cleanups run last-first: the URLs are rebuilt once the setting is back
+        self.addCleanup(self.reload_urls)
+        self.enterContext(self.settings(ASYNC_VIEWS=True, ALLOWED_HOSTS=['testserver']))
+        self.reload_urls()
+        # The async test client can't replace its Host header, so tenant one is served on testserver
+        Tenant.objects.filter(domain='testserver').update(domain='default.test')
+        Tenant.objects.filter(pk=self.one.pk).update(domain='testserver')
+        self.churn, _ = self.add_projects(self.one, 'Churn model', 'Sales dashboard')
+        with mock.patch('portfolio.social_cards.delete_unused_cards'), \
+                mock.patch('portfolio.resume.schedule_build'), \
+                mock.patch('portfolio.replica.schedule_refresh'):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.publish(self.one)
+
+    def reload_urls(self):
+        # The root URLconf holds on to the patterns it included
+        importlib.reload(urls)
+        importlib.reload(importlib.import_module(settings.ROOT_URLCONF))
+        clear_url_caches()
+
+    async def get(self, path):
+        return await self.async_client.get(path)
+
+    async def test_pages(self):
+        self.assertIs(resolve('/').func, async_views.home)
+        for path in ('/', '/about/', '/projects/?filter=featured&sort=alphabetical', f'/projects/{self.churn.pk}/',
+                     '/certificates/', '/contact/', '/search/?q=churn'):
+            with self.subTest(path=path):
+                response = await self.get(path)
+                self.assertEqual(response.status_code, 200)
+        response = await self.get('/projects/')
+        self.assertContains(response, 'Sales dashboard')
+
+    async def test_search(self):
+        response = await self.get('/search/?q=churn')
+        self.assertEqual([result['title'] for result in response.context['results']], ['Churn model'])
+
+    async def test_unpublished_project(self):
+        response = await self.get(f'/projects/{self.churn.pk + 100}/')
+        self.assertEqual(response.status_code, 404)
+
+    async def test_contact_form(self):
+        with mock.patch.object(async_views, 'send_contact_email') as send:
+            response = await self.async_client.post(
+                '/contact/',
+                {'name': 'Ada', 'email': 'ada@example.com', 'subject': 'Hi', 'message': 'Hello there, nice work.'},
+                headers={'x-requested-with': 'XMLHttpRequest'},
+            )
+            # The email goes out on a worker thread after the response
+            while async_views._pending_emails:
+                await asyncio.sleep(0.01)
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(response.json()['ok'])
+        message = await ContactMessage.objects.aget(pk=response.json()['id'])
+        self.assertEqual((message.name, message.tenant_id), ('Ada', self.one.pk))
+        send.assert_called_once()
+
+
+class ContactJsonTests(PortfolioTestCase):
+    VALID = {'name': 'Ada', 'email': 'ada@example.com', 'subject': 'Hi', 'message': 'Hello there, nice work.'}
+
+    def post(self, data, **headers):
+        return self.client.post('/contact/', data, HTTP_HOST='one.test', **headers)
+
+    def ajax(self, data):
+        return self.post(data, HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+
+    def test_sent(self):
+        response = self.ajax(self.VALID)
+        self.assertEqual(response.status_code, 201)
+        data = response.json()
+        self.assertEqual((data['ok'], data['notice']), (True, 'sent'))
+        with tenancy.use_tenant(self.one):
+            self.assertEqual(ContactMessage.objects.get(pk=data['id']).name, 'Ada')
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_errors(self):
+        cases = [
+            ({**self.VALID, 'name': ''}, 'missing', ['name']),
+            ({**self.VALID, 'email': 'not-an-address'}, 'invalid_email', ['email']),
+            ({**self.VALID, 'message': 'x' * 2001}, 'invalid', ['message']),
+        ]
+        for data, notice, fields in cases:
+            with self.subTest(notice=notice):
+                response = self.ajax(data)
+                self.assertEqual(response.status_code, 400)
+                body = response.json()
+                self.assertEqual((body['ok'], body['notice']), (False, notice))
+                self.assertEqual(sorted(body['errors']), fields)
+        self.assertFalse(ContactMessage.objects.exists())
+        self.assertEqual(mail.outbox, [])
+
+    def test_failed_save(self):
+        with mock.patch('portfolio.forms.ContactForm.save', side_effect=RuntimeError('database is locked')):
+            response = self.ajax(self.VALID)
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json()['notice'], 'failed')
+
+    def test_plain_posts_redirect_with_the_notice(self):
+        response = self.post({**self.VALID, 'email': 'not-an-address'})
+        self.assertRedirects(response, '/contact/?notice=invalid_email', fetch_redirect_response=False)
+        response = self.client.get('/contact/?notice=invalid_email', HTTP_HOST='one.test')
+        self.assertContains(response, 'Please enter a valid email address.')
+
+
+class PageViewTests(PortfolioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        # Count views again, but leave flushing to the test instead of a thread
+        counting = pageviews._counting.set(True)
+        self.addCleanup(pageviews._counting.reset, counting)
+        self.enterContext(mock.patch.object(pageviews, '_flusher', 'not started'))
+        self.addCleanup(lambda: pageviews._pending.clear())
+        self.churn, = self.add_projects(self.one, 'Churn model')
+        self.publish(self.one)
+
+    def get(self, path, host='one.test'):
+        return self.client.get(path, HTTP_HOST=host)
+
+    def counts(self):
+        return {
+            (counter.tenant_id, counter.page, counter.object_id): counter.views
+            for counter in PageViewCounter.objects.all()
+        }
+
+    def test_flush_writes_the_buffered_views(self):
+        detail = f'/projects/{self.churn.pk}/'
+        for path in (detail, detail, '/', '/projects/999/'):
+            self.get(path)
+        self.get('/', host='two.test')
+        self.client.post('/contact/', {}, HTTP_HOST='one.test')
+        # Nothing is written on the request path
+        self.assertEqual(self.counts(), {})
+
+        self.assertEqual(pageviews.flush(), 3)
+        self.assertEqual(self.counts(), {
+            (self.one.pk, 'project_detail', self.churn.pk): 2,
+            (self.one.pk, 'home', 0): 1,
+            (self.two.pk, 'home', 0): 1,
+        })
+        self.assertEqual(pageviews.flush(), 0)
+
+    def test_flushes_add_to_the_stored_counts(self):
+        self.get('/')
+        pageviews.flush()
+        self.get('/')
+        self.get('/')
+        pageviews.flush()
+        self.assertEqual(self.counts(), {(self.one.pk, 'home', 0): 3})
+
+    def test_failed_flush_keeps_the_views(self):
+        self.get('/')
+        with mock.patch.object(pageviews.transaction, 'atomic', side_effect=DatabaseError('database is locked')):
+            with self.assertRaises(DatabaseError):
+                pageviews.flush()
+        self.assertEqual(self.counts(), {})
+        self.assertEqual(pageviews.flush(), 1)
+        self.assertEqual(self.counts(), {(self.one.pk, 'home', 0): 1})
+
+    def test_warmup_requests_are_not_counted(self):
+        with pageviews.not_counted():
+            self.get('/')
+        self.assertEqual(pageviews.flush(), 0)
+
+
+class RelatedProjectTests(PortfolioTestCase):
+
+    def add_project(self, tenant, title, technologies, category='data_analysis'):
+        with tenancy.use_tenant(tenant):
+            return Project.objects.create(title=title, description=title, technologies=technologies,
+                                          category=category)
+
+    def related(self, project):
+        return [
+            row.related.title
+            for row in RelatedProject.objects.filter(project=project).select_related('related').order_by('rank')
+        ]
+
+    def test_ranks_by_shared_words_and_technologies(self):
+        churn = self.add_project(self.one, 'Customer churn prediction', 'Python, XGBoost')
+        self.add_project(self.one, 'Customer churn dashboard', 'Python, Tableau')
+        self.add_project(self.one, 'Retail pricing dashboard', 'Tableau')
+        self.add_project(self.one, 'Inventory', 'Excel', category='other')
+        self.add_project(self.two, 'Customer churn prediction', 'Python, XGBoost')
+
+        self.assertEqual(similarity.rebuild_related(tenant_id=self.one.pk), 6)
+        self.assertEqual(self.related(churn), ['Customer churn dashboard', 'Retail pricing dashboard'])
+        scores = list(RelatedProject.objects.filter(project=churn).values_list('score', flat=True))
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        # Projects are only compared within their tenant, and projects with nothing in common aren't related
+        self.assertFalse(RelatedProject.objects.filter(tenant=self.two).exists())
+        self.assertFalse(RelatedProject.objects.filter(related__title='Inventory').exists())
+
+    def test_rebuild_replaces_only_the_tenants_rows(self):
+        churn = self.add_project(self.one, 'Customer churn prediction', 'Python')
+        self.add_project(self.one, 'Customer churn dashboard', 'Python')
+        self.add_project(self.two, 'Sales forecast', 'R')
+        self.add_project(self.two, 'Sales dashboard', 'R')
+        similarity.rebuild_related()
+        self.assertEqual(RelatedProject.objects.filter(tenant=self.two).count(), 2)
+
+        with tenancy.use_tenant(self.one):
+            Project.objects.filter(title='Customer churn dashboard').update(technologies='Excel')
+            Project.objects.create(title='Customer churn survey', description='', technologies='Python')
+        similarity.rebuild_related(tenant_id=self.one.pk)
+        self.assertEqual(self.related(churn), ['Customer churn survey', 'Customer churn dashboard'])
+        self.assertEqual(RelatedProject.objects.filter(tenant=self.two).count(), 2)
+
+    def test_saves_schedule_one_rebuild_per_tenant(self):
+        with mock.patch.object(similarity, 'rebuild_related') as rebuild, \
+                mock.patch('portfolio.social_cards.schedule_cards'):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.add_project(self.one, 'Customer churn prediction', 'Python')
+                self.add_project(self.one, 'Customer churn dashboard', 'Python')
+                self.add_project(self.two, 'Sales forecast', 'R')
+        self.assertEqual(sorted(call.kwargs['tenant_id'] for call in rebuild.call_args_list),
+                         [self.one.pk, self.two.pk])
+
+    def test_detail_page_lists_the_published_ranking(self):
+        churn = self.add_project(self.one, 'Customer churn prediction', 'Python, XGBoost')
+        self.add_project(self.one, 'Customer churn dashboard', 'Python, Tableau')
+        similarity.rebuild_related(tenant_id=self.one.pk)
+        self.publish(self.one)
+        response = self.client.get(f'/projects/{churn.pk}/', HTTP_HOST='one.test')
+        self.assertEqual([project.title for project in response.context['related_projects']],
+                         ['Customer churn dashboard'])
+
+
+class SitemapTests(PortfolioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.add_projects(self.one, *[f'Project {n}' for n in range(5)])
+        self.publish(self.one)
+
+    def test_small_site_is_one_sitemap(self):
+        response = self.client.get('/sitemap.xml', HTTP_HOST='one.test')
+        self.assertContains(response, '<urlset')
+        self.assertEqual(response.content.count(b'/projects/'), 6)
+        self.assertEqual(self.client.get('/sitemap.xml?p=2', HTTP_HOST='one.test').status_code, 404)
+
+    @mock.patch.object(crawlers.ProjectSitemap, 'limit', 2)
+    def test_overflowing_site_is_an_index_of_paged_sections(self):
+        response = self.client.get('/sitemap.xml', HTTP_HOST='one.test')
+        self.assertContains(response, '<sitemapindex')
+        self.assertContains(response, 'http://one.test/sitemap-projects.xml?p=3')
+        self.assertNotContains(response, 'sitemap-projects.xml?p=4')
+
+        pages = [
+            self.client.get(f'/sitemap-projects.xml?p={page}', HTTP_HOST='one.test').content
+            for page in (1, 2, 3)
+        ]
+        # Each page is cached under its own key
+        self.assertEqual(len(set(pages)), 3)
+        self.assertEqual(
+            pages[1], self.client.get('/sitemap-projects.xml?p=2', HTTP_HOST='one.test').content
+        )
+        self.assertEqual(
+            self.client.get('/sitemap-projects.xml?p=4', HTTP_HOST='one.test').status_code, 404
+        )
+
+
+class WrapTitleTests(SimpleTestCase):
+    width = 560
+
+    def wrap(self, title, width=None):
+        from PIL import Image, ImageDraw
+
+        draw = ImageDraw.Draw(Image.new('RGB', CARD_SIZE))
+        font, lines = wrap_title(draw, title, width or self.width)
+        for line in lines:
+            self.assertLessEqual(draw.textlength(line, font=font), width or self.width, line)
+        return font, lines
+
+    def test_short_title_is_one_line_at_the_largest_size(self):
+        font, lines = self.wrap('Sales Dashboard')
+        self.assertEqual(lines, ['Sales Dashboard'])
+        self.assertEqual(font.size, 72)
+
+    def test_uppercase_title_that_wraps_to_two_lines(self):
+        # Used to raise IndexError on a card without a cover: fewer than
+        # three lines, one of them too wide
+        font, lines = self.wrap('COVID-19 MORTALITY ANALYSIS WITH SQL AND TABLEAU', width=CARD_SIZE[0] - 2 * PADDING)
+        self.assertLessEqual(len(lines), 3)
+        self.assertEqual(' '.join(lines).rstrip('…').split()[0], 'COVID-19')
+
+    def test_long_title_is_cut_after_three_lines(self):
+        title = ' '.join(['Customer lifetime value and churn prediction'] * 4)
+        font, lines = self.wrap(title)
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(font.size, 48)
+        self.assertTrue(lines[-1].endswith('…'))
+
+    def test_single_word_wider_than_the_card_is_ellipsized(self):
+        font, lines = self.wrap('Supercalifragilisticexpialidocious' * 2)
+        self.assertEqual(len(lines), 1)
+        self.assertTrue(lines[0].endswith('…'))
+
+    def test_single_short_word(self):
+        self.assertEqual(self.wrap('ETL')[1], ['ETL'])
+
+
+class ResumeTests(PortfolioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.enterContext(self.settings(MEDIA_ROOT=media.name))
+        with tenancy.use_tenant(self.one):
+            self.about = About.objects.create(name='Ada Lovelace', title='Data Analyst', bio='<p>Numbers.</p>',
+                                              email='ada@example.com')
+            Experience.objects.create(position='Analyst', company='Analytical Engines', location='London',
+                                      start_date=timezone.localdate() - timedelta(days=400), current=True,
+                                      description='Notes on the engine.', achievements='First program')
+        self.publish(self.one)
+
+    def build(self):
+        with tenancy.use_tenant(self.one):
+            return resume.build_resume()
+
+    def get(self, path, **headers):
+        return self.client.get(path, HTTP_HOST='one.test', **headers)
+
+    def test_not_built_yet(self):
+        with mock.patch.object(resume, 'schedule_build') as schedule:
+            response = self.get('/resume.pdf')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], str(resume.RETRY_AFTER))
+        schedule.assert_called_once_with()
+
+    def test_serves_the_built_pdf_and_html(self):
+        built = self.build()
+        response = self.get('/resume.pdf')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content.startswith(b'%PDF-'))
+        self.assertEqual(response['Content-Disposition'], 'inline; filename="Ada-Lovelace-resume.pdf"')
+        self.assertEqual(response['ETag'], f'"{built.fingerprint}"')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertContains(self.get('/resume/'), 'Analytical Engines')
+        # Another tenant has nothing built
+        with mock.patch.object(resume, 'schedule_build'):
+            self.assertEqual(self.client.get('/resume.pdf', HTTP_HOST='two.test').status_code, 503)
+
+    def test_conditional_and_range_requests(self):
+        built = self.build()
+        whole = self.get('/resume.pdf').content
+        self.assertEqual(self.get('/resume.pdf', HTTP_IF_NONE_MATCH=f'"{built.fingerprint}"').status_code, 304)
+
+        response = self.get('/resume.pdf', HTTP_RANGE='bytes=0-99')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.content, whole[:100])
+        self.assertEqual(response['Content-Range'], f'bytes 0-99/{len(whole)}')
+        self.assertEqual(self.get('/resume.pdf', HTTP_RANGE='bytes=-10').content, whole[-10:])
+        self.assertEqual(self.get('/resume.pdf', HTTP_RANGE=f'bytes={len(whole)}-').status_code, 416)
+        # A stale If-Range gets the whole file
+        response = self.get('/resume.pdf', HTTP_RANGE='bytes=0-99', HTTP_IF_RANGE='"stale"')
+        self.assertEqual((response.status_code, response.content), (200, whole))
+
+    def test_rebuilds_only_when_the_published_content_changes(self):
+        first = self.build()
+        with mock.patch.object(resume, 'render_pdf') as render:
+            self.assertEqual(self.build().fingerprint, first.fingerprint)
+        render.assert_not_called()
+
+        with tenancy.use_tenant(self.one):
+            self.about.title = 'Senior Data Analyst'
+            self.about.save()
+        # Drafts don't reach the résumé until they're published
+        self.assertEqual(self.build().fingerprint, first.fingerprint)
+        self.publish(self.one)
+        second = self.build()
+        self.assertNotEqual(second.fingerprint, first.fingerprint)
+        self.assertFalse(first.pdf.storage.exists(first.pdf.name))
+        self.assertTrue(second.pdf.storage.exists(second.pdf.name))
+
+
+class PublishTests(PortfolioTestCase):
+
+    def test_edits_show_only_once_published(self):
+        project, = self.add_projects(self.one, 'Churn model')
+        first, _ = self.publish(self.one)
+        response = self.client.get('/api/portfolio.json', HTTP_HOST='one.test')
+        self.assertEqual(response.json()['version'], first.version)
+        self.assertEqual([p['title'] for p in response.json()['projects']], ['Churn model'])
+
+        with tenancy.use_tenant(self.one):
+            project.title = 'Churn model v2'
+            project.save()
+        response = self.client.get('/api/portfolio.json', HTTP_HOST='one.test')
+        self.assertEqual([p['title'] for p in response.json()['projects']], ['Churn model'])
+
+        self.publish(self.one)
+        response = self.client.get('/api/portfolio.json', HTTP_HOST='one.test')
+        self.assertEqual(response.json()['version'], first.version + 1)
+        self.assertEqual([p['title'] for p in response.json()['projects']], ['Churn model v2'])
+
+    def test_search_shows_only_published_text(self):
+        project, = self.add_projects(self.one, 'Churn model')
+        # Going live also prunes cards, builds the résumé and refreshes the replica
+        with mock.patch('portfolio.social_cards.delete_unused_cards'), \
+                mock.patch('portfolio.resume.schedule_build'), \
+                mock.patch('portfolio.replica.schedule_refresh'):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.publish(self.one)
+            with tenancy.use_tenant(self.one):
+                project.title = 'Unreleased acquisition Secretword'
+                project.save()
+            response = self.client.get('/search/?q=churn', HTTP_HOST='one.test')
+            self.assertEqual([r['title'] for r in response.context['results']], ['Churn model'])
+            response = self.client.get('/search/?q=secretword', HTTP_HOST='one.test')
+            self.assertEqual(response.context['results'], [])
+
+            with self.captureOnCommitCallbacks(execute=True):
+                self.publish(self.one)
+            response = self.client.get('/search/?q=secretword', HTTP_HOST='one.test')
+            self.assertEqual([r['title'] for r in response.context['results']], ['Unreleased acquisition Secretword'])
+            response = self.client.get('/search/?q=secretword', HTTP_HOST='two.test')
+            self.assertEqual(response.context['results'], [])
+
+    def test_unchanged_draft_creates_no_version(self):
+        self.add_projects(self.one, 'Churn model')
+        first, created = self.publish(self.one)
+        self.assertTrue(created)
+        again, created = self.publish(self.one)
+        self.assertFalse(created)
+        self.assertEqual(again.pk, first.pk)
+
+    def test_publish_button(self):
+        self.client.force_login(get_user_model().objects.create_superuser('admin', 'admin@example.com', 'pw'))
+        self.add_projects(self.one, 'Churn model')
+        url = reverse('admin:portfolio_publishedsnapshot_publish')
+        self.assertEqual(self.client.get(url, HTTP_HOST='one.test').status_code, 405)
+
+        response = self.client.post(url, {'note': 'First projects'}, HTTP_HOST='one.test', follow=True)
+        self.assertRedirects(response, reverse('admin:portfolio_publishedsnapshot_changelist'))
+        latest = PublishedSnapshot.objects.filter(tenant=self.one).latest('version')
+        self.assertEqual((latest.published_by, latest.note), ('admin', 'First projects'))
+        self.assertContains(response, f'Published version {latest.version}.')
+        self.assertEqual(PublishedSnapshot.objects.filter(tenant=self.two).count(), 1)
+
+        response = self.client.post(url, HTTP_HOST='one.test', follow=True)
+        self.assertContains(response, f'Nothing changed since version {latest.version}.')
+
+    def test_worker_behind_on_versions_never_caches_under_the_new_key(self):
+        self.add_projects(self.one, 'Churn model')
+        self.publish(self.one)
+        with tenancy.use_tenant(self.one):
+            old = publishing.published()
+        self.add_projects(self.one, 'Sales dashboard')
+        self.publish(self.one)
+
+        # A worker that hasn't switched yet still builds and stores version 1
+        with mock.patch.object(crawlers, 'published', return_value=old):
+            with mock.patch('portfolio.cache.published', return_value=old):
+                response = self.client.get('/sitemap.xml', HTTP_HOST='one.test')
+        self.assertEqual(response.content.count(b'/projects/'), 2)
+
+        response = self.client.get('/sitemap.xml', HTTP_HOST='one.test')
+        self.assertEqual(response.content.count(b'/projects/'), 3)
+
+
+class TenantScopingTests(PortfolioTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.mine, = self.add_projects(self.one, 'Churn model')
+        self.theirs, = self.add_projects(self.two, 'Sales dashboard')
+        self.publish(self.one)
+        self.publish(self.two)
+
+    def test_each_host_serves_its_own_content(self):
+        for host, title in (('one.test', 'Churn model'), ('two.test', 'Sales dashboard')):
+            response = self.client.get('/api/projects/', HTTP_HOST=host)
+            self.assertEqual([p['title'] for p in response.json()['results']], [title])
+
+    def test_other_tenants_rows_are_not_found(self):
+        response = self.client.get(f'/api/projects/{self.theirs.pk}/', HTTP_HOST='one.test')
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get(f'/projects/{self.theirs.pk}/', HTTP_HOST='one.test')
+        self.assertEqual(response.status_code, 404)
+
+    def test_unknown_host_is_not_found(self):
+        response = self.client.get('/', HTTP_HOST='three.test')
+        self.assertEqual(response.status_code, 404)
+
+    def test_managers_only_see_the_current_tenant(self):
+        with tenancy.use_tenant(self.one):
+            self.assertEqual(list(Project.objects.all()), [self.mine])
+            About.objects.create(name='One', title='Analyst', bio='', email='one@example.com')
+        with tenancy.use_tenant(self.two):
+            self.assertFalse(About.objects.exists())
+        self.assertEqual(Project.objects.count(), 2)
+
+
+class TwoTierCacheTests(PortfolioTestCase):
+
+    def worker(self, name=None, **options):
+        """A backend with a local tier of its own, like another worker process, over the same shared tier"""
+        return TwoTierCache(name or self.id(), {'OPTIONS': {'SHARED': 'shared', **options}})
+
+    def test_shared_hits_are_kept_locally(self):
+        tiers = self.worker()
+        caches['shared'].set('page', 'cached by another worker')
+        self.assertEqual(tiers.get('page'), 'cached by another worker')
+        self.assertEqual(tiers.get('page'), 'cached by another worker')
+        stats = tiers.stats()
+        self.assertEqual((stats['local']['hits'], stats['shared']['hits']), (1, 1))
+        # The local copy is trusted for up to LOCAL_TIMEOUT, even if the shared entry goes
+        caches['shared'].delete('page')
+        self.assertEqual(tiers.get('page'), 'cached by another worker')
+        self.assertIsNone(tiers.get('missing'))
+        self.assertEqual(tiers.stats()['shared']['misses'], 1)
+
+    def test_workers_share_what_they_cache(self):
+        first, second = self.worker(f'{self.id()}-1'), self.worker(f'{self.id()}-2')
+        first.set('page', b'<html>')
+        self.assertEqual(second.get('page'), b'<html>')
+        self.assertEqual(second.stats()['shared']['hits'], 1)
+        second.delete('page')
+        self.assertIsNone(caches['shared'].get('page'))
+
+    def test_local_tier_is_bounded(self):
+        tiers = self.worker(MAX_ENTRIES=3, MAX_BYTES=1000)
+        for key in ('a', 'b', 'c', 'd'):
+            tiers.set(key, key)
+        tiers.set('big', 'x' * 400)
+        stats = tiers.stats()['local']
+        self.assertEqual((stats['entries'], stats['evictions']), (3, 1))
+        self.assertFalse(tiers.local.contains(tiers.make_key('a')))
+        self.assertFalse(tiers.local.contains(tiers.make_key('big')))
+        # Dropped from memory, still in the shared tier
+        self.assertEqual(tiers.get('a'), 'a')
+        self.assertEqual(tiers.get('big'), 'x' * 400)
+
+    def test_counters_are_never_copied_locally(self):
+        tiers = self.worker()
+        tiers.set('hits', 1)
+        caches['shared'].incr('hits')
+        self.assertEqual(tiers.incr('hits'), 3)
+        self.assertEqual(tiers.get('hits'), 3)
+
+    def test_shared_alias_is_required(self):
+        with self.assertRaises(ImproperlyConfigured):
+            TwoTierCache(self.id(), {'OPTIONS': {}})
+
+    def test_publishing_moves_to_new_keys(self):
+        self.add_projects(self.one, 'Churn model')
+        self.publish(self.one)
+        with tenancy.use_tenant(self.one):
+            first = versioned_key(publishing.published(), 'api', 'bundle')
+        self.assertEqual(first, f'portfolio:{self.one.pk}:2:api:bundle')
+        response = self.client.get('/api/portfolio.json', HTTP_HOST='one.test')
+        self.assertEqual([p['title'] for p in response.json()['projects']], ['Churn model'])
+        self.assertIsNotNone(cache.get(first))
+
+        self.add_projects(self.one, 'Sales dashboard')
+        self.publish(self.one)
+        response = self.client.get('/api/portfolio.json', HTTP_HOST='one.test')
+        self.assertEqual([p['title'] for p in response.json()['projects']], ['Churn model', 'Sales dashboard'])
+        with tenancy.use_tenant(self.one):
+            self.assertEqual(versioned_key(publishing.published(), 'api', 'bundle'), f'portfolio:{self.one.pk}:3:api:bundle')
+        # The old version's entry is left to expire, never overwritten
+        self.assertNotIn(b'Sales dashboard', cache.get(first))
@@ -1,12 +1,36 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import api, async_views, crawlers, resume, views
+
+# Under ASGI the pages are served by their async versions
+pages = async_views if settings.ASYNC_VIEWS else views
 
 urlpatterns = [
     # Main pages
-    path('', views.home, name='home'),
-    path('about/', views.about_page, name='about'),
-    path('projects/', views.projects_page, name='projects'),
-    path('projects/<int:pk>/', views.project_detail, name='project_detail'),
-    path('certificates/', views.certificates_page, name='certificates'),
-    path('contact/', views.contact_page, name='contact'),
+    path('', pages.home, name='home'),
+    path('about/', pages.about_page, name='about'),
+    path('projects/', pages.projects_page, name='projects'),
+    path('projects/<int:pk>/', pages.project_detail, name='project_detail'),
+    path('certificates/', pages.certificates_page, name='certificates'),
+    path('contact/', pages.contact_page, name='contact'),
+    path('search/', pages.search_page, name='search'),
+    path('resume/', resume.resume_html, name='resume_html'),
+    path('resume.pdf', resume.resume_pdf, name='resume_pdf'),
+
+    # Crawlers and feed readers
+    path('sitemap.xml', crawlers.sitemap, name='sitemap'),
+    path('sitemap-<slug:section>.xml', crawlers.sitemap_section, name='sitemap_section'),
+    path('robots.txt', crawlers.robots_txt, name='robots_txt'),
+    path('feed/', crawlers.feed, name='feed'),
+
+    # Read-only JSON API
+    path('api/portfolio.json', api.portfolio_bundle, name='api_bundle'),
+    path('api/about/', api.about_detail, name='api_about'),
 ]
+
+for resource in ('skills', 'projects', 'certificates', 'experience', 'education'):
+    urlpatterns += [
+        path(f'api/{resource}/', api.resource_list, {'resource': resource}, name=f'api_{resource}'),
+        path(f'api/{resource}/<int:pk>/', api.resource_detail, {'resource': resource},
+             name=f'api_{resource}_detail'),
+    ]
@@ -1,47 +1,119 @@
-from django.shortcuts import render, redirect, get_object_or_404
-from django.contrib import messages
+import logging
+
+from django.http import Http404, JsonResponse
+from django.shortcuts import render, redirect
+from django.urls import reverse
 from django.views.decorators.http import require_http_methods
-from django.db.models import Q
 from django.core.mail import send_mail
 from django.conf import settings
-from datetime import datetime, timedelta
-from .models import About, Skill, Project, Certificate, Experience, Education, ContactMessage
+from datetime import datetime
+from . import search
+from .forms import ContactForm
+from .pageviews import counts_views
+from .publishing import order_by, published
+from .replica import reads_from_replica
+
+
+logger = logging.getLogger(__name__)
+
+
+# Every page reads the latest published content held in memory (see
+# publishing.py); only search and contact form submissions use the database.
+
+
+# Contact form outcomes are passed back through a ``?notice=`` query parameter
+# rather than the messages framework, so the contact page never needs a session
+# or cookie and every variant is a plain, cacheable URL.
+CONTACT_NOTICES = {
+    'sent': ('success', 'Thank you for your message! I will get back to you soon.'),
+    'missing': ('error', 'Please fill in all required fields.'),
+    'invalid_email': ('error', 'Please enter a valid email address.'),
+    'invalid': ('error', 'Please check your message and try again.'),
+    'failed': ('error', 'There was an error sending your message. Please try again.'),
+}
+
+
+def contact_redirect(notice):
+    """
+    Redirect back to the contact page carrying a notice code
+    """
+    return redirect(f"{reverse('contact')}?notice={notice}")
+
+
+# HTTP status of an XHR submission's response for each outcome
+CONTACT_STATUS = {'sent': 201, 'missing': 400, 'invalid_email': 400, 'invalid': 400, 'failed': 500}
+
+
+def contact_response(request, notice, message=None, form=None):
+    """
+    XHR submissions get a small JSON result, plain form posts are redirected
+    back to the contact page with the notice.
+    """
+    if request.headers.get('X-Requested-With') != 'XMLHttpRequest':
+        return contact_redirect(notice)
+    data = {'ok': notice == 'sent', 'notice': notice, 'message': CONTACT_NOTICES[notice][1]}
+    if message is not None:
+        data['id'] = message.pk
+    if form is not None and form.errors:
+        data['errors'] = {field: list(errors) for field, errors in form.errors.items()}
+    return JsonResponse(data, status=CONTACT_STATUS[notice])
+
+
+def send_contact_email(message):
+    """Email the portfolio's owner about a new contact message"""
+    email_body = f"""
+You have received a new message from your portfolio contact form:
+
+Name: {message.name}
+Email: {message.email}
+Phone: {message.phone if message.phone else 'Not provided'}
+Subject: {message.subject}
+
+Message:
+{message.message}
+
+---
+This is an automated email. Do not reply to this address.
+"""
+    try:
+        send_mail(
+            subject=f"New Contact Form Message: {message.subject}",
+            message=email_body,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            recipient_list=[message.tenant.contact_email or settings.CONTACT_EMAIL],
+            fail_silently=True,  # Don't fail if email can't be sent
+        )
+    except Exception:
+        logger.exception('Sending the contact email for message %s failed', message.pk)
 
 
 def get_base_context(request):
     """
     Helper function to get common context data for all views
     """
-    about = About.objects.first()
     return {
-        'about': about,
+        'about': published().about,
     }
 
 
+@counts_views
 def home(request):
     """
     Home page view - displays hero section, stats, featured projects, and skills preview
     """
-    about = About.objects.first()
-    skills = Skill.objects.all()[:6]  # Top 6 skills
-    certificates = Certificate.objects.order_by('-issue_date')[:4]  # Top 4 certificates
+    content = published()
+    about = content.about
+    skills = content.skills[:6]  # Top 6 skills
+    certificates = order_by(content.certificates, '-issue_date')[:4]  # Top 4 certificates
     
     # Show featured projects first, then fill with recent projects if not enough featured
-    featured_projects = Project.objects.filter(featured=True).order_by('-date_completed')[:3]
-    
-    if featured_projects.count() < 3:
-        # If not enough featured projects, add recent projects to fill
-        remaining_needed = 3 - featured_projects.count()
-        recent_projects = Project.objects.exclude(featured=True).order_by('-date_completed')[:remaining_needed]
-        projects = list(featured_projects) + list(recent_projects)
-    else:
-        projects = featured_projects
+    projects = content.preview_projects(3)
     
-    # Calculate stats - use custom values if set, otherwise count from database
-    total_projects = about.stat_projects if about and about.stat_projects else Project.objects.count()
-    total_skills = about.stat_skills if about and about.stat_skills else Skill.objects.count()
-    total_certificates = about.stat_certifications if about and about.stat_certifications else Certificate.objects.count()
-    total_experience = about.stat_experience if about and about.stat_experience else Experience.objects.count()
+    # Calculate stats - use custom values if set, otherwise count what's published
+    total_projects = about.stat_projects if about and about.stat_projects else len(content.projects)
+    total_skills = about.stat_skills if about and about.stat_skills else len(content.skills)
+    total_certificates = about.stat_certifications if about and about.stat_certifications else len(content.certificates)
+    total_experience = about.stat_experience if about and about.stat_experience else len(content.experiences)
 
     context = get_base_context(request)
     context.update({
@@ -57,28 +129,21 @@ def home(request):
     return render(request, 'portfolio/home.html', context)
 
 
+@counts_views
 def about_page(request):
     """
     About page view - displays biographical information, experience timeline, and education
     """
     from django.utils import timezone
     
-    about = About.objects.first()
-    experiences = Experience.objects.all().order_by('-start_date')
-    education = Education.objects.all().order_by('order', '-end_year', '-start_year')
-    skills = Skill.objects.all().order_by('category', '-proficiency')
-    certificates = Certificate.objects.order_by('-issue_date')[:4]
+    content = published()
+    experiences = order_by(content.experiences, '-start_date')
+    education = order_by(content.education, 'order', '-end_year', '-start_year')
+    skills = order_by(content.skills, 'category', '-proficiency')
+    certificates = order_by(content.certificates, '-issue_date')[:4]
     
     # Show featured projects first, then fill with recent projects if not enough featured
-    featured_projects = Project.objects.filter(featured=True).order_by('-date_completed')[:6]
-    
-    if featured_projects.count() < 6:
-        # If not enough featured projects, add recent projects to fill
-        remaining_needed = 6 - featured_projects.count()
-        recent_projects = Project.objects.exclude(featured=True).order_by('-date_completed')[:remaining_needed]
-        projects = list(featured_projects) + list(recent_projects)
-    else:
-        projects = featured_projects
+    projects = content.preview_projects(6)
 
     context = get_base_context(request)
     context.update({
@@ -93,11 +158,12 @@ def about_page(request):
     return render(request, 'portfolio/about.html', context)
 
 
+@counts_views
 def skills_page(request):
     """
     Skills page view - displays all skills with category filtering
     """
-    skills = Skill.objects.all().order_by('category', '-proficiency')
+    skills = order_by(published().skills, 'category', '-proficiency')
 
     context = get_base_context(request)
     context.update({
@@ -107,6 +173,7 @@ def skills_page(request):
     return render(request, 'portfolio/skills.html', context)
 
 
+@counts_views
 def projects_page(request):
     """
     Projects page view - displays all projects with filtering and sorting
@@ -116,16 +183,15 @@ def projects_page(request):
     sort_param = request.GET.get('sort', 'recent')
 
     # Apply filter
+    projects = published().projects
     if filter_param == 'featured':
-        projects = Project.objects.filter(featured=True)
-    else:
-        projects = Project.objects.all()
+        projects = [project for project in projects if project.featured]
 
     # Apply sorting
     if sort_param == 'alphabetical':
-        projects = projects.order_by('title')
+        projects = order_by(projects, 'title')
     else:  # default to recent
-        projects = projects.order_by('-date_completed')
+        projects = order_by(projects, '-date_completed')
 
     context = get_base_context(request)
     context.update({
@@ -137,16 +203,18 @@ def projects_page(request):
     return render(request, 'portfolio/projects.html', context)
 
 
+@counts_views
 def project_detail(request, pk):
     """
     Project detail page view - displays detailed information about a specific project
     """
-    project = get_object_or_404(Project, pk=pk)
+    content = published()
+    project = content.get('portfolio.Project', pk)
+    if project is None:
+        raise Http404('No published project with this id')
     
-    # Get related projects (same category, different project)
-    related_projects = Project.objects.filter(
-        category=project.category
-    ).exclude(pk=pk)[:3]
+    # Most similar projects, ranked ahead of time by similarity.py
+    related_projects = content.related_projects(pk)
 
     context = get_base_context(request)
     context.update({
@@ -157,19 +225,15 @@ def project_detail(request, pk):
     return render(request, 'portfolio/project_detail.html', context)
 
 
-def certificates_page(request):
+def certificate_stats(certificates):
     """
-    Certificates page view - displays all certifications with sorting
+    Count (active, expiring within 30 days) certificates; ones without an
+    expiry date are always active
     """
-    certificates = Certificate.objects.all().order_by('-issue_date')
-    
-    # Calculate certificate stats
-    total_certificates = certificates.count()
     active_certificates = 0
     expiring_soon = 0
-    
     today = datetime.now().date()
-    
+
     for cert in certificates:
         if cert.expiry_date:
             if cert.expiry_date >= today:
@@ -177,14 +241,21 @@ def certificates_page(request):
                 days_until = (cert.expiry_date - today).days
                 if days_until <= 30:
                     expiring_soon += 1
-            # Add days_until_expiry attribute for template
-            if cert.expiry_date >= today:
-                cert.days_until_expiry = (cert.expiry_date - today).days
-            else:
-                cert.days_until_expiry = 0
-                cert.is_expired = True
         else:
             active_certificates += 1
+    return active_certificates, expiring_soon
+
+
+@counts_views
+def certificates_page(request):
+    """
+    Certificates page view - displays all certifications with sorting
+    """
+    certificates = order_by(published().certificates, '-issue_date')
+    
+    # Calculate certificate stats
+    total_certificates = len(certificates)
+    active_certificates, expiring_soon = certificate_stats(certificates)
 
     context = get_base_context(request)
     context.update({
@@ -197,102 +268,74 @@ def certificates_page(request):
     return render(request, 'portfolio/certificates.html', context)
 
 
+# Label and destination page for each kind of search hit
+SEARCH_RESULT_TYPES = {
+    'project': ('Project', lambda pk: reverse('project_detail', args=[pk])),
+    'certificate': ('Certificate', lambda pk: reverse('certificates')),
+    'skill': ('Skill', lambda pk: reverse('about')),
+    'experience': ('Experience', lambda pk: reverse('about')),
+}
+
+
+def published_results(results, content):
+    """
+    Drop search hits for rows ``content`` no longer publishes (the replica's
+    index can be a version behind) and title and label the rest from it
+    """
+    shown = []
+    for result in results:
+        _, model_label, title_field, _ = search.SEARCH_DOCUMENTS[result['kind']]
+        obj = content.get(model_label, result['object_id'])
+        if obj is None:
+            continue
+        label, url_for = SEARCH_RESULT_TYPES[result['kind']]
+        result['title'] = getattr(obj, title_field) or ''
+        result['label'] = label
+        result['url'] = url_for(result['object_id'])
+        shown.append(result)
+    return shown
+
+
+@counts_views
+@reads_from_replica
+def search_page(request):
+    """
+    Search page view - full-text search over projects, certificates, skills and experience
+    """
+    query = request.GET.get('q', '').strip()[:200]
+    results = published_results(search.search(query, limit=30), published()) if query else []
+
+    context = get_base_context(request)
+    context.update({
+        'query': query,
+        'results': results,
+    })
+
+    return render(request, 'portfolio/search.html', context)
+
+
 @require_http_methods(["GET", "POST"])
+@counts_views
 def contact_page(request):
     """
     Contact page view - displays contact form and handles form submission
     """
     if request.method == 'POST':
-        name = request.POST.get('name', '').strip()
-        email = request.POST.get('email', '').strip()
-        phone = request.POST.get('phone', '').strip()
-        subject = request.POST.get('subject', '').strip()
-        message_text = request.POST.get('message', '').strip()
-
-        # Debug: Print received values
-        print(f"DEBUG Contact Form - POST data received:")
-        print(f"  name: '{name}'")
-        print(f"  email: '{email}'")
-        print(f"  subject: '{subject}'")
-        print(f"  message: '{message_text[:100] if message_text else 'EMPTY'}...'")
-        print(f"  All POST keys: {list(request.POST.keys())}")
-
-        # Validate required fields
-        missing_fields = []
-        if not name:
-            missing_fields.append('name')
-        if not email:
-            missing_fields.append('email')
-        if not subject:
-            missing_fields.append('subject')
-        if not message_text:
-            missing_fields.append('message')
-        
-        if missing_fields:
-            print(f"  VALIDATION FAILED - Missing fields: {missing_fields}")
-            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return render(request, 'portfolio/contact.html', 
-                            get_base_context(request), status=400)
-            messages.error(request, 'Please fill in all required fields.')
-            return redirect('contact')
-
-        # Validate email format
-        if '@' not in email or '.' not in email:
-            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return render(request, 'portfolio/contact.html', 
-                            get_base_context(request), status=400)
-            messages.error(request, 'Please enter a valid email address.')
-            return redirect('contact')
-
-        # Create ContactMessage object
-        try:
-            ContactMessage.objects.create(
-                name=name,
-                email=email,
-                phone=phone,
-                subject=subject,
-                message=message_text
-            )
-            
-            # Send email notification
-            try:
-                email_subject = f"New Contact Form Message: {subject}"
-                email_body = f"""
-You have received a new message from your portfolio contact form:
+        form = ContactForm(request.POST)
+        if not form.is_valid():
+            return contact_response(request, form.notice(), form=form)
 
-Name: {name}
-Email: {email}
-Phone: {phone if phone else 'Not provided'}
-Subject: {subject}
-
-Message:
-{message_text}
+        try:
+            message = form.save()
+        except Exception:
+            return contact_response(request, 'failed')
 
----
-This is an automated email. Do not reply to this address.
-"""
-                send_mail(
-                    subject=email_subject,
-                    message=email_body,
-                    from_email=settings.DEFAULT_FROM_EMAIL,
-                    recipient_list=[settings.CONTACT_EMAIL],
-                    fail_silently=True,  # Don't fail if email can't be sent
-                )
-            except Exception as e:
-                print(f"Error sending email: {e}")
-                # Continue anyway - message is saved in database
-            
-            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return render(request, 'portfolio/contact.html', 
-                            get_base_context(request))
-            messages.success(request, 'Thank you for your message! I will get back to you soon.')
-            return redirect('contact')
-        except Exception as e:
-            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return render(request, 'portfolio/contact.html', 
-                            get_base_context(request), status=500)
-            messages.error(request, 'There was an error sending your message. Please try again.')
-            return redirect('contact')
+        # Message is saved in the database even if the email can't be sent
+        send_contact_email(message)
+        return contact_response(request, 'sent', message=message)
 
     context = get_base_context(request)
+    notice = CONTACT_NOTICES.get(request.GET.get('notice'))
+    if notice:
+        context['notice'] = {'tags': notice[0], 'text': notice[1]}
     return render(request, 'portfolio/contact.html', context)
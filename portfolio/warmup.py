@@ -0,0 +1,118 @@
+"""
+Start-up warmup for WSGI/ASGI workers.
+
+``warm_up()`` runs once per worker process, right after the application is
+created and before it takes traffic. It compiles every portfolio template
+into the cached loader, then requests each page in WARMUP_URLS through the
+full middleware stack. That fills the per-process caches the first visitor
+would otherwise pay for: templates, critical CSS, the static manifest, the
+published content, the API bundle and the compressed page bodies.
+"""
+import asyncio
+import io
+import logging
+import threading
+import time
+from pathlib import Path
+from wsgiref.util import setup_testing_defaults
+
+from django.apps import apps
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.db import connections
+from django.template import engines
+from django.urls import reverse
+
+from .pageviews import not_counted
+
+
+logger = logging.getLogger(__name__)
+
+
+def warm_up():
+    """Warm this process up; never raises, so a failure can't stop the worker"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        # Some ASGI servers import the application inside their event loop,
+        # where database access isn't allowed. Warm up from a thread instead;
+        # blocking the loop is fine, it has no traffic yet.
+        thread = threading.Thread(target=warm_up)
+        thread.start()
+        thread.join()
+        return
+
+    started = time.perf_counter()
+    try:
+        templates = preload_templates()
+        with not_counted():
+            pages = prerender_pages(getattr(settings, 'WARMUP_URLS', []))
+    except Exception:
+        logger.exception('Warmup failed')
+        return
+    finally:
+        # Don't hand connections opened here to forked workers
+        connections.close_all()
+    logger.info(
+        'Warmed up %d template(s) and %d page(s) in %.0f ms',
+        templates, pages, (time.perf_counter() - started) * 1000,
+    )
+
+
+def preload_templates():
+    """Compile every template shipped with the portfolio app"""
+    engine = engines['django']
+    template_dir = Path(apps.get_app_config('portfolio').path) / 'templates'
+    names = [path.relative_to(template_dir).as_posix() for path in template_dir.rglob('*.html')]
+    for name in names:
+        engine.get_template(name)
+    return len(names)
+
+
+def prerender_pages(url_names):
+    """Request each named URL through a WSGI handler; returns the number rendered"""
+    handler = WSGIHandler()
+    host = warmup_host()
+    rendered = 0
+    for name in url_names:
+        path = reverse(name)
+        status = wsgi_get(handler, path, host)
+        if status.startswith('200'):
+            rendered += 1
+        else:
+            logger.warning('Warmup request for %s returned %s', path, status)
+    return rendered
+
+
+def wsgi_get(handler, path, host):
+    """GET ``path`` from a WSGI handler like a browser would; returns the status line"""
+    path, _, query = path.partition('?')
+    status = []
+    environ = {
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+        'HTTP_HOST': host,
+        'SERVER_NAME': host,
+        'HTTP_ACCEPT_ENCODING': 'br, gzip',
+        'wsgi.input': io.BytesIO(),
+    }
+    setup_testing_defaults(environ)
+    response = handler(environ, lambda s, headers, exc_info=None: status.append(s))
+    try:
+        for _ in response:
+            pass
+    finally:
+        response.close()
+    return status[0] if status else 'nothing'
+
+
+def warmup_host():
+    """A host name the site accepts, for the warmup requests' Host header"""
+    for host in settings.ALLOWED_HOSTS:
+        host = host.lstrip('.')
+        if host and host != '*':
+            return host
+    return 'localhost'
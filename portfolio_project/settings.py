@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -31,23 +32,30 @@ ALLOWED_HOSTS = []
 # Application definition
 
 INSTALLED_APPS = [
-    'django.contrib.admin',
+    # django.contrib.admin with an admin site that keeps staff to their own tenant
+    'portfolio.apps.PortfolioAdminConfig',
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.sitemaps',
     'portfolio',
 ]
 
+# The Django middleware below are subclasses from portfolio.middleware that
+# run their hooks on the event loop under ASGI instead of in a worker thread.
 MIDDLEWARE = [
-    'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
-    'django.middleware.common.CommonMiddleware',
-    'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
-    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'portfolio.middleware.SecurityMiddleware',
+    'portfolio.middleware.StaticFilesMiddleware',
+    'portfolio.middleware.TenantMiddleware',
+    'portfolio.middleware.CompressionMiddleware',
+    'portfolio.middleware.PublicSessionMiddleware',
+    'portfolio.middleware.CommonMiddleware',
+    'portfolio.middleware.CsrfViewMiddleware',
+    'portfolio.middleware.AuthenticationMiddleware',
+    'portfolio.middleware.MessageMiddleware',
+    'portfolio.middleware.XFrameOptionsMiddleware',
 ]
 
 ROOT_URLCONF = 'portfolio_project.urls'
@@ -67,19 +75,71 @@ TEMPLATES = [
     },
 ]
 
+# Flash messages live in a signed cookie so reading them never touches the
+# session; anonymous public pages stay session-free and cacheable.
+MESSAGE_STORAGE = 'django.contrib.messages.storage.cookie.CookieStorage'
+
 WSGI_APPLICATION = 'portfolio_project.wsgi.application'
 
+# Serve the public pages from portfolio/async_views.py instead of views.py.
+# asgi.py turns this on, so ASGI servers get async views end to end while
+# WSGI workers keep the synchronous ones.
+ASYNC_VIEWS = os.environ.get('PORTFOLIO_ASYNC_VIEWS') == '1'
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Applied to every new SQLite connection. WAL lets public reads carry on while
+# the contact form or admin holds the write lock, and busy_timeout makes a
+# second writer wait for that lock instead of failing with "database is
+# locked". synchronous=NORMAL is durable under WAL except for the last commits
+# before a power cut. Negative cache_size is in KiB.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,
+    'mmap_size': 128 * 1024 * 1024,
+    'cache_size': -20000,
+    'temp_store': 'MEMORY',
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
-    }
+        # Reuse connections across requests so the pragmas and page cache stick
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'init_command': ';'.join(f'PRAGMA {name}={value}' for name, value in SQLITE_PRAGMAS.items()),
+            # Take the write lock when a transaction starts. A deferred
+            # transaction that upgrades from read to write can fail at once
+            # with "database is locked" without honouring busy_timeout.
+            'transaction_mode': 'IMMEDIATE',
+        },
+    },
+    # Read-only copy of the primary that public pages read from, refreshed
+    # with `manage.py refresh_replica` (see portfolio/replica.py). Until the
+    # first refresh creates it, public pages read from the primary.
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db.replica.sqlite3',
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            # Refreshes replace the file, which stays in rollback-journal mode
+            'init_command': ';'.join(
+                [f'PRAGMA {name}={value}' for name, value in SQLITE_PRAGMAS.items() if name != 'journal_mode']
+                + ['PRAGMA query_only=ON']
+            ),
+        },
+        'TEST': {'MIRROR': 'default'},
+    },
 }
 
+DATABASE_ROUTERS = ['portfolio.replica.ReplicaRouter']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -119,6 +179,86 @@ STATIC_URL = 'static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
+# collectstatic writes content-hashed copies (base.3f2a9c.css) plus a manifest,
+# so {% static %} URLs change whenever a file does and can be cached forever.
+# Text assets also get precompressed .gz/.br siblings (Brotli if installed),
+# which StaticFilesMiddleware serves with immutable cache headers.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'portfolio.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+
+# Compressed pages, API payloads, feeds and the résumé are cached in two tiers
+# (portfolio/cache_backends.py): each worker keeps its most used entries in
+# memory, bounded by MAX_ENTRIES and MAX_BYTES and trusted for LOCAL_TIMEOUT
+# seconds, in front of a file-based cache every worker shares, so a new worker
+# starts warm. With several servers, point 'shared' at Redis or Memcached.
+CACHES = {
+    'default': {
+        'BACKEND': 'portfolio.cache_backends.TwoTierCache',
+        'LOCATION': 'portfolio',
+        'OPTIONS': {
+            'SHARED': 'shared',
+            'MAX_ENTRIES': 1000,
+            'MAX_BYTES': 32 * 1024 * 1024,
+            'LOCAL_TIMEOUT': 60,
+        },
+    },
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache',
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
+}
+
+# Per-page above-the-fold CSS generated by `manage.py build_critical_css`
+CRITICAL_CSS_DIR = BASE_DIR / 'portfolio' / 'critical_css'
+# Largest critical CSS `build_critical_css` will write for a page, in bytes
+# (about 4 KB compressed). It is inlined ahead of the content of every
+# response, and together they should arrive in the first round trip of a new
+# connection, about 14 KB.
+CRITICAL_CSS_BUDGET = 16 * 1024
+
+# Pages requested once when a WSGI/ASGI worker starts (portfolio/warmup.py), so
+# their templates and caches are ready before the first visitor. Set to [] to
+# only compile templates.
+WARMUP_URLS = ['home', 'about', 'projects', 'certificates', 'contact', 'api_bundle']
+
+# Page views are counted in memory and written to PageViewCounter by a
+# background thread this often (seconds); see portfolio/pageviews.py. A worker
+# that crashes loses at most this much of its count.
+PAGE_VIEW_FLUSH_INTERVAL = 10
+
+# Each worker keeps the latest published content in memory and checks the
+# database for a newer version this often (seconds); see portfolio/publishing.py.
+# The worker that publishes switches immediately.
+PUBLISHED_CHECK_INTERVAL = 5
+
+# One deployment serves many portfolios, each on its own domain (Tenant in the
+# admin; see portfolio/tenancy.py). Hosts no tenant claims are served by the
+# tenant with this slug, which keeps a single-portfolio site working as before;
+# set it to None to answer them with a 404 instead.
+TENANT_FALLBACK = 'default'
+
+# Per worker, at most this many host lookups and this many tenants' published
+# content are kept in memory, dropping the least recently requested first, so
+# memory follows the tenants that get traffic rather than how many exist.
+TENANT_CACHE_SIZE = 1000
+PUBLISHED_CACHE_SIZE = 100
+
+# Self-hosted web fonts. Put the source font files in FONT_SOURCE_DIR and run
+# `manage.py subset_fonts` to write subsetted WOFF2 files to static/fonts/
+# plus static/css/fonts.css. Until then pages fall back to Google Fonts.
+FONT_SOURCE_DIR = BASE_DIR / 'fonts'
+WEB_FONTS = [
+    {'family': 'JetBrains Mono', 'file': 'JetBrainsMono[wght].ttf', 'weight': '400 700'},
+    {'family': 'Syne', 'file': 'Syne[wght].ttf', 'weight': '400 800'},
+]
+
 # Media files (User uploads)
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_project.settings')
 
 application = get_wsgi_application()
+
+# Fill template and page caches before the first visitor arrives
+from portfolio.warmup import warm_up  # noqa: E402
+
+warm_up()